@@ -3,11 +3,32 @@
 import os
 import subprocess
 import time
+import warnings
 from pathlib import Path
 from typing import Generator, Callable
 
 import pytest
 import requests
+from pytest_bdd.scenario import scenario_wrapper_template_registry
+
+from helpers.access_log import LatencyComparison
+from helpers.baseline import BaselineStore, environment, git_revision
+from helpers.cassette import Cassette, CassetteAdapter
+from helpers.container_stats import ContainerStats
+from helpers.contract import CompiledContract, ContractSampler
+from helpers.dashboard import Dashboard
+from helpers.docker_events import ContainerStateWatcher, compose_services
+from helpers.health_telemetry import HealthTelemetryCollector
+from helpers.http_timing import UNSCOPED, InstrumentedSession, timing_rows
+from helpers.log_follower import LogFollower
+from helpers.report import REPORT, PerformanceReport
+from helpers.selection import INPUTS_TAG_PREFIX, ScenarioSelector, changed_files
+from helpers.standin_server import FaultConfig, StandinServer
+from helpers.tracing import SlowestRequests
+from helpers.volume_snapshot import VolumeSnapshot
+
+# Per-step wall time recording and @step-budget-<seconds> enforcement
+pytest_plugins = ["helpers.step_timing"]
 
 # Environment variable to control whether to fail or skip when services aren't available
 REQUIRE_SERVICES = os.environ.get("BDD_REQUIRE_SERVICES", "false").lower() == "true"
@@ -35,6 +56,124 @@ def get_repo_root() -> Path:
 # Repository root path
 REPO_ROOT = get_repo_root()
 
+# Where benchmark scenarios write machine-readable results
+REPORT_DIR = Path(os.environ.get("BDD_REPORT_DIR", Path(__file__).parent / "reports"))
+
+# Harness state kept between runs (build context hashes, snapshots, ...)
+CACHE_DIR = Path(os.environ.get("BDD_CACHE_DIR", Path(__file__).parent / ".cache"))
+
+# Record benchmark metrics per commit for `python -m helpers.baseline compare`
+BASELINE = os.environ.get("BDD_BASELINE", "true").lower() == "true"
+
+# Maximum number of images built concurrently (default: one per CPU)
+BUILD_PARALLELISM = int(os.environ.get("BDD_BUILD_PARALLELISM", "0")) or None
+
+# Load scenario settings
+LOAD_CONCURRENCY = int(os.environ.get("BDD_LOAD_CONCURRENCY", "32"))
+LOAD_DURATION = float(os.environ.get("BDD_LOAD_DURATION", "30"))
+LOAD_PROCESSES = int(os.environ.get("BDD_LOAD_PROCESSES", str(os.cpu_count() or 1)))
+
+# Per-operation benchmark of every operation in the OpenAPI document
+OPENAPI_CONCURRENCY = int(os.environ.get("BDD_OPENAPI_CONCURRENCY", "4"))
+OPENAPI_DURATION = float(os.environ.get("BDD_OPENAPI_DURATION", "5"))
+
+# PostgreSQL query profiling: seeded feedback rows, workload passes, plans captured
+PG_PROFILE_ROWS = int(os.environ.get("BDD_PG_PROFILE_ROWS", "50000"))
+PG_PROFILE_ITERATIONS = int(os.environ.get("BDD_PG_PROFILE_ITERATIONS", "50"))
+PG_EXPLAIN_TOP = int(os.environ.get("BDD_PG_EXPLAIN_TOP", "5"))
+
+# SQLite vs PostgreSQL comparison: seeded rows, run length per phase, writer count
+BACKEND_SEED_ROWS = int(os.environ.get("BDD_BACKEND_SEED_ROWS", "5000"))
+BACKEND_DURATION = float(os.environ.get("BDD_BACKEND_DURATION", "20"))
+BACKEND_WRITE_CONCURRENCY = int(os.environ.get("BDD_BACKEND_WRITE_CONCURRENCY", "64"))
+
+# Postgres outage scenario: steady load, fault length, observation window, SLO
+OUTAGE_CONCURRENCY = int(os.environ.get("BDD_OUTAGE_CONCURRENCY", "8"))
+OUTAGE_BASELINE = float(os.environ.get("BDD_OUTAGE_BASELINE", "10"))
+OUTAGE_DURATION = float(os.environ.get("BDD_OUTAGE_DURATION", "10"))
+OUTAGE_RECOVERY_WINDOW = float(os.environ.get("BDD_OUTAGE_RECOVERY_WINDOW", "45"))
+RECOVERY_SLO = float(os.environ.get("BDD_RECOVERY_SLO", "15"))
+
+# Page weight budgets: transfer size (KB) and request count per crawled page
+PAGE_BUDGETS = {
+    "webui": (
+        float(os.environ.get("BDD_WEBUI_BUDGET_KB", "1500")),
+        int(os.environ.get("BDD_WEBUI_BUDGET_REQUESTS", "30")),
+    ),
+    "feedback-example": (
+        float(os.environ.get("BDD_EXAMPLE_BUDGET_KB", "1500")),
+        int(os.environ.get("BDD_EXAMPLE_BUDGET_REQUESTS", "50")),
+    ),
+}
+PAGE_CRAWL_CONCURRENCY = int(os.environ.get("BDD_PAGE_CRAWL_CONCURRENCY", "8"))
+
+# Response compression benchmark: seeded rows, requests per variant, page sizes
+COMPRESSION_SEED_ROWS = int(os.environ.get("BDD_COMPRESSION_SEED_ROWS", "300"))
+COMPRESSION_REPEAT = int(os.environ.get("BDD_COMPRESSION_REPEAT", "30"))
+COMPRESSION_PAGE_SIZES = [
+    int(size) for size in os.environ.get("BDD_COMPRESSION_PAGE_SIZES", "10,50,100").split(",")
+]
+
+# Attachment ingestion sweep: screenshot sizes (KB), console log entries, requests per step
+ATTACHMENT_SIZES = {
+    "screenshot": [
+        int(kb) * 1024
+        for kb in os.environ.get("BDD_ATTACHMENT_SCREENSHOT_KB", "1,16,256,1024,5120,20480").split(",")
+    ],
+    "console-log": [
+        int(count) for count in os.environ.get("BDD_ATTACHMENT_LOG_COUNTS", "0,100,1000,5000,10000").split(",")
+    ],
+}
+ATTACHMENT_REPEAT = int(os.environ.get("BDD_ATTACHMENT_REPEAT", "3"))
+
+# Orchestrator probe timeout (Kubernetes timeoutSeconds defaults to 1)
+PROBE_TIMEOUT = float(os.environ.get("BDD_PROBE_TIMEOUT", "1.0"))
+
+# Serve the stack from the in-process stand-in instead of Docker
+STANDIN = os.environ.get("BDD_STANDIN", "false").lower() == "true"
+STANDIN_FAULTS = FaultConfig(
+    latency_ms=float(os.environ.get("BDD_STANDIN_LATENCY_MS", "0")),
+    jitter_ms=float(os.environ.get("BDD_STANDIN_JITTER_MS", "0")),
+    error_rate=float(os.environ.get("BDD_STANDIN_ERROR_RATE", "0")),
+)
+
+# Default read timeout of the shared HTTP client, for steps that pass none
+HTTP_TIMEOUT = float(os.environ.get("BDD_HTTP_TIMEOUT", "10"))
+
+# Record/replay of the shared HTTP client: off, record or replay
+CASSETTE_MODE = os.environ.get("BDD_CASSETTE_MODE", "off").lower()
+CASSETTE_MATCH = os.environ.get("BDD_CASSETTE_MATCH", "url").lower()
+CASSETTE_DIR = Path(os.environ.get("BDD_CASSETTE_DIR", Path(__file__).parent / "cassettes"))
+
+# Share of load-test responses validated against the OpenAPI contract (0 disables)
+CONTRACT_SAMPLE_RATE = float(os.environ.get("BDD_CONTRACT_SAMPLE_RATE", "0.1"))
+
+# Lines of container output kept per service by the log follower
+LOG_BUFFER_LINES = int(os.environ.get("BDD_LOG_BUFFER_LINES", "2000"))
+
+# Slowest requests per load scenario joined against the service logs
+SLOWEST_REQUESTS = int(os.environ.get("BDD_SLOWEST_REQUESTS", "10"))
+
+# Component health telemetry collected in the background of every scenario
+HEALTH_TELEMETRY = os.environ.get("BDD_HEALTH_TELEMETRY", "false").lower() == "true"
+HEALTH_TELEMETRY_INTERVAL = float(os.environ.get("BDD_HEALTH_TELEMETRY_INTERVAL", "1.0"))
+HEALTH_DEGRADED_MS = float(os.environ.get("BDD_HEALTH_DEGRADED_MS", "250"))
+
+# Live terminal dashboard during stack startup and load runs, redraws per second
+DASHBOARD = os.environ.get("BDD_DASHBOARD", "false").lower() == "true"
+DASHBOARD_REFRESH = float(os.environ.get("BDD_DASHBOARD_REFRESH", "2"))
+
+# Data volume snapshot taken after the first healthy startup, restored by isolation tests
+VOLUME_SNAPSHOTS = os.environ.get("BDD_VOLUME_SNAPSHOTS", "true").lower() == "true"
+SNAPSHOT_IMAGE = os.environ.get("BDD_SNAPSHOT_IMAGE", "alpine:3")
+
+# Change-aware selection: run only scenarios affected by the diff against a git base
+CHANGED_ONLY = os.environ.get("BDD_CHANGED_ONLY", "false").lower() == "true"
+CHANGED_BASE = os.environ.get("BDD_CHANGED_BASE", "HEAD")
+
+# Services declared in docker-compose.yml (used by container state predicates)
+COMPOSE_SERVICES = compose_services(REPO_ROOT)
+
 # Custom ports (using high-range ports to avoid conflicts)
 PORTS = {
     "postgres": 18229,
@@ -106,6 +245,52 @@ def skip_if_no_task(task_available: bool):
         pytest.skip("Task is not installed")
 
 
+@pytest.fixture(scope="session")
+def container_watcher(
+    docker_available: bool
+) -> Generator[ContainerStateWatcher | None, None, None]:
+    """
+    Event-driven container state table for the compose project.
+
+    Subscribes once to the Docker events API for the whole session. Yields
+    None when the daemon cannot be reached, so steps can fall back to
+    get_container_status().
+    """
+    if not docker_available:
+        yield None
+        return
+
+    watcher = ContainerStateWatcher()
+    try:
+        watcher.start()
+    except Exception:
+        yield None
+        return
+
+    yield watcher
+
+    watcher.stop()
+
+
+@pytest.fixture
+def server_stats(
+    docker_available: bool,
+    standin_server: StandinServer | None
+) -> ContainerStats | None:
+    """
+    CPU, memory and disk-write readings of the feedback-server container.
+
+    None under the stand-in or when the container cannot be found, so
+    benchmarks report those columns as "-".
+    """
+    if not docker_available or standin_server is not None:
+        return None
+    try:
+        return ContainerStats("feedback-server").connect()
+    except Exception:
+        return None
+
+
 @pytest.fixture
 def run_task(repo_root: Path) -> Callable:
     """Fixture to run task commands."""
@@ -160,12 +345,435 @@ def run_docker_compose(repo_root: Path) -> Callable:
     return _run_compose
 
 
+@pytest.fixture(scope="session")
+def http_client() -> Generator[InstrumentedSession, None, None]:
+    """
+    Keep-alive HTTP client shared by all scenarios.
+
+    Applies a default timeout and retries connection failures. Every request
+    is timed under the label of the current scenario (see ``http_timing``).
+    """
+    session = InstrumentedSession(timeout=(3.05, HTTP_TIMEOUT))
+    yield session
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def http_timing(request: pytest.FixtureRequest, http_client: InstrumentedSession):
+    """Label the shared client's requests and report their timings per scenario."""
+    http_client.scenario = request.node.name
+
+    yield
+
+    timings = http_client.pop_timings(request.node.name)
+    http_client.scenario = UNSCOPED
+    if timings:
+        REPORT.add_table(
+            "HTTP request timings",
+            ["request", "count", "new connections", "avg connect (ms)", "avg TTFB (ms)",
+             "avg total (ms)", "slowest (ms)"],
+            timing_rows(timings),
+            scenario=request.node.name,
+        )
+
+
+def _module_stem(request: pytest.FixtureRequest) -> str:
+    return request.module.__name__.rsplit(".", 1)[-1]
+
+
+# Outcome of a test's call phase, for fixtures that act on it at teardown
+CALL_OUTCOME = pytest.StashKey[str]()
+
+
+@pytest.fixture(autouse=True)
+def http_cassette(request: pytest.FixtureRequest, http_client: InstrumentedSession):
+    """
+    Record or replay the shared client's traffic for this scenario.
+
+    BDD_CASSETTE_MODE=record stores every interaction under
+    ``cassettes/<module>/<scenario>.json``; replay serves them with no network
+    and skips scenarios that have no cassette. Scenarios that ran without any
+    HTTP traffic get an empty cassette, so "no cassette" means "not recorded".
+    """
+    if CASSETTE_MODE == "off":
+        yield None
+        return
+    if CASSETTE_MODE not in ("record", "replay"):
+        pytest.fail(f"BDD_CASSETTE_MODE must be off, record or replay, not '{CASSETTE_MODE}'")
+
+    try:
+        cassette = Cassette(CASSETTE_DIR, f"{_module_stem(request)}/{request.node.name}", CASSETTE_MATCH)
+    except ValueError as e:
+        pytest.fail(f"BDD_CASSETTE_MATCH: {e}")
+    if CASSETTE_MODE == "replay":
+        if not cassette.exists():
+            pytest.skip(f"No cassette recorded at {cassette.path}")
+        cassette.load()
+
+    upstream = http_client.get_adapter("http://")
+    http_client.mount("http://", CassetteAdapter(cassette, CASSETTE_MODE, upstream))
+
+    yield cassette
+
+    http_client.mount("http://", upstream)
+    ran = request.node.stash.get(CALL_OUTCOME, "skipped") != "skipped"
+    if CASSETTE_MODE == "record" and (cassette.interactions or ran):
+        cassette.save()
+
+
+@pytest.fixture(scope="session")
+def perf_report() -> PerformanceReport:
+    """Session-wide performance report printed in the terminal summary."""
+    return REPORT
+
+
+@pytest.fixture(scope="session")
+def openapi_contract() -> CompiledContract | None:
+    """
+    Response validators compiled once from the live OpenAPI document.
+
+    Returns None when the document cannot be fetched (e.g. services down).
+    """
+    url = f"{SERVICE_URLS['feedback-server']}/api/docs/openapi.json"
+    try:
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        return CompiledContract(response.json())
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+
+@pytest.fixture
+def contract_sampler(
+    request: pytest.FixtureRequest,
+    openapi_contract: CompiledContract | None
+) -> Generator[ContractSampler | None, None, None]:
+    """
+    Validate a sample of load-test responses against the OpenAPI contract.
+
+    Pass as ``on_response`` to ``LoadGenerator``. Violations are added to the
+    performance report next to the scenario's latency tables.
+    """
+    if openapi_contract is None or CONTRACT_SAMPLE_RATE <= 0:
+        yield None
+        return
+
+    sampler = ContractSampler(openapi_contract, sample_rate=CONTRACT_SAMPLE_RATE)
+
+    yield sampler
+
+    if sampler.checked:
+        REPORT.add_table(
+            f"Response contract checks ({CONTRACT_SAMPLE_RATE:.0%} sampled)",
+            ["operation", "checked", "violations", "examples"],
+            sampler.report_rows(),
+            scenario=request.node.name,
+        )
+
+
+@pytest.fixture
+def slowest_requests(
+    request: pytest.FixtureRequest,
+    log_follower: LogFollower | None
+) -> Generator[SlowestRequests | None, None, None]:
+    """
+    Keep the slowest load-test requests and attribute them to service logs.
+
+    Pass as ``on_response`` to ``LoadGenerator``. After the scenario each
+    kept request is joined to log lines by request id, or by method, path
+    and time window, and listed in the performance report.
+    """
+    if SLOWEST_REQUESTS <= 0:
+        yield None
+        return
+
+    slowest = SlowestRequests(SLOWEST_REQUESTS)
+
+    yield slowest
+
+    if not slowest:
+        return
+    if log_follower is not None:
+        slowest.join(log_follower)
+    REPORT.add_table(
+        f"Slowest {SLOWEST_REQUESTS} requests",
+        ["#", "request", "status", "client (ms)", "server (ms)", "request id", "joined by", "log lines"],
+        slowest.report_rows(),
+        scenario=request.node.name,
+    )
+
+
 @pytest.fixture
-def http_client() -> requests.Session:
-    """HTTP client for API testing."""
-    session = requests.Session()
-    session.timeout = 10
-    return session
+def server_latency(
+    request: pytest.FixtureRequest,
+    log_follower: LogFollower | None
+) -> Generator[LatencyComparison | None, None, None]:
+    """
+    Server-side durations from the feedback-server access log, per route.
+
+    Pass as ``on_response`` to ``LoadGenerator`` to record the client-side
+    latencies of the same routes. Both are reported side by side, with the
+    overhead between them. Yields None without a log follower.
+    """
+    if log_follower is None:
+        yield None
+        return
+
+    comparison = LatencyComparison()
+    log_follower.listeners.append(comparison.feed_log)
+
+    yield comparison
+
+    log_follower.listeners.remove(comparison.feed_log)
+    if comparison:
+        REPORT.add_table(
+            "Server vs client latency",
+            ["route", "server count", "client count", "server p50 (ms)", "client p50 (ms)",
+             "server p99 (ms)", "client p99 (ms)", "overhead p50 (ms)", "overhead p99 (ms)"],
+            comparison.report_rows(),
+            scenario=request.node.name,
+        )
+
+
+@pytest.fixture(autouse=True)
+def health_telemetry(
+    request: pytest.FixtureRequest
+) -> Generator[HealthTelemetryCollector | None, None, None]:
+    """
+    Poll /api/v1/health/detailed in the background of a scenario.
+
+    Enabled with BDD_HEALTH_TELEMETRY=true. Component responseTime p99 and
+    degraded periods are added to the performance report when the endpoint
+    answered at least once. Polls before that first answer (the stack still
+    coming up in ``services are running``) are not recorded.
+    """
+    if not HEALTH_TELEMETRY:
+        yield None
+        return
+
+    collector = HealthTelemetryCollector(
+        f"{SERVICE_URLS['feedback-server']}/api/v1/health/detailed",
+        interval=HEALTH_TELEMETRY_INTERVAL,
+        degraded_ms=HEALTH_DEGRADED_MS,
+    )
+    collector.start()
+
+    yield collector
+
+    collector.stop()
+    if collector.has_samples():
+        REPORT.add_table(
+            "Component health telemetry",
+            ["component", "samples", "missing", "p50 (ms)", "p99 (ms)", "max (ms)",
+             "degraded periods", "degraded (s)"],
+            collector.report_rows(),
+            scenario=request.node.name,
+        )
+
+
+# Log follower and start time of the running scenario, for failure excerpts
+LOG_WINDOW = pytest.StashKey[tuple[LogFollower, float]]()
+
+
+@pytest.fixture(scope="session")
+def log_follower(
+    docker_available: bool,
+    standin_server: StandinServer | None
+) -> Generator[LogFollower | None, None, None]:
+    """
+    Bounded, indexed log buffers of every service, kept for the session.
+
+    Follows the compose containers' log streams, or the stand-in's request
+    log with BDD_STANDIN=true. Yields None when neither is available.
+    """
+    follower = LogFollower(buffer_lines=LOG_BUFFER_LINES)
+
+    if standin_server is not None:
+        def listener(line: str) -> None:
+            follower.feed("feedback-server", line)
+
+        standin_server.api.log_listeners.append(listener)
+        yield follower
+        standin_server.api.log_listeners.remove(listener)
+        return
+
+    if not docker_available:
+        yield None
+        return
+    try:
+        follower.start()
+    except Exception:
+        yield None
+        return
+
+    yield follower
+
+    follower.stop()
+
+
+@pytest.fixture(autouse=True)
+def service_logs(
+    request: pytest.FixtureRequest,
+    log_follower: LogFollower | None
+) -> Generator[LogFollower | None, None, None]:
+    """
+    Correlate service log errors with the running scenario.
+
+    Errors and warnings logged while the scenario ran are counted in the
+    performance report, and attached as an excerpt when it fails.
+    """
+    if log_follower is None:
+        yield None
+        return
+
+    since = time.time()
+    request.node.stash[LOG_WINDOW] = (log_follower, since)
+
+    yield log_follower
+
+    rows = log_follower.report_rows(since)
+    if rows:
+        REPORT.add_table(
+            "Service log errors",
+            ["service", "errors", "warnings", "first error"],
+            rows,
+            scenario=request.node.name,
+        )
+
+
+# =============================================================================
+# CHANGE-AWARE SELECTION
+# =============================================================================
+
+SELECTOR = pytest.StashKey[ScenarioSelector]()
+SCENARIO_INPUTS = pytest.StashKey[tuple[set[str], list[str]]]()
+
+
+def pytest_bdd_apply_tag(tag: str, function):
+    """Keep input tags out of pytest markers (they would trip --strict-markers)."""
+    if tag.startswith(INPUTS_TAG_PREFIX):
+        return function
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    """With BDD_CHANGED_ONLY=true, deselect unaffected scenarios and skip memoized ones."""
+    if not CHANGED_ONLY:
+        return
+    try:
+        selector = ScenarioSelector(REPO_ROOT, CACHE_DIR / "selection.json")
+        changed = changed_files(REPO_ROOT, CHANGED_BASE)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        warnings.warn(f"BDD_CHANGED_ONLY ignored, running every scenario: {e}")
+        REPORT.add_table(
+            "Change-aware selection disabled, every scenario ran", ["reason"], [[str(e)]],
+        )
+        return
+    config.stash[SELECTOR] = selector
+
+    selected, deselected = [], []
+    counts: dict[str, list[int]] = {}
+    for item in items:
+        template = scenario_wrapper_template_registry.get(getattr(item, "obj", None))
+        if template is None:
+            selected.append(item)
+            continue
+        tags = set(template.tags) | set(template.feature.tags)
+        own_files = [
+            Path(path).resolve().relative_to(REPO_ROOT).as_posix()
+            for path in (item.path, template.feature.filename)
+        ]
+        item.stash[SCENARIO_INPUTS] = (tags, own_files)
+        row = counts.setdefault(template.feature.name, [0, 0, 0])
+
+        if selector.memoized(item.nodeid, tags, own_files):
+            item.add_marker(pytest.mark.skip(reason="Inputs unchanged since the last pass"))
+            selected.append(item)
+            row[1] += 1
+        elif selector.affected(tags, own_files, changed):
+            selected.append(item)
+            row[0] += 1
+        else:
+            deselected.append(item)
+            row[2] += 1
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    REPORT.add_table(
+        f"Change-aware selection ({len(changed)} files changed since {CHANGED_BASE})",
+        ["feature", "run", "memoized", "deselected"],
+        [[feature, *row] for feature, row in sorted(counts.items())],
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    selector = session.config.stash.get(SELECTOR, None)
+    if selector is not None:
+        selector.save()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Record passing static scenarios for memoization, and attach the service
+    log errors of a failing scenario's time window.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        item.stash[CALL_OUTCOME] = report.outcome
+    selector = item.config.stash.get(SELECTOR, None)
+    if selector is not None and report.when == "call" and report.passed:
+        inputs = item.stash.get(SCENARIO_INPUTS, None)
+        if inputs is not None:
+            selector.record_pass(item.nodeid, *inputs)
+    if report.when == "teardown" or not report.failed:
+        return
+    window = item.stash.get(LOG_WINDOW, None)
+    if window is None:
+        return
+    follower, since = window
+    excerpt = follower.excerpt(since)
+    if excerpt:
+        report.sections.append(("Service log excerpt", excerpt))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print benchmark results and write them to the report directory."""
+    step_timings = config.pluginmanager.get_plugin("helpers.step_timing").STEP_TIMINGS
+    if step_timings:
+        history = step_timings.merge_into(REPORT_DIR / "step-timings.json")
+        REPORT.add_table(
+            "Slowest steps",
+            ["feature", "scenario", "step", "this run (s)", "mean (s)", "max (s)", "runs", "status"],
+            step_timings.report_rows(history),
+        )
+    if not REPORT:
+        return
+    terminalreporter.section("performance report")
+    terminalreporter.write_line(REPORT.render())
+    REPORT.write_json(REPORT_DIR / "performance.json")
+    if BASELINE and REPORT.metrics:
+        terminalreporter.write_line(record_baseline())
+
+
+def record_baseline() -> str:
+    """Store this session's metrics under the current commit; returns a status line."""
+    try:
+        sha, dirty = git_revision(REPO_ROOT)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        return f"Baseline not recorded: {e}"
+    env = environment(standin=STANDIN)
+    store = BaselineStore(CACHE_DIR / "baselines.sqlite")
+    try:
+        store.record(sha, dirty, env, REPORT.metrics)
+    finally:
+        store.close()
+    return (
+        f"Baseline: {len(REPORT.metrics)} metrics recorded for {sha[:12]}{' (dirty)' if dirty else ''}; "
+        "compare with `python -m helpers.baseline compare --base <ref>`"
+    )
 
 
 @pytest.fixture
@@ -180,12 +788,14 @@ def health_endpoints() -> dict:
     return HEALTH_ENDPOINTS.copy()
 
 
-def wait_for_services(timeout: int = 120) -> bool:
+def wait_for_services(timeout: int = 120, on_status: Callable[[str, str], None] | None = None) -> bool:
     """
     Wait for all services to become healthy.
 
     Args:
         timeout: Maximum time to wait in seconds
+        on_status: Called with each service and its check result
+            ("healthy", "HTTP <status>" or "unreachable")
 
     Returns:
         True if all services are healthy, False otherwise
@@ -198,11 +808,15 @@ def wait_for_services(timeout: int = 120) -> bool:
         for name, url in HEALTH_ENDPOINTS.items():
             try:
                 response = requests.get(url, timeout=5)
-                if response.status_code not in [200, 304]:
-                    all_healthy = False
-                    break
+                healthy = response.status_code in [200, 304]
+                status = "healthy" if healthy else f"HTTP {response.status_code}"
             except requests.exceptions.RequestException:
-                all_healthy = False
+                healthy, status = False, "unreachable"
+            if on_status is not None:
+                on_status(name, status)
+            all_healthy = all_healthy and healthy
+            # Without a listener the first unhealthy service decides the round
+            if not all_healthy and on_status is None:
                 break
 
         if all_healthy:
@@ -213,11 +827,84 @@ def wait_for_services(timeout: int = 120) -> bool:
     return False
 
 
+@pytest.fixture(scope="session")
+def volume_snapshot(repo_root: Path, docker_available: bool) -> VolumeSnapshot | None:
+    """Baseline snapshot of the compose data volumes (None when disabled)."""
+    if not (VOLUME_SNAPSHOTS and docker_available):
+        return None
+    return VolumeSnapshot(repo_root, CACHE_DIR, image=SNAPSHOT_IMAGE)
+
+
+# Snapshot saves and restores of this session, for the report
+SNAPSHOT_EVENTS: list[list] = []
+
+
+def report_snapshot_event(action: str, snapshot: VolumeSnapshot, seconds: float | None, error: str = "") -> None:
+    """Add a save/restore to the "Volume snapshots" table; failures also warn."""
+    SNAPSHOT_EVENTS.append([action, snapshot.key, seconds, error or "ok"])
+    REPORT.set_table("Volume snapshots", ["action", "snapshot", "seconds", "outcome"], SNAPSHOT_EVENTS)
+    if error:
+        consequence = "services will re-initialize" if action == "restore" else "no reset baseline"
+        warnings.warn(f"Volume snapshot {action} failed ({consequence}): {error}")
+
+
+def restore_volume_snapshot(snapshot: VolumeSnapshot | None) -> bool:
+    """Restore the baseline volumes if a snapshot exists; the stack must be down."""
+    if snapshot is None or not snapshot.exists():
+        return False
+    try:
+        seconds = snapshot.restore()
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        report_snapshot_event("restore", snapshot, None, str(e))
+        return False
+    report_snapshot_event("restore", snapshot, seconds)
+    return True
+
+
+@pytest.fixture(scope="session")
+def dashboard() -> Generator[Dashboard, None, None]:
+    """
+    Live terminal dashboard for stack startup and load runs.
+
+    Enabled with BDD_DASHBOARD=true when there is a controlling terminal;
+    otherwise its views do nothing, so steps use it unconditionally.
+    """
+    board = Dashboard.open(DASHBOARD_REFRESH) if DASHBOARD else Dashboard()
+    yield board
+    board.close()
+
+
+@pytest.fixture(scope="session")
+def standin_server(repo_root: Path) -> Generator[StandinServer | None, None, None]:
+    """
+    In-process stand-in for the stack, bound on the compose ports.
+
+    Enabled with BDD_STANDIN=true; yields None otherwise.
+    """
+    if not STANDIN:
+        yield None
+        return
+
+    try:
+        server = StandinServer(PORTS, faults=STANDIN_FAULTS, repo_root=repo_root).start()
+    except OSError as e:
+        pytest.fail(f"Stand-in server could not bind the service ports: {e}")
+
+    yield server
+
+    server.stop()
+
+
 @pytest.fixture(scope="module")
 def services_running(
+    request: pytest.FixtureRequest,
     repo_root: Path,
     docker_available: bool,
-    task_available: bool
+    task_available: bool,
+    standin_server: StandinServer | None,
+    log_follower: LogFollower | None,
+    volume_snapshot: VolumeSnapshot | None,
+    dashboard: Dashboard
 ) -> Generator[None, None, None]:
     """
     Start services before tests and stop after.
@@ -225,9 +912,24 @@ def services_running(
     This is a module-scoped fixture that:
     1. Starts all services with 'task up'
     2. Waits for services to be healthy
-    3. Yields control to tests
-    4. Stops services with 'task down'
+    3. Snapshots the data volumes if there is no current snapshot yet
+    4. Yields control to tests
+    5. Stops services with 'task down'
+
+    With BDD_DASHBOARD=true, container and health check states are shown
+    live while the stack starts.
+
+    With BDD_STANDIN=true the in-process stand-in serves the stack instead.
+    With BDD_CASSETTE_MODE=replay, modules with recorded cassettes need no
+    stack at all.
     """
+    if standin_server is not None:
+        yield
+        return
+    if CASSETTE_MODE == "replay" and (CASSETTE_DIR / _module_stem(request)).is_dir():
+        yield
+        return
+
     if not docker_available:
         pytest.skip("Docker is not running")
     if not task_available:
@@ -244,6 +946,11 @@ def services_running(
         pass
 
     if not already_running:
+        started_at = time.time()
+        watcher = request.getfixturevalue("container_watcher") if dashboard.enabled else None
+        startup = dashboard.startup(HEALTH_ENDPOINTS, watcher).start()
+        request.addfinalizer(startup.stop)
+        startup.phase("task up")
         # Start services
         result = subprocess.run(
             ["task", "up"],
@@ -260,19 +967,33 @@ def services_running(
                 pytest.skip(f"Services could not start (set BDD_REQUIRE_SERVICES=true to fail)")
 
         # Wait for services to be healthy
-        if not wait_for_services(timeout=180):
-            # Try to get logs for debugging
-            log_result = subprocess.run(
-                ["docker", "compose", "logs", "--tail=50"],
-                cwd=repo_root,
-                capture_output=True,
-                text=True
-            )
+        startup.phase("waiting for health checks")
+        healthy = wait_for_services(timeout=180, on_status=startup.update)
+        startup.stop()
+        if not healthy:
+            # Errors logged during startup, or the plain tail without a follower
+            logs = log_follower.excerpt(started_at) if log_follower is not None else ""
+            if not logs:
+                logs = subprocess.run(
+                    ["docker", "compose", "logs", "--tail=50"],
+                    cwd=repo_root,
+                    capture_output=True,
+                    text=True
+                ).stdout
             if REQUIRE_SERVICES:
-                pytest.fail(f"Services did not become healthy. Logs:\n{log_result.stdout}")
+                pytest.fail(f"Services did not become healthy. Logs:\n{logs}")
             else:
                 pytest.skip("Services did not become healthy (set BDD_REQUIRE_SERVICES=true to fail)")
 
+        # First healthy startup of this schema: keep it as the reset baseline
+        if volume_snapshot is not None and not volume_snapshot.exists():
+            try:
+                seconds = volume_snapshot.save()
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                report_snapshot_event("save", volume_snapshot, None, str(e))
+            else:
+                report_snapshot_event("save", volume_snapshot, seconds)
+
     yield
 
     # Only stop if we started them
@@ -288,23 +1009,27 @@ def services_running(
 @pytest.fixture
 def fresh_environment(
     repo_root: Path,
-    run_task: Callable
+    run_task: Callable,
+    volume_snapshot: VolumeSnapshot | None
 ) -> Generator[None, None, None]:
     """
     Ensure a fresh environment for tests that need isolation.
 
     This fixture:
     1. Stops any running services
-    2. Yields control to the test
-    3. Cleans up after the test
+    2. Restores the baseline data volumes from the snapshot, if any
+    3. Yields control to the test
+    4. Cleans up after the test and restores the baseline again
     """
     # Stop any running services
     run_task("down", timeout=120)
+    restore_volume_snapshot(volume_snapshot)
 
     yield
 
     # Clean up after test
     run_task("down", timeout=120)
+    restore_volume_snapshot(volume_snapshot)
 
 
 def get_container_status(repo_root: Path) -> dict:
@@ -37,13 +37,13 @@ Feature: Quick Project Evaluation
     Then the response status is 200
     And the response indicates healthy status
 
-  @US-DEV-003 @medium-priority
+  @US-DEV-003 @medium-priority @inputs-taskfile
   Scenario: Task list shows available commands
     When I run "task --list"
     Then the output contains available tasks
     And each task has a description
 
-  @US-DEV-003 @medium-priority
+  @US-DEV-003 @medium-priority @inputs-taskfile
   Scenario: Taskfile exists and is valid
     Given the repository is cloned
     Then Taskfile.yml exists in the repository root
@@ -8,14 +8,14 @@ Feature: Safety Mechanisms
     Given the repository is cloned
     And Docker is installed and running
 
-  @US-DEV-015 @high-priority
+  @US-DEV-015 @high-priority @inputs-taskfile
   Scenario: Taskfile includes reset task
     Given the repository is cloned
     When I examine the Taskfile.yml
     Then a reset or clean task is defined
     And the task is documented
 
-  @US-DEV-015 @high-priority
+  @US-DEV-015 @high-priority @inputs-compose
   Scenario: Volumes are used for data persistence
     When I examine docker-compose.yml
     Then volumes are defined for data persistence
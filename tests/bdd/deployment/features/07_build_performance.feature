@@ -0,0 +1,17 @@
+@build-performance
+Feature: Image Build Performance
+  As a DevOps Engineer
+  I want to know how long image builds take and how well the layer cache works
+  So that CI does not spend its budget rebuilding images
+
+  Background:
+    Given the repository is cloned
+    And Docker is installed and running
+
+  @US-PERF-001 @medium-priority
+  Scenario: Cold and warm builds are benchmarked per service
+    When I benchmark cold and warm builds for each service
+    Then every cold and warm build completes successfully
+    And a build report is produced for every service
+    And warm builds reuse the dependency-install layer
+    And the warm build layer cache hit ratio is at least 50 percent
@@ -0,0 +1,28 @@
+@load-performance
+Feature: Service Performance Under Load
+  As a DevOps Engineer
+  I want to know how the feedback-server behaves under sustained load
+  So that traffic peaks do not cause cascading failures
+
+  Background:
+    Given services are running
+
+  @US-PERF-002 @high-priority
+  Scenario: Health probes stay fast while the server is under load
+    Given a saturating mixed workload is running against the feedback-server
+    When I probe the ready, live and detailed health endpoints during the load
+    Then no health probe timed out
+    And the probe p99 latency stays under the orchestrator probe timeout
+
+  @US-PERF-003 @medium-priority
+  Scenario: Every documented endpoint has a latency profile
+    Given the OpenAPI specification is loaded from the feedback-server
+    When I benchmark every documented operation at a fixed concurrency
+    Then the latency matrix covers every documented operation
+    And no benchmarked operation returned a server error
+
+  @US-PERF-010 @medium-priority
+  Scenario: Server capacity is measured without a client-side bottleneck
+    When I run the mixed workload from one process and from a process pool
+    Then the per-second merges account for every pooled request
+    And the report compares the single-process and process-pool load engines
@@ -0,0 +1,17 @@
+@database-profiling
+Feature: Database Query Profiling
+  As a Developer
+  I want ranked statement statistics for the feedback queries on PostgreSQL
+  So that index changes are argued from evidence
+
+  Background:
+    Given the repository is cloned
+    And Docker is installed and running
+
+  @US-PERF-004 @medium-priority
+  Scenario: List, search and stats queries are profiled on PostgreSQL
+    Given the postgres service is running with statement statistics enabled
+    And a scratch database is migrated and seeded with feedback
+    When I run the list, search and stats query workload
+    Then every workload query appears in the statement statistics
+    And the slowest queries are explained with buffer usage
@@ -0,0 +1,23 @@
+@backend-comparison
+Feature: Database Backend Comparison
+  As a Developer
+  I want the same workload measured on SQLite and on PostgreSQL
+  So that the production database is chosen from throughput and latency numbers
+
+  Background:
+    Given the repository is cloned
+    And Docker is installed and running
+
+  @US-PERF-005 @medium-priority
+  Scenario Outline: The feedback-server workload is benchmarked on <backend>
+    Given the feedback-server is running on the "<backend>" backend
+    And the backend is seeded with feedback
+    When I run the create, list, search, stats and sync workload
+    And I run the write contention workload
+    Then the writes were stored by the "<backend>" backend
+    And the backend comparison report includes "<backend>"
+
+    Examples:
+      | backend  |
+      | sqlite   |
+      | postgres |
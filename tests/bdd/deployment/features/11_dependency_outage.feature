@@ -0,0 +1,23 @@
+@dependency-outage
+Feature: Dependency Outage Recovery
+  As a DevOps Engineer
+  I want to know how the feedback-server behaves when postgres blips
+  So that recovery time is an SLO we can measure
+
+  Background:
+    Given services are running
+    And Docker is installed and running
+
+  @US-PERF-006 @high-priority
+  Scenario Outline: The feedback-server recovers after postgres is <fault>
+    Given a steady workload is running against the feedback-server
+    When postgres is <fault> for the outage duration
+    And the workload runs through the recovery window
+    Then no request outlived the client timeout
+    And the feedback-server reports ready again
+    And throughput returns to baseline within the recovery SLO
+
+    Examples:
+      | fault  |
+      | paused |
+      | killed |
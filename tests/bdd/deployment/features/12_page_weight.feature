@@ -0,0 +1,19 @@
+@page-weight
+Feature: Page Weight
+  As a Frontend Developer
+  I want to know what the webui and feedback-example pages ship to a browser
+  So that widget bloat is caught before it slows down our customers' pages
+
+  Background:
+    Given services are running
+
+  @US-PERF-007 @medium-priority
+  Scenario Outline: The <page> page stays within its weight budget
+    When I crawl the <page> page and its assets
+    Then every referenced asset loads
+    And the page stays within its transfer-size and request-count budget
+
+    Examples:
+      | page             |
+      | webui            |
+      | feedback-example |
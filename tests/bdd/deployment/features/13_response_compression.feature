@@ -0,0 +1,15 @@
+@response-compression
+Feature: Response Compression
+  As a DevOps Engineer
+  I want to know what compression the feedback-server negotiates and what it costs
+  So that edge bandwidth and server CPU are traded off on evidence
+
+  Background:
+    Given services are running
+
+  @US-PERF-008 @medium-priority
+  Scenario: JSON API responses are benchmarked with and without compression
+    Given the feedback-server is seeded for the compression benchmark
+    When I request list, search and sync responses under every Accept-Encoding variant
+    Then every variant decodes to the same payload size
+    And the report recommends an encoding per endpoint and page size
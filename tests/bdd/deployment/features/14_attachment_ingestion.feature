@@ -0,0 +1,20 @@
+@attachment-ingestion
+Feature: Attachment Ingestion
+  As a Frontend Developer
+  I want to know how the feedback-server copes with large screenshots and console logs
+  So that client-side compression and size caps are set on evidence
+
+  Background:
+    Given services are running
+
+  @US-PERF-009 @medium-priority
+  Scenario Outline: Feedback with growing <attachment> attachments is ingested
+    When I submit feedback with <attachment> attachments of increasing size
+    Then the smallest <attachment> submission is accepted
+    And the feedback-server stays healthy after the sweep
+    And the report shows the largest <attachment> size the server accepts
+
+    Examples:
+      | attachment  |
+      | screenshot  |
+      | console-log |
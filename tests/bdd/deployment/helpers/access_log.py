@@ -0,0 +1,122 @@
+"""Server-side request durations from the feedback-server access log.
+
+The feedback-server logs every request through Hono's ``logger()``
+middleware::
+
+    <-- GET /api/v1/feedback/V1StGXR8_Z5jdHi6B-myT
+    --> GET /api/v1/feedback/V1StGXR8_Z5jdHi6B-myT 200 3ms
+
+Completed requests are parsed, their paths normalized to route templates
+(ids become ``:id``) and the durations recorded into per-route histograms.
+Client-side latencies of the same routes are recorded alongside, so the
+report shows the queuing, network and harness overhead between the two.
+
+Hono measures with ``Date.now()``: server durations have a resolution of
+one millisecond, and durations of a second or more are rounded to seconds.
+"""
+
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from helpers.histogram import LogLinearHistogram
+
+# Service whose log carries the access lines
+ACCESS_LOG_SERVICE = "feedback-server"
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+ACCESS_LINE = re.compile(
+    r"^--> (?P<method>[A-Z]+) (?P<path>\S+) (?P<status>\d{3}) (?P<elapsed>[\d,]+)(?P<unit>ms|s)\b"
+)
+
+# Path segments that are ids: numbers, UUIDs and nanoid-style tokens
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[A-Za-z0-9_-]{16,})$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class AccessRecord:
+    """One completed request from the access log."""
+
+    method: str
+    path: str
+    route: str
+    status: int
+    duration: float
+
+
+def normalize_route(path: str) -> str:
+    """Replace id segments of a path with ``:id`` and drop the query string."""
+    path = urlsplit(path).path
+    return "/".join(":id" if ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def parse_access_line(line: str) -> AccessRecord | None:
+    """Parse a Hono ``-->`` line; returns None for any other line."""
+    match = ACCESS_LINE.match(ANSI_ESCAPE.sub("", line).strip())
+    if not match:
+        return None
+    elapsed = int(match["elapsed"].replace(",", ""))
+    duration = elapsed / 1000 if match["unit"] == "ms" else float(elapsed)
+    path = urlsplit(match["path"]).path
+    return AccessRecord(match["method"], path, normalize_route(path), int(match["status"]), duration)
+
+
+class LatencyComparison:
+    """
+    Per-route server-side and client-side latency histograms of a scenario.
+
+    ``feed_log`` has the signature of a ``LogFollower`` listener; calling the
+    instance records a client latency, like a ``LoadGenerator`` hook.
+    """
+
+    def __init__(self):
+        self.server: dict[str, LogLinearHistogram] = defaultdict(LogLinearHistogram)
+        self.client: dict[str, LogLinearHistogram] = defaultdict(LogLinearHistogram)
+        # Log stream and load worker threads record concurrently
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.server)
+
+    def feed_log(self, service: str, line: str) -> None:
+        if service != ACCESS_LOG_SERVICE:
+            return
+        record = parse_access_line(line)
+        if record is not None:
+            with self._lock:
+                self.server[f"{record.method} {record.route}"].record(record.duration)
+
+    def record_client(self, method: str, url: str, seconds: float) -> None:
+        route = f"{method.upper()} {normalize_route(url)}"
+        with self._lock:
+            self.client[route].record(seconds)
+
+    def __call__(self, op, response, latency: float) -> None:
+        self.record_client(op.method, response.url, latency)
+
+    def report_rows(self) -> list[list]:
+        """
+        Rows of route, request counts, server and client p50/p99 and overhead.
+
+        Overhead is client minus server at the same percentile, in ms; None
+        when only one side saw the route.
+        """
+        rows = []
+        for route in sorted(set(self.server) | set(self.client)):
+            server = self.server[route].summary() if route in self.server else None
+            client = self.client[route].summary() if route in self.client else None
+            row = [route, server["count"] if server else 0, client["count"] if client else 0]
+            for q in ("p50", "p99"):
+                row += [server[q] if server else None, client[q] if client else None]
+            row += [
+                client[q] - server[q] if server and client else None
+                for q in ("p50", "p99")
+            ]
+            rows.append(row)
+        return rows
@@ -0,0 +1,184 @@
+"""Attachment ingestion sweep of POST /api/v1/feedback.
+
+Widget submissions carry base64 screenshots, stored inline in the
+``screenshots`` table, and captured console logs, one ``console_logs`` row
+per entry. ``AttachmentSweep`` submits feedback while one attachment grows
+step by step. For each step it records the request latency, the server's
+memory spike, the bytes it wrote to disk and the responses that failed.
+Once every request of a step fails, larger steps are skipped.
+"""
+
+import base64
+import json
+import os
+import time
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import requests
+
+from helpers.container_stats import ContainerStats, MemorySampler
+from helpers.load import feedback_payload
+from helpers.stats import summarize
+
+LOG_LEVELS = ("log", "info", "warn", "error", "debug")
+
+# Length of one captured console message, about what a stack-trace line takes
+LOG_MESSAGE_CHARS = 160
+
+
+def screenshot_payload(project_id: str, size: int) -> dict:
+    """Feedback with one screenshot of ``size`` bytes (random, so incompressible like PNG)."""
+    data = base64.b64encode(os.urandom(size)).decode("ascii")
+    return {
+        **feedback_payload(project_id),
+        "screenshots": [{
+            "mimeType": "image/png",
+            "data": f"data:image/png;base64,{data}",
+            "width": 1920,
+            "height": 1080,
+        }],
+    }
+
+
+def console_log_payload(project_id: str, count: int) -> dict:
+    """Feedback with ``count`` captured console log entries."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+    return {
+        **feedback_payload(project_id),
+        "consoleLogs": [
+            {
+                "level": LOG_LEVELS[i % len(LOG_LEVELS)],
+                "message": f"[{i}] " + "x" * LOG_MESSAGE_CHARS,
+                "timestamp": timestamp,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+# Attachment kinds swept, keyed by the name used in the feature file
+ATTACHMENTS = {
+    "screenshot": screenshot_payload,
+    "console-log": console_log_payload,
+}
+
+
+@dataclass
+class IngestResult:
+    """Submissions of one attachment size (screenshot bytes or log entries)."""
+
+    attachment: str
+    size: int
+    request_bytes: int = 0
+    latency: dict[str, float] = field(default_factory=lambda: summarize([]))
+    statuses: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+    memory_spike: int | None = None
+    write_bytes: int | None = None
+    skipped: bool = False
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def failures(self) -> int:
+        return self.requests - self.statuses["201"]
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and self.failures == 0
+
+    @property
+    def write_throughput(self) -> float | None:
+        """Bytes written to disk per second of submitting."""
+        if self.write_bytes is None or not self.elapsed:
+            return None
+        return self.write_bytes / self.elapsed
+
+    @property
+    def ingest_throughput(self) -> float:
+        """Request bytes accepted per second of submitting."""
+        return self.request_bytes * self.statuses["201"] / self.elapsed if self.elapsed else 0.0
+
+
+class AttachmentSweep:
+    """
+    Submit feedback with growing attachments until the server rejects them.
+
+    Usage:
+        sweep = AttachmentSweep(base_url, stats=ContainerStats("feedback-server").connect())
+        results = sweep.run("screenshot", [1024, 1024 * 1024])
+        largest, first_failure = limits(results)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        stats: ContainerStats | None = None,
+        repeat: int = 3,
+        project_id: str = "bdd-attachments",
+        timeout: float = 120.0
+    ):
+        self.url = base_url.rstrip("/") + "/api/v1/feedback"
+        self.stats = stats
+        self.repeat = repeat
+        self.project_id = project_id
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def run(self, attachment: str, sizes: list[int]) -> list[IngestResult]:
+        results = []
+        exhausted = False
+        for size in sizes:
+            if exhausted:
+                results.append(IngestResult(attachment, size, skipped=True))
+                continue
+            result = self.measure(attachment, size)
+            exhausted = result.failures == result.requests
+            results.append(result)
+        return results
+
+    def measure(self, attachment: str, size: int) -> IngestResult:
+        # Serialized once: the client's own encoding cost is not the server's
+        body = json.dumps(ATTACHMENTS[attachment](self.project_id, size)).encode()
+        result = IngestResult(attachment, size, request_bytes=len(body))
+        latencies = []
+
+        writes_before = self.stats.write_bytes() if self.stats else None
+        sampler = MemorySampler(self.stats) if self.stats else nullcontext()
+        start = time.perf_counter()
+        with sampler:
+            for _ in range(self.repeat):
+                sent = time.perf_counter()
+                try:
+                    response = self.session.post(
+                        self.url, data=body, timeout=self.timeout,
+                        headers={"Content-Type": "application/json"},
+                    )
+                    result.statuses[str(response.status_code)] += 1
+                except requests.exceptions.RequestException as e:
+                    result.statuses[type(e).__name__] += 1
+                latencies.append(time.perf_counter() - sent)
+        result.elapsed = time.perf_counter() - start
+
+        result.latency = summarize(latencies)
+        if self.stats:
+            result.memory_spike = sampler.spike
+            result.write_bytes = self.stats.write_bytes() - writes_before
+        return result
+
+
+def limits(results: list[IngestResult]) -> tuple[IngestResult | None, IngestResult | None]:
+    """The largest size accepted before the first failing one, and that failing size."""
+    largest = None
+    for result in results:
+        if result.skipped:
+            break
+        if not result.ok:
+            return largest, result
+        largest = result
+    return largest, None
@@ -0,0 +1,438 @@
+"""Performance baseline store and regression detection across commits.
+
+Every test session records the metrics benchmark steps added to the report
+into an SQLite file in the harness cache. A run is keyed by the git SHA and
+an environment fingerprint: the platform, the CPU count, stand-in or Docker,
+and the ``BDD_*`` settings that shape the workloads. Only runs with the same
+fingerprint are compared.
+
+``compare`` pools the clean runs of the baseline SHA and the runs of the
+candidate, and tests one against the other. Latency distributions use the
+Mann-Whitney U test on the histogram buckets, where samples in the same
+bucket count as ties. With tens of thousands of requests even a trivial
+shift is significant, so a change is only flagged when it also clears two
+effect-size thresholds: the relative change of the median, and the
+Vargha-Delaney A12 (the probability that a candidate request is slower than
+a baseline one). Scalar figures such as throughput have one value per run.
+With a handful of runs the test cannot reach ``alpha`` even when the two
+sides do not overlap at all (three runs each bottom out at p = 0.08). So a
+scalar is tested only once the run counts can reach p < alpha (six runs
+per side at the default alpha). Before that it is reported as "untested",
+never as "no change".
+A scalar that is constant across the candidate runs and at least two
+baseline runs (a page size, an image size) needs no test: any change beyond
+the threshold is flagged.
+
+Command line (from tests/bdd/deployment)::
+
+    python -m helpers.baseline runs
+    python -m helpers.baseline compare --base origin/main --markdown summary.md
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from helpers.histogram import LogLinearHistogram
+from helpers.report import Metric
+
+DEFAULT_STORE = Path(
+    os.environ.get("BDD_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache")
+) / "baselines.sqlite"
+
+# Settings that change where results go or which scenarios run, not what they measure
+UNFINGERPRINTED = {
+    "BDD_CACHE_DIR", "BDD_REPORT_DIR", "BDD_CASSETTE_DIR", "BDD_CHANGED_ONLY",
+    "BDD_CHANGED_BASE", "BDD_BASELINE", "BDD_DASHBOARD", "BDD_DASHBOARD_REFRESH",
+}
+
+# Default significance level and effect-size thresholds of ``compare``
+ALPHA = 0.01
+MIN_CHANGE = 0.05
+MIN_A12 = 0.56
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_sha ON runs (sha, fingerprint);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    scenario TEXT NOT NULL,
+    name TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    higher_is_better INTEGER NOT NULL,
+    value REAL,
+    histogram TEXT,
+    PRIMARY KEY (run_id, scenario, name)
+);
+"""
+
+
+def git_revision(repo_root: Path, ref: str = "HEAD") -> tuple[str, bool]:
+    """
+    Full SHA of ``ref`` and whether the working tree has uncommitted changes.
+
+    Raises:
+        RuntimeError: If git cannot resolve the ref
+    """
+    resolved = subprocess.run(
+        ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+        cwd=repo_root, capture_output=True, text=True, timeout=30,
+    )
+    if resolved.returncode != 0:
+        raise RuntimeError(f"git rev-parse {ref} failed: {resolved.stderr.strip()}")
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        cwd=repo_root, capture_output=True, text=True, timeout=60,
+    )
+    return resolved.stdout.strip(), bool(status.stdout.strip())
+
+
+def environment(standin: bool) -> dict:
+    """What the numbers depend on besides the code."""
+    return {
+        "mode": "standin" if standin else "docker",
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "settings": {
+            name: value for name, value in sorted(os.environ.items())
+            if name.startswith("BDD_") and name not in UNFINGERPRINTED
+        },
+    }
+
+
+def fingerprint(env: dict) -> str:
+    return hashlib.sha256(json.dumps(env, sort_keys=True).encode()).hexdigest()[:12]
+
+
+@dataclass
+class Run:
+    """One recorded test session."""
+
+    id: int
+    sha: str
+    dirty: bool
+    fingerprint: str
+    created: str
+
+
+class BaselineStore:
+    """
+    SQLite store of metrics per run.
+
+    Usage:
+        store = BaselineStore(DEFAULT_STORE)
+        store.record(sha, dirty, environment(standin=False), REPORT.metrics)
+        comparisons, candidates, baselines = compare(store, base_sha)
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def record(self, sha: str, dirty: bool, env: dict, metrics: list[Metric]) -> int:
+        """Store one run's metrics and return the run id."""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (sha, dirty, fingerprint, environment, created) VALUES (?, ?, ?, ?, ?)",
+                (sha, int(dirty), fingerprint(env), json.dumps(env, sort_keys=True),
+                 datetime.now(timezone.utc).isoformat(timespec="seconds")),
+            )
+            # A metric reported twice in a session (e.g. an outline re-run) keeps the last value
+            self.db.executemany(
+                "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (cursor.lastrowid, m.scenario, m.name, m.unit, int(m.higher_is_better), m.value,
+                     json.dumps(m.histogram.to_dict()) if m.histogram is not None else None)
+                    for m in metrics
+                ],
+            )
+        return cursor.lastrowid
+
+    def runs(self, sha: str | None = None, fingerprint: str | None = None) -> list[Run]:
+        """Runs, newest first, optionally of one SHA (prefix) and fingerprint."""
+        query, args = "SELECT * FROM runs WHERE 1 = 1", []
+        if sha:
+            query += " AND sha LIKE ?"
+            args.append(f"{sha}%")
+        if fingerprint:
+            query += " AND fingerprint = ?"
+            args.append(fingerprint)
+        rows = self.db.execute(query + " ORDER BY id DESC", args).fetchall()
+        return [Run(r["id"], r["sha"], bool(r["dirty"]), r["fingerprint"], r["created"]) for r in rows]
+
+    def metrics(self, runs: list[Run]) -> dict[tuple[str, str], list[Metric]]:
+        """Metrics of the given runs, grouped by (scenario, name)."""
+        grouped: dict[tuple[str, str], list[Metric]] = {}
+        if not runs:
+            return grouped
+        placeholders = ", ".join("?" for _ in runs)
+        rows = self.db.execute(
+            f"SELECT * FROM metrics WHERE run_id IN ({placeholders}) ORDER BY run_id",
+            [run.id for run in runs],
+        ).fetchall()
+        for row in rows:
+            grouped.setdefault((row["scenario"], row["name"]), []).append(Metric(
+                row["scenario"], row["name"], row["unit"], bool(row["higher_is_better"]),
+                histogram=LogLinearHistogram.from_dict(json.loads(row["histogram"]))
+                if row["histogram"] else None,
+                value=row["value"],
+            ))
+        return grouped
+
+
+def mann_whitney(baseline: dict[float, int], candidate: dict[float, int]) -> tuple[float, float]:
+    """
+    Mann-Whitney U test of two samples given as {value: count}.
+
+    Returns:
+        A12, the probability that a candidate value exceeds a baseline one
+        (ties count half), and the two-sided p-value from the tie-corrected
+        normal approximation with continuity correction
+    """
+    n1, n2 = sum(baseline.values()), sum(candidate.values())
+    if not n1 or not n2:
+        return 0.5, 1.0
+    rank, rank_sum, ties = 0, 0.0, 0
+    for key in sorted(set(baseline) | set(candidate)):
+        tied = baseline.get(key, 0) + candidate.get(key, 0)
+        rank_sum += candidate.get(key, 0) * (rank + (tied + 1) / 2)
+        ties += tied ** 3 - tied
+        rank += tied
+    u = rank_sum - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return u / (n1 * n2), 1.0
+    shift = u - n1 * n2 / 2
+    z = (abs(shift) - 0.5) / math.sqrt(variance) if abs(shift) >= 0.5 else 0.0
+    return u / (n1 * n2), math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(n1: int, n2: int) -> float:
+    """Smallest p-value ``mann_whitney`` can return for these sample sizes (fully separated, no ties)."""
+    return mann_whitney({i: 1 for i in range(n1)}, {n1 + i: 1 for i in range(n2)})[1]
+
+
+def _bucket_counts(histogram: LogLinearHistogram) -> dict[float, int]:
+    return {index: count for index, count in enumerate(histogram.counts) if count}
+
+
+@dataclass
+class Comparison:
+    """Baseline vs candidate of one metric."""
+
+    scenario: str
+    name: str
+    unit: str
+    baseline: float
+    candidate: float
+    change: float
+    p_value: float | None
+    a12: float | None
+    verdict: str
+
+
+def compare_metric(
+    baseline: list[Metric],
+    candidate: list[Metric],
+    alpha: float = ALPHA,
+    min_change: float = MIN_CHANGE,
+    min_a12: float = MIN_A12
+) -> Comparison:
+    """Test one metric of the candidate runs against the pooled baseline runs."""
+    first = candidate[0]
+    worse = -1 if first.higher_is_better else 1
+
+    if first.histogram is not None:
+        pooled = {"baseline": LogLinearHistogram(), "candidate": LogLinearHistogram()}
+        for side, metrics in (("baseline", baseline), ("candidate", candidate)):
+            for metric in metrics:
+                pooled[side].merge(metric.histogram)
+        base_value = pooled["baseline"].percentile(50) * 1000
+        cand_value = pooled["candidate"].percentile(50) * 1000
+        a12, p_value = mann_whitney(
+            _bucket_counts(pooled["baseline"]), _bucket_counts(pooled["candidate"])
+        )
+        exact = False
+    else:
+        base_values = [m.value for m in baseline]
+        cand_values = [m.value for m in candidate]
+        base_value = sum(base_values) / len(base_values)
+        cand_value = sum(cand_values) / len(cand_values)
+        exact = len(base_values) >= 2 and len(set(base_values)) == len(set(cand_values)) == 1
+        a12 = p_value = None
+        # Too few runs to ever reach alpha: leave it untested rather than call it "no change"
+        if not exact and min_p_value(len(base_values), len(cand_values)) < alpha:
+            a12, p_value = mann_whitney(
+                {v: base_values.count(v) for v in base_values},
+                {v: cand_values.count(v) for v in cand_values},
+            )
+
+    change = (cand_value - base_value) / base_value if base_value else 0.0
+    # A12 is "candidate is larger"; for higher-is-better metrics that is the good side
+    effect = None if a12 is None else (a12 if worse > 0 else 1 - a12)
+    large = abs(change) >= min_change and (effect is None or max(effect, 1 - effect) >= min_a12)
+    if p_value is None and not exact:
+        verdict = "untested"
+    elif not large:
+        verdict = "no change"
+    elif exact or p_value < alpha:
+        verdict = "regression" if change * worse > 0 else "improvement"
+    else:
+        verdict = "no change"
+    return Comparison(first.scenario, first.name, first.unit, base_value, cand_value,
+                      change, p_value, effect, verdict)
+
+
+def compare(
+    store: BaselineStore,
+    base_sha: str,
+    head_sha: str | None = None,
+    fingerprint: str | None = None,
+    **thresholds
+) -> tuple[list[Comparison], list[Run], list[Run]]:
+    """
+    Compare candidate runs with the clean baseline runs of the same fingerprint.
+
+    The newest run of ``head_sha`` (or the newest run at all) picks the
+    fingerprint and whether the candidate is a dirty working tree; every run
+    matching its SHA, fingerprint and dirty flag is pooled.
+
+    Raises:
+        LookupError: If there is no candidate run or no baseline run to compare with
+    """
+    newest = store.runs(head_sha, fingerprint)
+    if not newest:
+        raise LookupError(f"No recorded run for {head_sha or 'any commit'}")
+    candidates = [run for run in store.runs(newest[0].sha, newest[0].fingerprint) if run.dirty == newest[0].dirty]
+    baselines = [
+        run for run in store.runs(base_sha, newest[0].fingerprint)
+        if not run.dirty and run not in candidates
+    ]
+    if not baselines:
+        raise LookupError(
+            f"No clean baseline run for {base_sha[:12]} in environment {newest[0].fingerprint}; "
+            "run the benchmarks on the baseline commit first"
+        )
+
+    base_metrics = store.metrics(baselines)
+    comparisons = [
+        compare_metric(base_metrics[key], metrics, **thresholds)
+        for key, metrics in sorted(store.metrics(candidates).items())
+        if key in base_metrics
+    ]
+    return comparisons, candidates, baselines
+
+
+def markdown(
+    comparisons: list[Comparison],
+    candidates: list[Run],
+    baselines: list[Run],
+    alpha: float = ALPHA,
+    min_change: float = MIN_CHANGE,
+    min_a12: float = MIN_A12
+) -> str:
+    """Summary table for a CI comment, regressions first."""
+    regressions = [c for c in comparisons if c.verdict == "regression"]
+    head = candidates[0].sha[:12] + (" (dirty)" if candidates[0].dirty else "")
+    lines = [
+        f"## Performance: `{baselines[0].sha[:12]}` → `{head}`",
+        "",
+        f"{len(regressions)} regression(s) in {len(comparisons)} metrics. "
+        f"{len(baselines)} baseline and {len(candidates)} candidate run(s) in environment "
+        f"`{candidates[0].fingerprint}`. "
+        f"Flagged when p < {alpha}, |change| ≥ {min_change:.0%} and A12 ≥ {min_a12}; "
+        f"scalar figures are untested until enough runs per side can reach p < {alpha}.",
+        "",
+        "| scenario | metric | baseline | candidate | change | p | A12 | verdict |",
+        "| --- | --- | ---: | ---: | ---: | ---: | ---: | --- |",
+    ]
+    order = {"regression": 0, "untested": 1, "improvement": 2, "no change": 3}
+    for c in sorted(comparisons, key=lambda c: (order[c.verdict], c.scenario, c.name)):
+        verdict = f"**{c.verdict}**" if c.verdict == "regression" else c.verdict
+        lines.append(
+            f"| {c.scenario} | {c.name} | {c.baseline:.2f} {c.unit} | {c.candidate:.2f} {c.unit} "
+            f"| {c.change:+.1%} | {'-' if c.p_value is None else f'{c.p_value:.3g}'} "
+            f"| {'-' if c.a12 is None else f'{c.a12:.2f}'} | {verdict} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m helpers.baseline", description=__doc__.split("\n")[0])
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="SQLite baseline file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("runs", help="List recorded runs")
+
+    compare_cmd = commands.add_parser("compare", help="Compare a run against a baseline commit")
+    compare_cmd.add_argument("--base", default="origin/main", help="Baseline commit (any git ref)")
+    compare_cmd.add_argument("--head", help="Candidate commit (default: the newest run)")
+    compare_cmd.add_argument("--alpha", type=float, default=ALPHA, help="Significance level")
+    compare_cmd.add_argument("--min-change", type=float, default=MIN_CHANGE,
+                             help="Minimum relative change of the median (or mean scalar)")
+    compare_cmd.add_argument("--min-a12", type=float, default=MIN_A12,
+                             help="Minimum Vargha-Delaney A12 effect size")
+    compare_cmd.add_argument("--markdown", type=Path, help="Also write the summary to this file")
+    compare_cmd.add_argument("--fail-on-regression", action="store_true",
+                             help="Exit with status 1 when a regression is flagged")
+    args = parser.parse_args(argv)
+
+    store = BaselineStore(args.store)
+    try:
+        if args.command == "runs":
+            for run in store.runs():
+                print(f"{run.id:>5}  {run.created}  {run.sha[:12]}{'*' if run.dirty else ' '}  {run.fingerprint}")
+            return 0
+
+        repo_root = Path(__file__).resolve().parents[4]
+        try:
+            base_sha, _ = git_revision(repo_root, args.base)
+            head_sha = git_revision(repo_root, args.head)[0] if args.head else None
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 2
+        thresholds = {"alpha": args.alpha, "min_change": args.min_change, "min_a12": args.min_a12}
+        try:
+            comparisons, candidates, baselines = compare(store, base_sha, head_sha, **thresholds)
+        except LookupError as e:
+            print(e, file=sys.stderr)
+            return 2
+    finally:
+        store.close()
+
+    summary = markdown(comparisons, candidates, baselines, **thresholds)
+    print(summary)
+    if args.markdown:
+        args.markdown.write_text(summary)
+    regressed = any(c.verdict == "regression" for c in comparisons)
+    return 1 if regressed and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
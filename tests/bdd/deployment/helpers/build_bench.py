@@ -0,0 +1,237 @@
+"""Cold vs warm image build benchmark with layer-cache accounting.
+
+Builds each compose service with BuildKit's plain progress output and parses
+every step's ``CACHED`` / ``DONE <seconds>`` status, so a build can be
+reported as time per service, layer cache hit ratio and final image size.
+"""
+
+import json
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# "#8 [feedback-server builder 6/9] RUN bun install"
+STEP_HEADER = re.compile(r"^#(?P<id>\d+) \[(?P<stage>[^\]]+)\] (?P<command>.+)$")
+STEP_CACHED = re.compile(r"^#(?P<id>\d+) CACHED$")
+STEP_DONE = re.compile(r"^#(?P<id>\d+) DONE (?P<seconds>\d+(?:\.\d+)?)s$")
+STEP_ERROR = re.compile(r"^#(?P<id>\d+) ERROR")
+
+# Stage labels of real Dockerfile instructions carry an "n/m" step counter;
+# "[internal] load metadata ..." and friends do not produce layers.
+LAYER_STAGE = re.compile(r"\d+/\d+$")
+
+# Commands that install dependencies; busting their layer is a regression
+DEPENDENCY_INSTALL = re.compile(r"\b(bun|npm|yarn|pnpm)\s+(install|ci)\b|\bpip\s+install\b")
+
+# File written into a service's source directory to simulate a code edit
+SOURCE_PROBE_NAME = ".bdd-build-probe"
+
+
+@dataclass
+class BuildStep:
+    """A single BuildKit step from plain progress output."""
+
+    id: int
+    stage: str
+    command: str
+    cached: bool = False
+    duration: float = 0.0
+    failed: bool = False
+
+    @property
+    def is_layer(self) -> bool:
+        return bool(LAYER_STAGE.search(self.stage))
+
+    @property
+    def is_dependency_install(self) -> bool:
+        return bool(DEPENDENCY_INSTALL.search(self.command))
+
+
+@dataclass
+class BuildResult:
+    """Outcome of one ``docker compose build`` invocation."""
+
+    service: str
+    mode: str
+    returncode: int
+    elapsed: float
+    steps: list[BuildStep] = field(default_factory=list)
+    output: str = ""
+
+    @property
+    def layer_steps(self) -> list[BuildStep]:
+        return [s for s in self.steps if s.is_layer]
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        layers = self.layer_steps
+        if not layers:
+            return 0.0
+        return sum(1 for s in layers if s.cached) / len(layers)
+
+    @property
+    def busted_dependency_steps(self) -> list[BuildStep]:
+        """Dependency-install steps that were executed instead of cached."""
+        return [s for s in self.layer_steps if s.is_dependency_install and not s.cached]
+
+
+def parse_plain_progress(output: str) -> list[BuildStep]:
+    """
+    Parse BuildKit ``--progress=plain`` output into steps.
+
+    Args:
+        output: Combined stdout/stderr of the build
+
+    Returns:
+        Steps in the order they were first announced
+    """
+    steps: dict[int, BuildStep] = {}
+
+    for line in output.splitlines():
+        line = line.strip()
+        if match := STEP_HEADER.match(line):
+            step_id = int(match["id"])
+            # Headers are repeated when output of parallel steps interleaves
+            if step_id not in steps:
+                steps[step_id] = BuildStep(step_id, match["stage"], match["command"])
+        elif match := STEP_CACHED.match(line):
+            if step := steps.get(int(match["id"])):
+                step.cached = True
+        elif match := STEP_DONE.match(line):
+            if step := steps.get(int(match["id"])):
+                step.duration = float(match["seconds"])
+        elif match := STEP_ERROR.match(line):
+            if step := steps.get(int(match["id"])):
+                step.failed = True
+
+    return list(steps.values())
+
+
+def compose_build_config(repo_root: Path) -> dict[str, dict]:
+    """
+    Return the resolved compose configuration of services that are built.
+
+    Returns:
+        Mapping of service name to its resolved service definition
+    """
+    result = subprocess.run(
+        ["docker", "compose", "config", "--format", "json"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    if result.returncode != 0:
+        return {}
+
+    services = json.loads(result.stdout).get("services", {})
+    return {name: svc for name, svc in services.items() if "build" in svc}
+
+
+def image_size(image: str) -> int | None:
+    """Return the size of a local image in bytes, or None if it does not exist."""
+    result = subprocess.run(
+        ["docker", "image", "inspect", "--format", "{{.Size}}", image],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if result.returncode != 0:
+        return None
+    return int(result.stdout.strip())
+
+
+def build_service(
+    repo_root: Path,
+    service: str,
+    no_cache: bool = False,
+    timeout: int = 900
+) -> BuildResult:
+    """
+    Build a single compose service with plain progress output.
+
+    Args:
+        repo_root: Repository root containing docker-compose.yml
+        service: Compose service to build
+        no_cache: Build without the layer cache (cold build)
+        timeout: Build timeout in seconds
+
+    Returns:
+        BuildResult with parsed steps
+    """
+    cmd = ["docker", "compose", "build"]
+    if no_cache:
+        cmd.append("--no-cache")
+    cmd.append(service)
+
+    env = {**os.environ, "BUILDKIT_PROGRESS": "plain", "DOCKER_BUILDKIT": "1"}
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        cmd,
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=env
+    )
+    elapsed = time.perf_counter() - start
+
+    output = result.stdout + result.stderr
+    return BuildResult(
+        service=service,
+        mode="cold" if no_cache else "warm",
+        returncode=result.returncode,
+        elapsed=elapsed,
+        steps=parse_plain_progress(output),
+        output=output,
+    )
+
+
+def source_dir(repo_root: Path, service_config: dict) -> Path | None:
+    """Return the ``src`` directory next to a service's Dockerfile, if any."""
+    build = service_config.get("build", {})
+    context = Path(build.get("context", repo_root))
+    dockerfile = context / build.get("dockerfile", "Dockerfile")
+    src = dockerfile.parent / "src"
+    return src if src.is_dir() else None
+
+
+def benchmark_service(
+    repo_root: Path,
+    service: str,
+    service_config: dict,
+    timeout: int = 900
+) -> dict:
+    """
+    Run a cold build followed by a warm build after a simulated source edit.
+
+    The warm build runs with a probe file added to the service's source
+    directory, so source layers are rebuilt while the dependency-install
+    layer is expected to stay cached.
+
+    Returns:
+        Dictionary with "cold", "warm" BuildResults and "image_size" in bytes
+    """
+    cold = build_service(repo_root, service, no_cache=True, timeout=timeout)
+
+    probe = None
+    src = source_dir(repo_root, service_config)
+    if src is not None:
+        probe = src / SOURCE_PROBE_NAME
+        probe.write_text(f"{time.time()}\n")
+    try:
+        warm = build_service(repo_root, service, timeout=timeout)
+    finally:
+        if probe is not None:
+            probe.unlink(missing_ok=True)
+
+    image = service_config.get("image")
+    return {
+        "cold": cold,
+        "warm": warm,
+        "image_size": image_size(image) if image else None,
+    }
@@ -0,0 +1,266 @@
+"""Parallel per-service image builds with build-context change detection.
+
+Builds independent compose services concurrently (bounded by a parallelism
+limit), streams each build's output to its own log file, and skips services
+whose build inputs have not changed since their last successful build.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from helpers.build_bench import compose_build_config, image_size
+
+# "COPY [--chown=x] [--from=stage] src... dest" / "ADD src... dest"
+COPY_INSTRUCTION = re.compile(r"^\s*(COPY|ADD)\s+(?P<args>.+)$", re.IGNORECASE)
+
+
+@dataclass
+class ServiceBuild:
+    """Outcome of building (or skipping) a single service."""
+
+    service: str
+    status: str  # "built", "skipped" or "failed"
+    elapsed: float = 0.0
+    returncode: int = 0
+    log_path: Path | None = None
+    context_hash: str = ""
+
+    def log_tail(self, lines: int = 40) -> str:
+        if self.log_path is None or not self.log_path.exists():
+            return ""
+        return "\n".join(self.log_path.read_text(errors="replace").splitlines()[-lines:])
+
+
+@dataclass
+class BuildRun:
+    """Outcome of an orchestrated build of several services."""
+
+    builds: dict[str, ServiceBuild] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def returncode(self) -> int:
+        return 0 if not self.failures else 1
+
+    @property
+    def failures(self) -> list[ServiceBuild]:
+        return [b for b in self.builds.values() if b.status == "failed"]
+
+
+def _dockerfile_sources(dockerfile: Path) -> list[str]:
+    """Return the context paths copied into the image by a Dockerfile."""
+    if not dockerfile.exists():
+        return ["."]
+
+    # Join line continuations before matching instructions
+    text = re.sub(r"\\\n", " ", dockerfile.read_text())
+    sources = []
+    for line in text.splitlines():
+        match = COPY_INSTRUCTION.match(line)
+        if not match:
+            continue
+        parts = match["args"].split()
+        if any(p.startswith("--from") for p in parts):
+            continue  # Copies from another stage, not from the context
+        paths = [p for p in parts if not p.startswith("--")]
+        # The last path is the destination
+        sources.extend(paths[:-1])
+
+    return sources or ["."]
+
+
+def context_hash(repo_root: Path, service_config: dict) -> str:
+    """
+    Hash the build inputs of a service.
+
+    Covers the Dockerfile, build target and args, and every git-visible file
+    (tracked or untracked but not ignored) below the paths the Dockerfile
+    copies from the build context.
+    """
+    build = service_config.get("build", {})
+    context = Path(build.get("context", repo_root))
+    dockerfile = context / build.get("dockerfile", "Dockerfile")
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(build, sort_keys=True).encode())
+    if dockerfile.exists():
+        digest.update(dockerfile.read_bytes())
+
+    sources = sorted(set(_dockerfile_sources(dockerfile)))
+    result = subprocess.run(
+        ["git", "ls-files", "-co", "--exclude-standard", "-z", "--", *sources],
+        cwd=context,
+        capture_output=True,
+        timeout=60
+    )
+    for name in sorted(result.stdout.decode().split("\0")):
+        path = context / name
+        if not name or not path.is_file():
+            continue
+        digest.update(name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+
+    return digest.hexdigest()
+
+
+class BuildOrchestrator:
+    """
+    Build compose services concurrently with a parallelism limit.
+
+    Usage:
+        orchestrator = BuildOrchestrator(repo_root, cache_dir, log_dir, max_parallel=3)
+        run = orchestrator.build()
+        assert run.returncode == 0
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        cache_dir: Path,
+        log_dir: Path,
+        max_parallel: int | None = None,
+        timeout: int = 900
+    ):
+        self.repo_root = repo_root
+        self.state_file = cache_dir / "build-state.json"
+        self.log_dir = log_dir
+        self.max_parallel = max_parallel
+        self.timeout = timeout
+        self._state_lock = threading.Lock()
+
+    def build(self, services: list[str] | None = None, force: bool = False) -> BuildRun:
+        """
+        Build services, skipping those whose inputs are unchanged.
+
+        Args:
+            services: Services to build (default: every service with a build section)
+            force: Rebuild even if the build context is unchanged
+
+        Returns:
+            BuildRun with the outcome per service
+        """
+        config = compose_build_config(self.repo_root)
+        if services is not None:
+            config = {name: svc for name, svc in config.items() if name in services}
+
+        state = self._load_state()
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Services that build FROM another service's image must wait for it
+        done = {name: threading.Event() for name in config}
+        run = BuildRun()
+
+        def _build(name: str) -> ServiceBuild:
+            for dependency in self._build_dependencies(config[name]):
+                if dependency in done:
+                    done[dependency].wait()
+            try:
+                return self._build_one(name, config[name], state, force)
+            finally:
+                done[name].set()
+
+        max_parallel = self.max_parallel or min(len(config), os.cpu_count() or 1) or 1
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            # Submit in dependency order so waiting builds never hold every worker
+            order = self._dependency_order(config)
+            futures = {name: pool.submit(_build, name) for name in order}
+            for name, future in futures.items():
+                run.builds[name] = future.result()
+        run.elapsed = time.perf_counter() - start
+
+        return run
+
+    def _build_one(
+        self,
+        name: str,
+        service_config: dict,
+        state: dict,
+        force: bool
+    ) -> ServiceBuild:
+        digest = context_hash(self.repo_root, service_config)
+        image = service_config.get("image")
+        unchanged = state.get(name) == digest
+        if unchanged and not force and (image is None or image_size(image) is not None):
+            return ServiceBuild(name, "skipped", context_hash=digest)
+
+        log_path = self.log_dir / f"build-{name}.log"
+        env = {**os.environ, "BUILDKIT_PROGRESS": "plain", "DOCKER_BUILDKIT": "1"}
+
+        start = time.perf_counter()
+        with open(log_path, "w") as log:
+            process = subprocess.Popen(
+                ["docker", "compose", "build", name],
+                cwd=self.repo_root,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env
+            )
+            try:
+                returncode = process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                log.write(f"\nBuild timed out after {self.timeout}s\n")
+                returncode = -1
+        elapsed = time.perf_counter() - start
+
+        if returncode == 0:
+            self._save_state(name, digest)
+
+        return ServiceBuild(
+            service=name,
+            status="built" if returncode == 0 else "failed",
+            elapsed=elapsed,
+            returncode=returncode,
+            log_path=log_path,
+            context_hash=digest,
+        )
+
+    @staticmethod
+    def _build_dependencies(service_config: dict) -> list[str]:
+        contexts = service_config.get("build", {}).get("additional_contexts", {}) or {}
+        if isinstance(contexts, list):
+            contexts = dict(c.split("=", 1) for c in contexts)
+        return [
+            value.split(":", 1)[1]
+            for value in contexts.values()
+            if isinstance(value, str) and value.startswith("service:")
+        ]
+
+    def _dependency_order(self, config: dict[str, dict]) -> list[str]:
+        order: list[str] = []
+
+        def _visit(name: str, path: tuple[str, ...] = ()) -> None:
+            if name in order or name in path or name not in config:
+                return
+            for dependency in self._build_dependencies(config[name]):
+                _visit(dependency, path + (name,))
+            order.append(name)
+
+        for name in config:
+            _visit(name)
+        return order
+
+    def _load_state(self) -> dict:
+        if not self.state_file.exists():
+            return {}
+        try:
+            return json.loads(self.state_file.read_text())
+        except json.JSONDecodeError:
+            return {}
+
+    def _save_state(self, name: str, digest: str) -> None:
+        with self._state_lock:
+            state = self._load_state()
+            state[name] = digest
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.write_text(json.dumps(state, indent=2, sort_keys=True))
@@ -0,0 +1,190 @@
+"""Record/replay of HTTP interactions made through the harness client.
+
+In record mode a ``CassetteAdapter`` forwards requests to the real adapter
+and stores each interaction in a per-scenario cassette. Bodies are stored
+once, gzip-compressed, under their SHA-256 digest, so repeated responses (the
+OpenAPI document, health payloads) cost nothing after the first recording.
+In replay mode the adapter answers from the cassette without touching the
+network.
+
+Match strictness decides which requests are interchangeable:
+
+- ``path``: method and path
+- ``url``: method, path and query string (default)
+- ``body``: method, full URL and request body digest
+"""
+
+import gzip
+import hashlib
+import json
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+MATCH_MODES = ("path", "url", "body")
+
+# Response headers that differ on every request and would only churn diffs
+VOLATILE_HEADERS = {"date", "connection", "keep-alive", "transfer-encoding", "x-request-id"}
+
+
+class CassetteMiss(AssertionError):
+    """
+    A replayed request has no recorded interaction.
+
+    Not a ``RequestException``: steps that skip when a service is unreachable
+    must not turn a missing or stale cassette into a silent skip.
+    """
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _request_body(request: requests.PreparedRequest) -> bytes:
+    body = request.body or b""
+    return body.encode() if isinstance(body, str) else body
+
+
+def match_key(method: str, url: str, body_digest: str, match: str) -> str:
+    """Key under which an interaction is stored and looked up."""
+    parts = urlsplit(url)
+    if match == "path":
+        return f"{method} {parts.path}"
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    key = f"{method} {parts.path}?{query}" if query else f"{method} {parts.path}"
+    return f"{key} {body_digest}" if match == "body" else key
+
+
+class Cassette:
+    """
+    Interactions of one scenario plus a shared content-addressed body store.
+
+    Layout:
+        <root>/bodies/<sha256>.gz
+        <root>/<module>/<scenario>.json
+    """
+
+    def __init__(self, root: Path, name: str, match: str = "url"):
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown cassette match mode '{match}', expected one of {MATCH_MODES}")
+        self.root = root
+        self.path = root / f"{name}.json"
+        self.match = match
+        self.interactions: list[dict] = []
+        self._replay: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> "Cassette":
+        self.interactions = json.loads(self.path.read_text())["interactions"]
+        for interaction in self.interactions:
+            req = interaction["request"]
+            key = match_key(req["method"], req["url"], req["body"], self.match)
+            self._replay[key].append(interaction)
+        return self
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"interactions": self.interactions}, indent=1) + "\n")
+
+    # -------------------------------------------------------------------------
+    # Bodies
+    # -------------------------------------------------------------------------
+
+    def _body_path(self, digest: str) -> Path:
+        return self.root / "bodies" / f"{digest}.gz"
+
+    def store_body(self, data: bytes) -> str:
+        digest = _digest(data)
+        path = self._body_path(digest)
+        if data and not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(gzip.compress(data, mtime=0))
+        return digest
+
+    def read_body(self, digest: str) -> bytes:
+        path = self._body_path(digest)
+        return gzip.decompress(path.read_bytes()) if path.exists() else b""
+
+    # -------------------------------------------------------------------------
+    # Interactions
+    # -------------------------------------------------------------------------
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        self.interactions.append({
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "body": _digest(_request_body(request)),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in VOLATILE_HEADERS
+                },
+                "body": self.store_body(response.content),
+            },
+        })
+
+    def find(self, request: requests.PreparedRequest) -> dict:
+        """
+        Return the next recorded interaction for a request.
+
+        Interactions with the same key are served in recording order; the
+        last one is repeated once they run out (e.g. for polling loops).
+        """
+        key = match_key(request.method, request.url, _digest(_request_body(request)), self.match)
+        candidates = self._replay.get(key)
+        if not candidates:
+            raise CassetteMiss(f"No recorded interaction for '{key}' in {self.path}")
+        index = min(self._served[key], len(candidates) - 1)
+        self._served[key] += 1
+        return candidates[index]
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records through ``upstream`` or replays a cassette."""
+
+    def __init__(self, cassette: Cassette, mode: str, upstream: BaseAdapter | None = None):
+        super().__init__()
+        if mode == "record" and upstream is None:
+            raise ValueError("Record mode needs an upstream adapter")
+        self.cassette = cassette
+        self.mode = mode
+        self.upstream = upstream
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == "record":
+            response = self.upstream.send(
+                request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+            )
+            # Recording reads the body; it stays cached on response.content
+            self.cassette.record(request, response)
+            return response
+        return self._replay(request)
+
+    def _replay(self, request: requests.PreparedRequest) -> requests.Response:
+        recorded = self.cassette.find(request)["response"]
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.cassette.read_body(recorded["body"])
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,205 @@
+"""Response compression benchmark of the feedback-server JSON API.
+
+Each representative request is repeated once per ``Accept-Encoding`` variant
+and page size. The raw body is read without decoding, so the wire size is
+exactly what crossed the network. The decoded size, negotiated encoding,
+latency and (when the container is reachable) the server's CPU time per
+request come with it. ``recommend`` then turns the comparison into one line
+per endpoint and page size.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from helpers.container_stats import ContainerStats
+from helpers.page_weight import decode_body
+from helpers.stats import summarize
+
+# Accept-Encoding variants compared for every request
+ENCODINGS = {
+    "none": "identity",
+    "gzip": "gzip",
+    "deflate": "deflate",
+    "br": "br",
+    "browser": "gzip, deflate, br",
+}
+
+# Bodies below this size are not worth compressing (hono/compress uses 1 KB too)
+MIN_COMPRESS_BYTES = 1024
+
+# Minimum saving for compression to be recommended
+MIN_SAVING = 0.2
+
+
+@dataclass
+class CompressionRequest:
+    """A representative API request at one page size."""
+
+    endpoint: str
+    method: str
+    path: str
+    page_size: int | None = None
+    params: dict | None = None
+    body: Any = None
+
+
+@dataclass
+class EncodingResult:
+    """Measurements of one request under one Accept-Encoding variant."""
+
+    request: CompressionRequest
+    variant: str
+    negotiated: str
+    wire_bytes: float
+    decoded_bytes: float
+    latency: dict[str, float]
+    cpu_ms: float | None
+    failures: int = 0
+
+    @property
+    def ratio(self) -> float:
+        return self.wire_bytes / self.decoded_bytes if self.decoded_bytes else 1.0
+
+
+def api_requests(project_id: str, page_sizes: list[int]) -> list[CompressionRequest]:
+    """List and search at every page size, plus the full sync change feed."""
+    calls = []
+    for size in page_sizes:
+        calls.append(CompressionRequest(
+            "list", "GET", "/api/v1/feedback", size,
+            params={"projectId": project_id, "limit": size},
+        ))
+        calls.append(CompressionRequest(
+            "search", "POST", "/api/v1/feedback/search", size,
+            body={"query": "seed", "projectId": project_id, "pageSize": size},
+        ))
+    calls.append(CompressionRequest(
+        "sync changes", "GET", "/api/v1/sync/changes", params={"projectId": project_id},
+    ))
+    return calls
+
+
+class CompressionBenchmark:
+    """
+    Repeat each request under every Accept-Encoding variant.
+
+    Usage:
+        benchmark = CompressionBenchmark(base_url, stats=ContainerStats("feedback-server"))
+        results = benchmark.run(api_requests("bdd", [20, 100]), repeat=50)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        stats: ContainerStats | None = None,
+        variants: dict[str, str] = ENCODINGS,
+        timeout: float = 30.0
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.stats = stats
+        self.variants = variants
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def run(self, calls: list[CompressionRequest], repeat: int) -> list[EncodingResult]:
+        return [
+            self.measure(request, variant, repeat)
+            for request in calls
+            for variant in self.variants
+        ]
+
+    def measure(self, request: CompressionRequest, variant: str, repeat: int) -> EncodingResult:
+        latencies, wire, decoded, failures = [], [], [], 0
+        negotiated = ""
+        cpu_before = self.stats.cpu_seconds() if self.stats else None
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    request.method, self.base_url + request.path,
+                    params=request.params, json=request.body,
+                    headers={"Accept-Encoding": self.variants[variant]},
+                    timeout=self.timeout, stream=True,
+                )
+                raw = response.raw.read(decode_content=False)
+            except requests.exceptions.RequestException:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+            negotiated = response.headers.get("Content-Encoding", "").lower()
+            if response.status_code != 200:
+                failures += 1
+                continue
+            wire.append(len(raw))
+            # None for br without the optional brotli package
+            body = decode_body(raw, negotiated)
+            if body is not None:
+                decoded.append(len(body))
+
+        cpu_ms = None
+        if cpu_before is not None and latencies:
+            cpu_ms = (self.stats.cpu_seconds() - cpu_before) * 1000 / len(latencies)
+
+        return EncodingResult(
+            request=request,
+            variant=variant,
+            negotiated=negotiated or "identity",
+            wire_bytes=sum(wire) / len(wire) if wire else 0.0,
+            decoded_bytes=sum(decoded) / len(decoded) if decoded else 0.0,
+            latency=summarize(latencies),
+            cpu_ms=cpu_ms,
+            failures=failures,
+        )
+
+
+def recommend(results: list[EncodingResult]) -> list[list]:
+    """
+    One recommendation row per endpoint and page size.
+
+    Compares the best negotiated encoding against ``none``: compression is
+    recommended when it saves at least ``MIN_SAVING`` of a body of at least
+    ``MIN_COMPRESS_BYTES``. The CPU and latency it costs are shown with it.
+    """
+    groups: dict[tuple[str, int | None], dict[str, EncodingResult]] = {}
+    for result in results:
+        key = (result.request.endpoint, result.request.page_size)
+        groups.setdefault(key, {})[result.variant] = result
+
+    rows = []
+    for (endpoint, page_size), by_variant in groups.items():
+        plain = by_variant.get("none")
+        compressed = [r for r in by_variant.values() if r.negotiated != "identity" and r.wire_bytes]
+        if plain is None or not plain.decoded_bytes:
+            continue
+        if not compressed:
+            advice = (
+                "leave uncompressed" if plain.decoded_bytes < MIN_COMPRESS_BYTES
+                else "server did not compress: enable ENABLE_COMPRESSION"
+            )
+            rows.append([endpoint, page_size or "-", plain.decoded_bytes / 1024, "-", None, None, None, advice])
+            continue
+
+        best = min(compressed, key=lambda r: r.wire_bytes)
+        saving = 1 - best.wire_bytes / plain.wire_bytes if plain.wire_bytes else 0.0
+        cpu_cost = (
+            best.cpu_ms - plain.cpu_ms
+            if best.cpu_ms is not None and plain.cpu_ms is not None else None
+        )
+        latency_cost = best.latency["p50"] - plain.latency["p50"]
+        if plain.decoded_bytes < MIN_COMPRESS_BYTES or saving < MIN_SAVING:
+            advice = "leave uncompressed"
+        else:
+            advice = f"compress with {best.negotiated}"
+        unoffered = [v for v in ("br", "gzip") if v in by_variant and by_variant[v].negotiated != v]
+        if unoffered:
+            advice += f" ({', '.join(unoffered)} not negotiated)"
+        rows.append([
+            endpoint, page_size or "-", plain.decoded_bytes / 1024, best.negotiated,
+            f"{saving:.0%}", cpu_cost, latency_cost, advice,
+        ])
+    return rows
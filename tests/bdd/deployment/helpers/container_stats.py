@@ -0,0 +1,111 @@
+"""CPU, memory and disk writes of a compose service's container through the Docker API.
+
+``ContainerStats`` reads the cumulative CPU time, bytes written and current
+memory usage of one service with one-shot stats calls, so a benchmark can
+take the delta around a measurement. ``MemorySampler`` polls the memory in
+the background to catch the peak a single request causes.
+"""
+
+import threading
+
+from helpers.docker_events import COMPOSE_PROJECT, PROJECT_LABEL, SERVICE_LABEL
+
+
+class ContainerStats:
+    """
+    One-shot CPU and memory readings of a compose service.
+
+    Usage:
+        stats = ContainerStats("feedback-server").connect()
+        before = stats.cpu_seconds()
+        ...
+        cpu = stats.cpu_seconds() - before
+    """
+
+    def __init__(self, service: str, project: str = COMPOSE_PROJECT):
+        self.service = service
+        self.project = project
+        self._container = None
+
+    def connect(self) -> "ContainerStats":
+        """
+        Look up the service's running container.
+
+        Raises:
+            docker.errors.DockerException: If the daemon is not reachable
+            LookupError: If the service has no running container
+        """
+        import docker
+
+        client = docker.from_env()
+        containers = client.containers.list(filters={"label": [
+            f"{PROJECT_LABEL}={self.project}", f"{SERVICE_LABEL}={self.service}",
+        ]})
+        if not containers:
+            raise LookupError(f"No running container for service {self.service}")
+        self._container = containers[0]
+        return self
+
+    def _stats(self) -> dict:
+        # one_shot skips the second sample the daemon otherwise waits ~1s for
+        return self._container.stats(stream=False, one_shot=True)
+
+    def cpu_seconds(self) -> float:
+        """Cumulative CPU time of the container, in seconds."""
+        return self._stats()["cpu_stats"]["cpu_usage"]["total_usage"] / 1e9
+
+    def memory_bytes(self) -> int:
+        """Current memory usage, excluding the reclaimable page cache."""
+        memory = self._stats()["memory_stats"]
+        details = memory.get("stats", {})
+        # cgroup v2 reports inactive_file, v1 reports cache
+        return memory.get("usage", 0) - details.get("inactive_file", details.get("cache", 0))
+
+    def write_bytes(self) -> int:
+        """Cumulative bytes the container wrote to block devices."""
+        entries = self._stats().get("blkio_stats", {}).get("io_service_bytes_recursive") or []
+        # cgroup v2 reports "write", v1 "Write"
+        return sum(entry["value"] for entry in entries if entry["op"].lower() == "write")
+
+
+class MemorySampler:
+    """
+    Background sampler of a container's memory usage.
+
+    Usage:
+        with MemorySampler(stats) as memory:
+            ...
+        memory.baseline, memory.peak
+    """
+
+    def __init__(self, stats: ContainerStats, interval: float = 0.2):
+        self.stats = stats
+        self.interval = interval
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "MemorySampler":
+        self.baseline = self.peak = self.stats.memory_bytes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.stats.memory_bytes())
+
+    @property
+    def spike(self) -> int:
+        """Peak memory above the usage when sampling started."""
+        return max(0, self.peak - self.baseline)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.peak = max(self.peak, self.stats.memory_bytes())
+            except Exception:
+                continue  # A stats call can fail while the container restarts
@@ -0,0 +1,287 @@
+"""Compiled OpenAPI response validators for contract checks under load.
+
+The component schemas of the OpenAPI document are compiled once into nested
+Python closures (each ``$ref`` is compiled a single time and shared), so
+validating a sampled response costs a handful of ``isinstance`` checks rather
+than a generic JSON-schema walk. A sampler plugs into ``LoadGenerator``'s
+``on_response`` hook and validates a configurable share of responses.
+"""
+
+import math
+import random
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+
+    loads = json.loads
+
+import requests
+
+from helpers.openapi import resolve_ref
+
+# A validator returns None for a valid value, or a short error description
+Validator = Callable[[Any], str | None]
+
+# Example violations kept per operation
+MAX_EXAMPLES = 3
+
+TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def _valid(_: Any) -> None:
+    return None
+
+
+class SchemaCompiler:
+    """Compile OpenAPI schemas into validator closures, caching each ``$ref``."""
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+        self._refs: dict[str, Validator] = {}
+
+    def compile(self, schema: dict) -> Validator:
+        ref = schema.get("$ref")
+        if ref is None:
+            return self._compile(schema)
+
+        if ref not in self._refs:
+            # Trampoline so recursive schemas can reference themselves
+            compiled: list[Validator] = []
+            self._refs[ref] = lambda value: compiled[0](value)
+            compiled.append(self._compile(resolve_ref(self.spec, ref)))
+            self._refs[ref] = compiled[0]
+        return self._refs[ref]
+
+    def _compile(self, schema: dict) -> Validator:
+        checks: list[Validator] = []
+
+        types = schema.get("type")
+        if isinstance(types, str):
+            types = [types]
+        if types:
+            allowed = [TYPE_CHECKS[t] for t in types if t in TYPE_CHECKS]
+            nullable = schema.get("nullable", False) or "null" in types
+            expected = "|".join(types)
+
+            def check_type(value: Any) -> str | None:
+                if value is None and nullable:
+                    return None
+                if not any(check(value) for check in allowed):
+                    return f"expected {expected}, got {type(value).__name__}"
+                return None
+            checks.append(check_type)
+
+        if "enum" in schema:
+            options = schema["enum"]
+            nullable_enum = schema.get("nullable", False)
+            checks.append(
+                lambda v: None if v in options or (v is None and nullable_enum) else f"{v!r} not in enum"
+            )
+        if "const" in schema:
+            constant = schema["const"]
+            checks.append(lambda v: None if v == constant else f"expected {constant!r}")
+
+        if "required" in schema or "properties" in schema:
+            checks.append(self._compile_object(schema))
+        if "items" in schema:
+            item = self.compile(schema["items"])
+
+            def check_items(value: Any) -> str | None:
+                if not isinstance(value, list):
+                    return None
+                for i, element in enumerate(value):
+                    error = item(element)
+                    if error:
+                        return f"[{i}]: {error}"
+                return None
+            checks.append(check_items)
+
+        if "allOf" in schema:
+            parts = [self.compile(s) for s in schema["allOf"]]
+            checks.append(lambda v: next((e for e in (p(v) for p in parts) if e), None))
+        for key in ("anyOf", "oneOf"):
+            if key in schema:
+                variants = [self.compile(s) for s in schema[key]]
+
+                def check_variants(value: Any, variants=variants, key=key) -> str | None:
+                    if any(variant(value) is None for variant in variants):
+                        return None
+                    return f"matches no {key} variant"
+                checks.append(check_variants)
+
+        if not checks:
+            return _valid
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value: Any) -> str | None:
+            for check in checks:
+                error = check(value)
+                if error:
+                    return error
+            return None
+        return check_all
+
+    def _compile_object(self, schema: dict) -> Validator:
+        required = tuple(schema.get("required", ()))
+        properties = {
+            name: self.compile(prop) for name, prop in schema.get("properties", {}).items()
+        }
+
+        def check_object(value: Any) -> str | None:
+            if not isinstance(value, dict):
+                return None  # reported by the type check
+            for name in required:
+                if name not in value:
+                    return f"missing required property '{name}'"
+            for name, validator in properties.items():
+                if name in value:
+                    error = validator(value[name])
+                    if error:
+                        return f"{name}: {error}"
+            return None
+        return check_object
+
+
+def check_pagination(body: Any) -> str | None:
+    """Check the invariants of an ``{items, pagination}`` list response."""
+    if not isinstance(body, dict) or not isinstance(body.get("pagination"), dict):
+        return None
+    pagination = body["pagination"]
+    items = body.get("items")
+    total = pagination.get("total")
+    page = pagination.get("page")
+    size = pagination.get("limit", pagination.get("pageSize"))
+    if not all(isinstance(v, int) for v in (total, page, size)) or not isinstance(items, list):
+        return None
+
+    if size <= 0:
+        return f"page size {size} is not positive"
+
+    # Only invariants that hold under concurrent writes; the exact item count
+    # of a page can legitimately drift between the COUNT and the SELECT
+    if len(items) > size:
+        return f"{len(items)} items exceed page size {size}"
+    if "totalPages" in pagination and pagination["totalPages"] != math.ceil(total / size):
+        return f"totalPages {pagination['totalPages']} does not match total {total}"
+    if "hasMore" in pagination and pagination["hasMore"] != (page * size < total):
+        return f"hasMore {pagination['hasMore']} does not match total {total}"
+    return None
+
+
+class CompiledContract:
+    """Response validators for every documented operation and status code."""
+
+    def __init__(self, spec: dict):
+        compiler = SchemaCompiler(spec)
+        self.routes: list[tuple[str, re.Pattern, str, dict[int, Validator]]] = []
+
+        for path, path_item in spec.get("paths", {}).items():
+            pattern = re.compile("^" + re.sub(r"\\{[^}]+\\}", "[^/]+", re.escape(path)) + "$")
+            for method, definition in path_item.items():
+                if not isinstance(definition, dict) or "responses" not in definition:
+                    continue
+                validators = {}
+                for code, response in definition["responses"].items():
+                    if not code.isdigit():
+                        continue
+                    if "$ref" in response:
+                        response = resolve_ref(spec, response["$ref"])
+                    schema = response.get("content", {}).get("application/json", {}).get("schema")
+                    if schema is not None:
+                        validators[int(code)] = compiler.compile(schema)
+                name = definition.get("operationId") or f"{method.upper()} {path}"
+                self.routes.append((method.upper(), pattern, name, validators))
+
+        # Literal segments win: /feedback/stats before /feedback/{id}. The sort
+        # is stable, so paths with as many templates keep their spec order.
+        self.routes.sort(key=lambda route: route[1].pattern.count("[^/]+"))
+
+    def match(self, method: str, path: str) -> tuple[str, dict[int, Validator]] | None:
+        for route_method, pattern, name, validators in self.routes:
+            if route_method == method and pattern.match(path):
+                return name, validators
+        return None
+
+    def validate(self, method: str, path: str, status: int, content: bytes) -> tuple[str, str | None]:
+        """
+        Validate one response.
+
+        Returns:
+            (operation name, error or None)
+        """
+        route = self.match(method, path)
+        if route is None:
+            return f"{method} {path}", "undocumented operation"
+        name, validators = route
+
+        validator = validators.get(status)
+        if validator is None:
+            if status >= 500 or (validators and status not in validators and status < 400):
+                return name, f"undocumented status {status}"
+            return name, None
+
+        try:
+            body = loads(content) if content else None
+        except ValueError:
+            return name, "body is not valid JSON"
+
+        error = validator(body)
+        if error is None and 200 <= status < 300:
+            error = check_pagination(body)
+        return name, error
+
+
+class ContractSampler:
+    """
+    Validate a sample of load-test responses against a compiled contract.
+
+    Pass an instance as ``on_response`` to ``LoadGenerator``.
+    """
+
+    def __init__(self, contract: CompiledContract, sample_rate: float = 0.1):
+        self.contract = contract
+        self.sample_rate = sample_rate
+        self.checked: Counter = Counter()
+        self.violations: Counter = Counter()
+        self.examples: dict[str, list[str]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __call__(self, operation: Any, response: requests.Response, latency: float) -> None:
+        if random.random() >= self.sample_rate:
+            return
+
+        request = response.request
+        path = requests.utils.urlparse(request.url).path
+        name, error = self.contract.validate(
+            request.method, path, response.status_code, response.content
+        )
+        with self._lock:
+            self.checked[name] += 1
+            if error:
+                self.violations[name] += 1
+                if len(self.examples[name]) < MAX_EXAMPLES:
+                    self.examples[name].append(f"{response.status_code}: {error}")
+
+    def report_rows(self) -> list[list]:
+        """Rows of operation, checked, violations and example errors."""
+        return [
+            [name, checked, self.violations[name], "; ".join(self.examples.get(name, []))]
+            for name, checked in sorted(self.checked.items())
+        ]
@@ -0,0 +1,311 @@
+"""Live terminal dashboard for stack startup and load runs.
+
+With ``BDD_DASHBOARD=true`` the harness draws a ``rich`` live view on the
+controlling terminal while a slow phase runs:
+
+- ``StartupView``: per-service container state (from the Docker events
+  watcher) and health check result while ``task up`` and the health wait run.
+- ``LoadView``: per-second throughput, latency percentiles and error rate of
+  a ``LoadGenerator`` or ``LoadPool``, a throughput sparkline, and the
+  feedback-server container's CPU and memory.
+
+The view is written to ``/dev/tty``, past pytest's output capture. Rendering
+runs in rich's refresh thread at ``refresh_per_second``; the load figures
+are sampled once per ``interval``. The workers only ever hand over counters
+they already keep, so the dashboard costs the load engines nothing per
+request. A disabled ``Dashboard`` (the default, or when there is no terminal)
+returns views whose methods do nothing.
+"""
+
+import threading
+import time
+from collections import deque
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+from helpers.container_stats import ContainerStats
+from helpers.docker_events import ContainerStateWatcher
+from helpers.load import LoadGenerator
+from helpers.load_pool import PoolTick
+from helpers.stats import summarize
+
+# Seconds of history in the throughput sparkline
+HISTORY = 60
+
+SPARK = "▁▂▃▄▅▆▇█"
+
+# Health check outcomes and their colours
+HEALTH_STYLES = {"healthy": "green", "waiting": "dim", "unreachable": "red"}
+
+
+def sparkline(values: list[float]) -> str:
+    """One block character per value, scaled to the largest value."""
+    top = max(values, default=0.0)
+    if not top:
+        return SPARK[0] * len(values)
+    return "".join(SPARK[min(len(SPARK) - 1, int(v / top * len(SPARK)))] for v in values)
+
+
+class Dashboard:
+    """
+    Factory for live views on one terminal, one view at a time.
+
+    Usage:
+        dashboard = Dashboard.open(refresh_per_second=2)
+        with dashboard.load("mixed workload", generator, stats):
+            result = generator.run(30)
+    """
+
+    def __init__(self, console: Console | None = None, refresh_per_second: float = 2.0):
+        self.console = console
+        self.refresh_per_second = refresh_per_second
+        self._tty = None
+
+    @classmethod
+    def open(cls, refresh_per_second: float = 2.0, path: str = "/dev/tty") -> "Dashboard":
+        """Dashboard on the controlling terminal; disabled when there is none."""
+        try:
+            tty = open(path, "w")
+        except OSError:
+            return cls()
+        dashboard = cls(Console(file=tty), refresh_per_second)
+        dashboard._tty = tty
+        return dashboard
+
+    @property
+    def enabled(self) -> bool:
+        return self.console is not None
+
+    def startup(
+        self,
+        endpoints: dict[str, str],
+        watcher: ContainerStateWatcher | None = None
+    ) -> "StartupView":
+        return StartupView(self, endpoints, watcher)
+
+    def load(
+        self,
+        title: str,
+        generator: LoadGenerator | None = None,
+        stats: ContainerStats | None = None,
+        interval: float = 1.0
+    ) -> "LoadView":
+        return LoadView(self, title, generator, stats, interval)
+
+    def close(self) -> None:
+        if self._tty is not None:
+            self._tty.close()
+            self._tty = None
+        self.console = None
+
+
+class _View:
+    """A live region drawn while the view is started; a no-op when disabled."""
+
+    def __init__(self, dashboard: Dashboard):
+        self.dashboard = dashboard
+        self._lock = threading.Lock()
+        self._live: Live | None = None
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        if self.dashboard.enabled and self._live is None:
+            self._live = Live(
+                console=self.dashboard.console,
+                get_renderable=self._render,
+                refresh_per_second=self.dashboard.refresh_per_second,
+                redirect_stdout=False,
+                redirect_stderr=False,
+            )
+            self._live.start()
+        return self
+
+    def stop(self) -> None:
+        if self._live is not None:
+            # Leave the final frame on screen
+            self._live.stop()
+            self._live = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def _render(self):
+        with self._lock:
+            return self.render()
+
+    def render(self):
+        raise NotImplementedError
+
+
+class StartupView(_View):
+    """
+    Per-service container state and health check result during startup.
+
+    Usage:
+        with dashboard.startup(HEALTH_ENDPOINTS, container_watcher) as view:
+            view.phase("task up")
+            ...
+            wait_for_services(timeout=180, on_status=view.update)
+    """
+
+    def __init__(
+        self,
+        dashboard: Dashboard,
+        endpoints: dict[str, str],
+        watcher: ContainerStateWatcher | None = None
+    ):
+        super().__init__(dashboard)
+        self.watcher = watcher
+        self._phase = "starting"
+        # Service name -> (health check result, time it was first seen)
+        self._health = {name: ("waiting", 0.0) for name in endpoints}
+
+    def phase(self, name: str) -> None:
+        with self._lock:
+            self._phase = name
+
+    def update(self, service: str, status: str) -> None:
+        """Health check callback for ``wait_for_services``."""
+        with self._lock:
+            if self._health.get(service, ("",))[0] != status:
+                self._health[service] = (status, self.elapsed)
+
+    def render(self) -> Table:
+        containers = {}
+        if self.watcher is not None:
+            for info in self.watcher.snapshot().values():
+                containers[info["service"]] = info
+
+        table = Table(title=f"Starting stack: {self._phase} ({self.elapsed:.0f}s)", title_justify="left")
+        for column in ("service", "container", "container health", "health check", "since (s)"):
+            table.add_column(column, justify="right" if column == "since (s)" else "left")
+        for name in sorted(set(containers) | set(self._health)):
+            container = containers.get(name, {})
+            status, since = self._health.get(name, ("-", None))
+            style = HEALTH_STYLES.get(status, "yellow")
+            table.add_row(
+                name, container.get("state", "-"), container.get("health", "-"),
+                Text(status, style=style if status != "-" else "dim"),
+                f"{since:.0f}" if since is not None else "-",
+            )
+        return table
+
+
+class LoadView(_View):
+    """
+    Rolling throughput, latency, error rate and server resources of a load run.
+
+    A ``LoadGenerator`` is polled once per interval; a ``LoadPool`` pushes its
+    merged ticks through ``tick``.
+
+    Usage:
+        with dashboard.load("process pool", stats=server_stats) as view:
+            result = pool.run(30, on_tick=view.tick)
+    """
+
+    def __init__(
+        self,
+        dashboard: Dashboard,
+        title: str,
+        generator: LoadGenerator | None = None,
+        stats: ContainerStats | None = None,
+        interval: float = 1.0
+    ):
+        super().__init__(dashboard)
+        self.title = title
+        self.generator = generator
+        self.stats = stats
+        self.interval = interval
+        self._ticks: deque[PoolTick] = deque(maxlen=HISTORY)
+        self._requests = 0
+        self._failures = 0
+        self._cpu: float | None = None
+        self._memory: int | None = None
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def start(self) -> "LoadView":
+        super().start()
+        if self.dashboard.enabled and (self.generator is not None or self.stats is not None):
+            self._stop.clear()
+            self._sampler = threading.Thread(target=self._sample, name="dashboard", daemon=True)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        super().stop()
+
+    def tick(self, tick: PoolTick) -> None:
+        """Add one interval's figures (the ``LoadPool`` ``on_tick`` callback)."""
+        if not self.dashboard.enabled:
+            return
+        with self._lock:
+            self._ticks.append(tick)
+            self._requests += tick.requests
+            self._failures += tick.errors + tick.unexpected
+
+    def _sample(self) -> None:
+        last = time.perf_counter()
+        cpu_before = self._read("cpu_seconds")
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            if self.generator is not None:
+                samples, errors, unexpected = self.generator.progress()
+                self.tick(PoolTick(
+                    elapsed=self.elapsed,
+                    requests=len(samples) + errors,
+                    errors=errors,
+                    throughput=(len(samples) + errors) / (now - last),
+                    latency=summarize(samples),
+                    unexpected=unexpected,
+                ))
+            cpu = self._read("cpu_seconds")
+            memory = self._read("memory_bytes")
+            with self._lock:
+                if cpu is not None and cpu_before is not None:
+                    self._cpu = (cpu - cpu_before) / (now - last)
+                self._memory = memory
+            cpu_before, last = cpu, now
+
+    def _read(self, reading: str):
+        if self.stats is None:
+            return None
+        try:
+            return getattr(self.stats, reading)()
+        except Exception:
+            return None  # A stats call can fail while the container restarts
+
+    def render(self) -> Group:
+        latest = self._ticks[-1] if self._ticks else None
+        table = Table(title=f"{self.title} ({self.elapsed:.0f}s)", title_justify="left")
+        for column in ("req/s", "p50 (ms)", "p90 (ms)", "p99 (ms)", "errors", "requests",
+                       "server CPU (cores)", "server memory (MiB)"):
+            table.add_column(column, justify="right")
+        if latest is not None:
+            errors = (latest.errors + latest.unexpected) / latest.requests if latest.requests else 0.0
+            table.add_row(
+                f"{latest.throughput:.0f}", f"{latest.latency['p50']:.1f}",
+                f"{latest.latency['p90']:.1f}", f"{latest.latency['p99']:.1f}",
+                Text(f"{errors:.1%}", style="red" if errors else ""),
+                f"{self._requests}",
+                f"{self._cpu:.2f}" if self._cpu is not None else "-",
+                f"{self._memory / 1024 / 1024:.0f}" if self._memory is not None else "-",
+            )
+        history = [tick.throughput for tick in self._ticks]
+        peak = max(history, default=0.0)
+        return Group(table, Text(f"req/s, last {HISTORY}s (peak {peak:.0f}): {sparkline(history)}"))
@@ -0,0 +1,255 @@
+"""Event-driven container state tracking for the compose project.
+
+Instead of repeatedly spawning ``docker compose ps``, the watcher subscribes
+once to the Docker events API, filtered by the compose project label, and
+keeps an in-memory table of container state and health. Steps can then block
+on predicates such as "all healthy" or "all stopped" and are woken up the
+moment the daemon reports the transition.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+import yaml
+
+# Compose project name (the top-level ``name:`` in docker-compose.yml)
+COMPOSE_PROJECT = "react-visual-feedback"
+
+PROJECT_LABEL = "com.docker.compose.project"
+SERVICE_LABEL = "com.docker.compose.service"
+
+# Container event actions mapped to the resulting container state
+STATE_TRANSITIONS = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}
+
+Snapshot = dict[str, dict[str, str]]
+Predicate = Callable[[Snapshot], bool]
+
+
+def compose_services(repo_root: Path) -> list[str]:
+    """Return the service names declared in the repository's docker-compose.yml."""
+    compose_path = repo_root / "docker-compose.yml"
+    if not compose_path.exists():
+        return []
+
+    with open(compose_path) as f:
+        compose = yaml.safe_load(f) or {}
+
+    return list(compose.get("services", {}).keys())
+
+
+def _by_service(snapshot: Snapshot) -> dict[str, dict[str, str]]:
+    return {info["service"]: info for info in snapshot.values()}
+
+
+def all_running(services: Iterable[str]) -> Predicate:
+    """Predicate: every given service has a running container."""
+    services = list(services)
+
+    def _predicate(snapshot: Snapshot) -> bool:
+        by_service = _by_service(snapshot)
+        return all(
+            by_service.get(name, {}).get("state") == "running"
+            for name in services
+        )
+    return _predicate
+
+
+def all_healthy(services: Iterable[str]) -> Predicate:
+    """Predicate: every given service is running and passing its healthcheck.
+
+    Services without a healthcheck (health ``N/A``) count as healthy once running.
+    """
+    services = list(services)
+
+    def _predicate(snapshot: Snapshot) -> bool:
+        by_service = _by_service(snapshot)
+        for name in services:
+            info = by_service.get(name)
+            if info is None or info["state"] != "running":
+                return False
+            if info["health"] not in ("healthy", "N/A"):
+                return False
+        return True
+    return _predicate
+
+
+def all_stopped() -> Predicate:
+    """Predicate: no container of the project is running, paused or restarting."""
+    def _predicate(snapshot: Snapshot) -> bool:
+        return all(
+            info["state"] not in ("running", "paused", "restarting")
+            for info in snapshot.values()
+        )
+    return _predicate
+
+
+class ContainerStateWatcher:
+    """
+    Track container state and health from the Docker events stream.
+
+    The table maps container name to ``{"state", "health", "service"}``, the
+    same shape returned by ``get_container_status()``.
+
+    Usage:
+        watcher = ContainerStateWatcher()
+        watcher.start()
+        watcher.wait_for(all_healthy(["postgres", "feedback-server"]), timeout=120)
+        watcher.stop()
+    """
+
+    def __init__(self, project: str = COMPOSE_PROJECT):
+        self.project = project
+        self._client = None
+        self._events = None
+        self._thread: threading.Thread | None = None
+        self._table: Snapshot = {}
+        # Container id -> whether it defines a healthcheck (inspected once)
+        self._healthchecks: dict[str, bool] = {}
+        self._condition = threading.Condition()
+
+    def start(self) -> "ContainerStateWatcher":
+        """Seed the state table and subscribe to the events stream.
+
+        Raises:
+            docker.errors.DockerException: If the daemon is not reachable
+        """
+        import docker
+
+        self._client = docker.from_env()
+        label_filter = f"{PROJECT_LABEL}={self.project}"
+
+        # Subscribe from a point in time before seeding, so transitions that
+        # happen while listing containers are replayed rather than lost.
+        since = int(time.time())
+        self._seed(label_filter)
+        self._events = self._client.events(
+            decode=True,
+            since=since,
+            filters={"type": "container", "label": label_filter},
+        )
+
+        self._thread = threading.Thread(
+            target=self._consume, name="docker-events", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Close the events stream and release the client."""
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def snapshot(self) -> Snapshot:
+        """Return a copy of the current state table."""
+        with self._condition:
+            return {name: dict(info) for name, info in self._table.items()}
+
+    def wait_for(self, predicate: Predicate, timeout: float) -> bool:
+        """
+        Block until the predicate holds for the state table.
+
+        Args:
+            predicate: Callable receiving a snapshot of the state table
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the predicate was satisfied, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: predicate(self._table), timeout=timeout
+            )
+
+    def _seed(self, label_filter: str) -> None:
+        containers = self._client.containers.list(
+            all=True, filters={"label": label_filter}
+        )
+        with self._condition:
+            for container in containers:
+                attrs = container.attrs
+                state = attrs.get("State", {})
+                health = state.get("Health", {}).get("Status", "N/A")
+                self._table[container.name] = {
+                    "state": state.get("Status", "unknown"),
+                    "health": health,
+                    "service": container.labels.get(SERVICE_LABEL, container.name),
+                }
+            self._condition.notify_all()
+
+    def _has_healthcheck(self, container_id: str) -> bool:
+        try:
+            attrs = self._client.api.inspect_container(container_id)
+        except Exception:
+            return False
+        return bool(attrs.get("Config", {}).get("Healthcheck"))
+
+    def _consume(self) -> None:
+        try:
+            for event in self._events:
+                self._apply(event)
+        except Exception:
+            # Stream closed by stop() or daemon went away
+            pass
+
+    def _apply(self, event: dict) -> None:
+        action = event.get("Action") or event.get("status", "")
+        actor = event.get("Actor", {})
+        attributes = actor.get("Attributes", {})
+        name = attributes.get("name")
+        if not name:
+            return
+
+        # Inspect before waiters are notified: a container with a healthcheck
+        # must never show "N/A", which "all healthy" accepts, after a start.
+        started = action in ("start", "restart")
+        container_id = actor.get("ID") or event.get("id") or name
+        healthcheck = False
+        if started:
+            healthcheck = self._healthchecks.get(container_id)
+            if healthcheck is None:
+                healthcheck = self._healthchecks[container_id] = self._has_healthcheck(container_id)
+
+        with self._condition:
+            if action == "destroy":
+                self._table.pop(name, None)
+                self._healthchecks.pop(container_id, None)
+                self._condition.notify_all()
+                return
+
+            info = self._table.setdefault(name, {
+                "state": "unknown",
+                "health": "N/A",
+                "service": attributes.get(SERVICE_LABEL, name),
+            })
+
+            if action.startswith("health_status"):
+                # e.g. "health_status: healthy"
+                info["health"] = action.split(":", 1)[1].strip()
+            elif action in STATE_TRANSITIONS:
+                info["state"] = STATE_TRANSITIONS[action]
+            else:
+                return
+
+            # The daemon resets health to "starting" on (re)start without
+            # emitting an event, so mirror that here.
+            if started and (healthcheck or info["health"] != "N/A"):
+                info["health"] = "starting"
+
+            self._condition.notify_all()
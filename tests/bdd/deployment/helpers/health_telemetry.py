@@ -0,0 +1,163 @@
+"""Background collector for component health telemetry.
+
+Polls ``/api/v1/health/detailed`` at a fixed interval and keeps a compact,
+array-backed time series of each component's ``responseTime`` and status.
+Degraded periods (unhealthy status, slow component or unreachable endpoint)
+are derived from the series after the scenario.
+
+Polls before the endpoint first answers are discarded, so the time the stack
+takes to come up is not counted as degraded. Later unreachable polls are
+recorded as missing samples (NaN): they mark a degraded period but do not
+enter the responseTime percentiles.
+"""
+
+import math
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+
+import requests
+
+from helpers.stats import percentile
+
+# Pseudo-component recording whether the detailed endpoint itself answered
+ENDPOINT_COMPONENT = "endpoint"
+
+
+@dataclass
+class ComponentSeries:
+    """Time series of one component: timestamps, responseTime (ms, NaN if missing), degraded flag."""
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    response_times: array = field(default_factory=lambda: array("d"))
+    degraded: array = field(default_factory=lambda: array("B"))
+
+    def append(self, timestamp: float, response_time: float, degraded: bool) -> None:
+        self.timestamps.append(timestamp)
+        self.response_times.append(response_time)
+        self.degraded.append(1 if degraded else 0)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def measured(self) -> list[float]:
+        """Response times of the samples that were not missing."""
+        return [t for t in self.response_times if not math.isnan(t)]
+
+    def missing(self) -> int:
+        return len(self) - len(self.measured())
+
+    def percentile(self, q: float) -> float:
+        return percentile(sorted(self.measured()), q)
+
+    def degraded_periods(self) -> list[tuple[float, float]]:
+        """Return (start, end) offsets in seconds of consecutive degraded samples."""
+        periods = []
+        start = None
+        for i, flag in enumerate(self.degraded):
+            if flag and start is None:
+                start = self.timestamps[i]
+            elif not flag and start is not None:
+                periods.append((start, self.timestamps[i]))
+                start = None
+        if start is not None:
+            periods.append((start, self.timestamps[-1]))
+        return periods
+
+
+class HealthTelemetryCollector:
+    """
+    Poll the detailed health endpoint in a background thread.
+
+    Usage:
+        collector = HealthTelemetryCollector(url, interval=1.0).start()
+        ...
+        collector.stop()
+        collector.series["database"].percentile(99)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        interval: float = 1.0,
+        timeout: float = 5.0,
+        degraded_ms: float = 250.0
+    ):
+        self.url = url
+        self.interval = interval
+        self.timeout = timeout
+        self.degraded_ms = degraded_ms
+        self.series: dict[str, ComponentSeries] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> "HealthTelemetryCollector":
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._poll, name="health-telemetry", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 5)
+            self._thread = None
+
+    def has_samples(self) -> bool:
+        """True if the endpoint answered at least once."""
+        endpoint = self.series.get(ENDPOINT_COMPONENT)
+        return endpoint is not None and 0 in endpoint.degraded
+
+    def report_rows(self) -> list[list]:
+        """Rows of component, samples, missing, p50, p99, max, degraded periods and seconds."""
+        rows = []
+        for name, series in self.series.items():
+            periods = series.degraded_periods()
+            rows.append([
+                name,
+                len(series),
+                series.missing(),
+                series.percentile(50),
+                series.percentile(99),
+                max(series.measured(), default=0.0),
+                len(periods),
+                sum(end - start for start, end in periods),
+            ])
+        return rows
+
+    def _record(self, name: str, timestamp: float, response_time: float, degraded: bool) -> None:
+        self.series.setdefault(name, ComponentSeries()).append(timestamp, response_time, degraded)
+
+    def _poll(self) -> None:
+        session = requests.Session()
+        next_poll = time.perf_counter()
+        reached = False
+
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            timestamp = start - self._started
+            try:
+                response = session.get(self.url, timeout=self.timeout)
+                elapsed = (time.perf_counter() - start) * 1000
+                # 503 still carries the component breakdown
+                components = response.json().get("components", [])
+                reached = True
+                self._record(ENDPOINT_COMPONENT, timestamp, elapsed, response.status_code >= 500)
+                for component in components:
+                    response_time = float(component.get("responseTime") or 0.0)
+                    degraded = (
+                        component.get("status") != "healthy"
+                        or response_time > self.degraded_ms
+                    )
+                    self._record(component.get("name", "unknown"), timestamp, response_time, degraded)
+            except (requests.exceptions.RequestException, ValueError):
+                if reached:
+                    self._record(ENDPOINT_COMPONENT, timestamp, math.nan, True)
+
+            next_poll += self.interval
+            self._stop.wait(max(0.0, next_poll - time.perf_counter()))
+
+        session.close()
@@ -0,0 +1,162 @@
+"""Mergeable log-linear latency histogram.
+
+Values are recorded in microseconds into a fixed array of buckets: exact
+below ``2**precision_bits``, then ``2**precision_bits`` linear sub-buckets
+per power of two. The relative error of any quantile is below
+``2**-precision_bits`` (about 3% at the default of 5 bits). Recording is
+O(1) with no allocation. Histograms with the same layout merge by adding
+their arrays, so per-worker or per-window histograms can be combined
+without keeping raw samples. The bucket array can also be a caller-owned
+buffer, such as a view into shared memory written by another process.
+"""
+
+from array import array
+
+from helpers.stats import REPORT_PERCENTILES
+
+# Largest recordable value; larger values are clamped into the last bucket
+DEFAULT_MAX_SECONDS = 120.0
+
+
+class LogLinearHistogram:
+    """
+    Fixed-size latency histogram with bounded relative error.
+
+    Usage:
+        histogram = LogLinearHistogram()
+        histogram.record(0.012)
+        histogram.percentile(99)    # seconds
+    """
+
+    def __init__(
+        self,
+        precision_bits: int = 5,
+        max_seconds: float = DEFAULT_MAX_SECONDS,
+        counts=None
+    ):
+        self.precision_bits = precision_bits
+        self.sub_buckets = 1 << precision_bits
+        self.max_value = int(max_seconds * 1_000_000)
+        size = self._index(self.max_value) + 1
+        if counts is not None and len(counts) != size:
+            raise ValueError(f"Expected {size} buckets, got {len(counts)}")
+        # Any mutable sequence of unsigned 64-bit counts, e.g. a shared-memory view
+        self.counts = counts if counts is not None else array("Q", bytes(8 * size))
+        self.total = 0
+        self.min_value = 0
+        self.max_seen = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_buckets:
+            return value
+        shift = value.bit_length() - 1 - self.precision_bits
+        return shift * self.sub_buckets + (value >> shift)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Lowest and highest value (microseconds) of a bucket."""
+        if index < self.sub_buckets:
+            return index, index
+        shift = index // self.sub_buckets - 1
+        sub = index - shift * self.sub_buckets
+        return sub << shift, ((sub + 1) << shift) - 1
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Record a duration in seconds."""
+        value = min(max(int(seconds * 1_000_000), 0), self.max_value)
+        self.counts[self._index(value)] += count
+        if not self.total or value < self.min_value:
+            self.min_value = value
+        self.max_seen = max(self.max_seen, value)
+        self.total += count
+
+    def merge(self, other: "LogLinearHistogram") -> "LogLinearHistogram":
+        """Add another histogram's counts into this one and return self."""
+        if (other.precision_bits, other.max_value) != (self.precision_bits, self.max_value):
+            raise ValueError("Cannot merge histograms with different layouts")
+        if not other.total:
+            return self
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.min_value = min(self.min_value, other.min_value) if self.total else other.min_value
+        self.max_seen = max(self.max_seen, other.max_seen)
+        self.total += other.total
+        return self
+
+    def since(self, earlier: "LogLinearHistogram") -> "LogLinearHistogram":
+        """
+        Counts recorded after ``earlier``, a past copy of this histogram.
+
+        Min and max are not kept per window, so the window's percentiles are
+        clamped to this histogram's overall range.
+        """
+        return LogLinearHistogram.from_counts(
+            array("Q", (max(0, now - then) for now, then in zip(self.counts, earlier.counts))),
+            self.min_value, self.max_seen, self.precision_bits, self.max_value / 1_000_000,
+        )
+
+    def __len__(self) -> int:
+        return self.total
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the q-th percentile (nearest-rank) in seconds.
+
+        The value is the midpoint of the bucket holding that rank, clamped
+        to the recorded min and max. Returns 0.0 for an empty histogram.
+        """
+        if not self.total:
+            return 0.0
+        rank = max(1, -(-self.total * q // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = self._bounds(index)
+                value = min(max((low + high) / 2, self.min_value), self.max_seen)
+                return value / 1_000_000
+        return self.max_seen / 1_000_000
+
+    def summary(self) -> dict[str, float]:
+        """Count, percentiles and max in milliseconds, like ``stats.summarize``."""
+        summary: dict[str, float] = {"count": self.total}
+        for q in REPORT_PERCENTILES:
+            summary[f"p{q}"] = self.percentile(q) * 1000
+        summary["max"] = self.max_seen / 1000
+        return summary
+
+    def to_dict(self) -> dict:
+        """Sparse, JSON-serializable form (non-empty buckets only)."""
+        return {
+            "precision_bits": self.precision_bits,
+            "max_seconds": self.max_value / 1_000_000,
+            "min": self.min_value,
+            "max": self.max_seen,
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+        }
+
+    @classmethod
+    def from_counts(
+        cls,
+        counts,
+        min_value: int,
+        max_value: int,
+        precision_bits: int = 5,
+        max_seconds: float = DEFAULT_MAX_SECONDS
+    ) -> "LogLinearHistogram":
+        """Histogram over a copy of ``counts`` with a known min and max (microseconds)."""
+        histogram = cls(precision_bits, max_seconds, counts=array("Q", counts))
+        histogram.total = sum(histogram.counts)
+        histogram.min_value = min_value
+        histogram.max_seen = max_value
+        return histogram
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogLinearHistogram":
+        histogram = cls(data["precision_bits"], data["max_seconds"])
+        for index, count in data["buckets"].items():
+            histogram.counts[int(index)] = count
+            histogram.total += count
+        histogram.min_value = data["min"]
+        histogram.max_seen = data["max"]
+        return histogram
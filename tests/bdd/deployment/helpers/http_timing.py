@@ -0,0 +1,176 @@
+"""Pooled, instrumented HTTP client for step definitions.
+
+``InstrumentedSession`` is a ``requests.Session`` that keeps connections alive
+across scenarios, applies a real default timeout and a bounded retry policy,
+and records connect time, time to first byte and total time of every request
+under the label of the scenario that issued it. Each request carries a fresh
+``X-Request-ID`` and ``traceparent`` (see ``helpers.tracing``).
+"""
+
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from helpers.tracing import trace_headers
+
+# (connect, read) timeout used when a step does not pass one
+DEFAULT_TIMEOUT = (3.05, 10.0)
+
+# Label for requests issued outside a scenario
+UNSCOPED = "unscoped"
+
+# Connect time of the request in flight on the current thread
+_connect_time = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        _connect_time.value = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        start = time.perf_counter()
+        super().connect()
+        _connect_time.value = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+@dataclass
+class RequestTiming:
+    """Timing of one request; connect is 0 when a pooled connection was reused."""
+
+    method: str
+    path: str
+    status: int | None
+    connect: float
+    ttfb: float
+    total: float
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Sized connection pool with a default timeout and timed connects."""
+
+    def __init__(self, timeout: tuple[float, float] = DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+
+def default_retry() -> Retry:
+    """
+    Retry connection failures and stale keep-alive connections, never statuses.
+
+    Status codes are left alone so steps still observe 503 from readiness
+    checks and 429 from the rate limiter.
+    """
+    return Retry(total=2, connect=2, read=1, status=0, other=0, backoff_factor=0.1)
+
+
+class InstrumentedSession(requests.Session):
+    """
+    Keep-alive session that records per-request timings per scenario.
+
+    Usage:
+        session = InstrumentedSession()
+        session.scenario = "test_health_endpoint"
+        session.get(url)
+        session.timings["test_health_endpoint"][0].ttfb
+    """
+
+    def __init__(
+        self,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+    ):
+        super().__init__()
+        adapter = TimedHTTPAdapter(
+            timeout=timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=default_retry(),
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        self.scenario = UNSCOPED
+        self.timings: dict[str, list[RequestTiming]] = defaultdict(list)
+
+    def request(self, method, url, *args, **kwargs):
+        # Fresh request id per call; explicit headers of the caller win
+        kwargs["headers"] = {**trace_headers(), **(kwargs.get("headers") or {})}
+        _connect_time.value = 0.0
+        start = time.perf_counter()
+        status = None
+        ttfb = 0.0
+        try:
+            # Session.request reads the body unless stream=True
+            response = super().request(method, url, *args, **kwargs)
+            status = response.status_code
+            ttfb = response.elapsed.total_seconds()
+            return response
+        finally:
+            self.timings[self.scenario].append(RequestTiming(
+                method=method.upper(),
+                path=urlsplit(url).path,
+                status=status,
+                connect=_connect_time.value,
+                ttfb=ttfb,
+                total=time.perf_counter() - start,
+            ))
+
+    def pop_timings(self, scenario: str) -> list[RequestTiming]:
+        """Remove and return the timings recorded for a scenario."""
+        return self.timings.pop(scenario, [])
+
+
+def timing_rows(timings: list[RequestTiming]) -> list[list]:
+    """
+    Rows of request, count, new connections and connect/TTFB/total in ms.
+
+    Requests are grouped by method and path; times are means, with the
+    slowest total alongside.
+    """
+    groups: dict[str, list[RequestTiming]] = defaultdict(list)
+    for timing in timings:
+        groups[f"{timing.method} {timing.path}"].append(timing)
+
+    rows = []
+    for name, group in groups.items():
+        count = len(group)
+        rows.append([
+            name,
+            count,
+            sum(1 for t in group if t.connect),
+            sum(t.connect for t in group) / count * 1000,
+            sum(t.ttfb for t in group) / count * 1000,
+            sum(t.total for t in group) / count * 1000,
+            max(t.total for t in group) * 1000,
+        ])
+    return rows
@@ -0,0 +1,326 @@
+"""Closed-loop HTTP load generator for benchmark scenarios.
+
+Each worker thread owns a ``requests.Session`` and issues operations picked
+from a weighted mix until the run is stopped. Samples are kept per worker and
+merged when the run ends, so recording adds no lock contention.
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+import requests
+
+from helpers.stats import summarize
+from helpers.tracing import trace_headers
+
+
+@dataclass
+class Operation:
+    """A request template in a workload mix."""
+
+    name: str
+    method: str
+    path: str
+    weight: int = 1
+    params: dict | None = None
+    # JSON body, or a callable returning a fresh body per request (picklable for LoadPool)
+    body: Any = None
+    expected: tuple[int, ...] = (200, 201)
+
+    def json_body(self) -> Any:
+        return self.body() if callable(self.body) else self.body
+
+
+@dataclass
+class LoadResult:
+    """Latency samples and outcome counters of a load run."""
+
+    samples: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    errors: dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    unexpected: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    def merge(self, other: "LoadResult") -> None:
+        for name, values in other.samples.items():
+            self.samples[name].extend(values)
+        for name, counter in other.statuses.items():
+            self.statuses[name].update(counter)
+        for name, counter in other.errors.items():
+            self.errors[name].update(counter)
+        self.unexpected.update(other.unexpected)
+
+    @property
+    def total_requests(self) -> int:
+        completed = sum(len(v) for v in self.samples.values())
+        failed = sum(sum(c.values()) for c in self.errors.values())
+        return completed + failed
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the whole run."""
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of requests that raised or returned an unexpected status."""
+        if not self.total_requests:
+            return 0.0
+        failed = sum(sum(c.values()) for c in self.errors.values())
+        return (failed + sum(self.unexpected.values())) / self.total_requests
+
+    def summary(self, name: str) -> dict[str, float]:
+        return summarize(self.samples.get(name, []))
+
+    def all_samples(self) -> list[float]:
+        return [s for values in self.samples.values() for s in values]
+
+
+def combine_hooks(*hooks: Callable | None) -> Callable | None:
+    """Combine optional ``on_response`` hooks into one (None if there are none)."""
+    active = [hook for hook in hooks if hook is not None]
+    if len(active) <= 1:
+        return active[0] if active else None
+
+    def _hook(op: Operation, response: requests.Response, latency: float) -> None:
+        for hook in active:
+            hook(op, response, latency)
+    return _hook
+
+
+def feedback_payload(project_id: str = "bdd-load") -> dict:
+    """Return a minimal valid body for POST /api/v1/feedback."""
+    return {
+        "projectId": project_id,
+        "sessionId": uuid.uuid4().hex,
+        "title": f"Load test feedback {uuid.uuid4().hex[:8]}",
+        "description": "Created by the BDD load generator",
+        "type": "bug",
+        "priority": "medium",
+    }
+
+
+def mixed_workload(project_id: str = "bdd-load") -> list[Operation]:
+    """Read-heavy mix of the feedback-server's main API paths."""
+    return [
+        Operation("list", "GET", "/api/v1/feedback", weight=5,
+                  params={"projectId": project_id, "limit": 20}),
+        Operation("stats", "GET", "/api/v1/feedback/stats", weight=2,
+                  params={"projectId": project_id}),
+        Operation("search", "POST", "/api/v1/feedback/search", weight=2,
+                  body={"query": "load", "projectId": project_id, "pageSize": 20}),
+        Operation("create", "POST", "/api/v1/feedback", weight=1,
+                  body=partial(feedback_payload, project_id)),
+        Operation("health", "GET", "/api/v1/health", weight=1),
+    ]
+
+
+def sync_payload(project_id: str = "bdd-load") -> dict:
+    """Return a POST /api/v1/sync body that creates one feedback item."""
+    return {
+        "clientId": f"bdd-{uuid.uuid4().hex[:8]}",
+        "projectId": project_id,
+        "sessionId": uuid.uuid4().hex,
+        "operations": [{
+            "localId": uuid.uuid4().hex,
+            "operation": "create",
+            "entityType": "feedback",
+            "payload": {
+                "title": f"Synced feedback {uuid.uuid4().hex[:8]}",
+                "type": "bug",
+                "priority": "low",
+            },
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }],
+    }
+
+
+def backend_workload(project_id: str = "bdd-backend") -> list[Operation]:
+    """Create, list, search, stats and sync mix used to compare database backends."""
+    return [
+        Operation("list", "GET", "/api/v1/feedback", weight=4,
+                  params={"projectId": project_id, "limit": 20}),
+        Operation("search", "POST", "/api/v1/feedback/search", weight=2,
+                  body={"query": "seed", "projectId": project_id, "pageSize": 20}),
+        Operation("stats", "GET", "/api/v1/feedback/stats", weight=2,
+                  params={"projectId": project_id}),
+        Operation("create", "POST", "/api/v1/feedback", weight=2,
+                  body=partial(feedback_payload, project_id)),
+        Operation("sync", "POST", "/api/v1/sync", weight=1,
+                  body=partial(sync_payload, project_id)),
+    ]
+
+
+def write_contention_workload(project_id: str = "bdd-backend") -> list[Operation]:
+    """Write-only mix: every worker creates, directly or through sync."""
+    return [
+        Operation("create", "POST", "/api/v1/feedback", weight=3,
+                  body=partial(feedback_payload, project_id)),
+        Operation("sync", "POST", "/api/v1/sync", weight=1,
+                  body=partial(sync_payload, project_id)),
+    ]
+
+
+def seed_feedback(
+    session: requests.Session,
+    base_url: str,
+    count: int,
+    project_id: str = "bdd-backend",
+    batch: int = 500
+) -> int:
+    """
+    Import ``count`` feedback items through the bulk import endpoint.
+
+    Returns:
+        Number of items the server reported as imported
+    """
+    imported = 0
+    for start in range(0, count, batch):
+        items = [
+            {
+                **feedback_payload(project_id),
+                "title": f"Seed feedback {n}",
+                "type": ("bug", "feature", "improvement", "question")[n % 4],
+                "priority": ("low", "medium", "high", "critical")[n % 4],
+                "tags": [f"tag-{n % 10}"],
+            }
+            for n in range(start, min(start + batch, count))
+        ]
+        response = session.post(
+            f"{base_url.rstrip('/')}/api/v1/feedback/import", json={"items": items}, timeout=60
+        )
+        response.raise_for_status()
+        imported += response.json().get("imported", 0)
+    return imported
+
+
+class LoadGenerator:
+    """
+    Drive a weighted operation mix with a fixed number of concurrent workers.
+
+    Usage:
+        generator = LoadGenerator(base_url, mixed_workload(), concurrency=32)
+        generator.start()
+        ...
+        result = generator.stop()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        operations: list[Operation],
+        concurrency: int = 16,
+        timeout: float = 10.0,
+        on_response: Callable[[Operation, requests.Response, float], None] | None = None,
+        on_error: Callable[[Operation, Exception, float], None] | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.operations = operations
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.on_response = on_response
+        self.on_error = on_error
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._results: list[LoadResult] = []
+        self._started = 0.0
+        self._cursors: dict[tuple[int, str], int] = {}
+        self._outcomes = (0, 0)
+
+    def start(self) -> "LoadGenerator":
+        """Start the worker threads."""
+        self._stop.clear()
+        self._results = [LoadResult() for _ in range(self.concurrency)]
+        self._cursors = {}
+        self._outcomes = (0, 0)
+        self._threads = [
+            threading.Thread(
+                target=self._worker, args=(result, random.Random(i)),
+                name=f"load-{i}", daemon=True
+            )
+            for i, result in enumerate(self._results)
+        ]
+        self._started = time.perf_counter()
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> LoadResult:
+        """Stop the workers and return the merged result."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=self.timeout + 5)
+
+        merged = LoadResult(elapsed=time.perf_counter() - self._started)
+        for result in self._results:
+            merged.merge(result)
+        return merged
+
+    def progress(self) -> tuple[list[float], int, int]:
+        """
+        Latency samples and outcome counts recorded since the previous call.
+
+        Reads the workers' results while they run, for live views. Workers
+        only append and increment, so the copies are consistent under the GIL.
+
+        Returns:
+            New latency samples (seconds), requests that raised and requests
+            that returned an unexpected status
+        """
+        samples: list[float] = []
+        errors = unexpected = 0
+        for i, result in enumerate(self._results):
+            for name, values in list(result.samples.items()):
+                seen = self._cursors.get((i, name), 0)
+                new = values[seen:]
+                samples.extend(new)
+                self._cursors[(i, name)] = seen + len(new)
+            errors += sum(sum(counter.values()) for counter in list(result.errors.values()))
+            unexpected += sum(result.unexpected.values())
+        last_errors, last_unexpected = self._outcomes
+        self._outcomes = (errors, unexpected)
+        return samples, errors - last_errors, unexpected - last_unexpected
+
+    def run(self, duration: float) -> LoadResult:
+        """Run the workload for a fixed duration and return the result."""
+        self.start()
+        self._stop.wait(duration)
+        return self.stop()
+
+    def _worker(self, result: LoadResult, rng: random.Random) -> None:
+        session = requests.Session()
+        weights = [op.weight for op in self.operations]
+
+        while not self._stop.is_set():
+            op = rng.choices(self.operations, weights=weights)[0]
+            start = time.perf_counter()
+            try:
+                response = session.request(
+                    op.method,
+                    self.base_url + op.path,
+                    params=op.params,
+                    json=op.json_body(),
+                    headers=trace_headers(),
+                    timeout=self.timeout,
+                )
+            except requests.exceptions.RequestException as e:
+                result.errors[op.name][type(e).__name__] += 1
+                if self.on_error is not None:
+                    self.on_error(op, e, time.perf_counter() - start)
+                continue
+            latency = time.perf_counter() - start
+
+            result.samples[op.name].append(latency)
+            result.statuses[op.name][response.status_code] += 1
+            if response.status_code not in op.expected:
+                result.unexpected[op.name] += 1
+            if self.on_response is not None:
+                self.on_response(op, response, latency)
+
+        session.close()
@@ -0,0 +1,324 @@
+"""Multi-process load generator with shared-memory histograms.
+
+One Python process saturates its own core long before the Bun server does,
+because the GIL serializes request building and response parsing. Past that
+point ``LoadGenerator`` measures the client, not the server. ``LoadPool``
+runs the same weighted operation mix from several worker processes, each
+with a few threads.
+
+Every thread records into its own slot of one shared ``RawArray``. Per
+operation, a slot holds a ``LogLinearHistogram`` bucket array plus min, max,
+error and unexpected-status counters. Each slot has a single writer, so no
+locks are needed. Once per interval the coordinator merges all slots into
+global histograms. That gives percentiles (within the histogram's bucket
+error) and throughput for the whole pool without shipping samples between
+processes. Response hooks cannot cross processes; scenarios that need them
+keep using ``LoadGenerator``.
+"""
+
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+import requests
+
+from helpers.histogram import DEFAULT_MAX_SECONDS, LogLinearHistogram
+from helpers.load import Operation
+from helpers.tracing import trace_headers
+
+# Counters ahead of each operation's buckets in a slot
+HEADER = ("min", "max", "errors", "unexpected")
+_MIN, _MAX, _ERRORS, _UNEXPECTED = range(len(HEADER))
+
+# Seconds allowed for worker processes to start and import their modules
+STARTUP_TIMEOUT = 60.0
+
+
+class SharedCounters:
+    """
+    Per-thread, per-operation histograms and counters in one shared array.
+
+    Created by the coordinator and passed to worker processes, which write
+    only their own slots through ``recorders``.
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        operations: int,
+        precision_bits: int = 5,
+        max_seconds: float = DEFAULT_MAX_SECONDS,
+        context=None
+    ):
+        self.slots = slots
+        self.operations = operations
+        self.precision_bits = precision_bits
+        self.max_seconds = max_seconds
+        self.buckets = len(LogLinearHistogram(precision_bits, max_seconds).counts)
+        self.stride = len(HEADER) + self.buckets
+        self.array = (context or multiprocessing).RawArray("Q", slots * operations * self.stride)
+
+    def _view(self) -> memoryview:
+        # A ctypes array exposes "<Q"; cast through bytes to index it natively
+        return memoryview(self.array).cast("B").cast("Q")
+
+    def _offset(self, slot: int, operation: int) -> int:
+        return (slot * self.operations + operation) * self.stride
+
+    def recorders(self, slot: int) -> list[tuple[LogLinearHistogram, memoryview]]:
+        """Histogram over the shared buckets and the header view, per operation."""
+        view = self._view()
+        recorders = []
+        for operation in range(self.operations):
+            start = self._offset(slot, operation)
+            header = view[start:start + len(HEADER)]
+            buckets = view[start + len(HEADER):start + self.stride]
+            recorders.append((
+                LogLinearHistogram(self.precision_bits, self.max_seconds, counts=buckets), header,
+            ))
+        return recorders
+
+    def snapshot(self, operation: int) -> tuple[LogLinearHistogram, int, int]:
+        """Copy of one operation merged over all slots, with its error and unexpected counts."""
+        view = self._view()
+        merged = LogLinearHistogram(self.precision_bits, self.max_seconds)
+        errors = unexpected = 0
+        for slot in range(self.slots):
+            start = self._offset(slot, operation)
+            header = view[start:start + len(HEADER)]
+            errors += header[_ERRORS]
+            unexpected += header[_UNEXPECTED]
+            merged.merge(LogLinearHistogram.from_counts(
+                view[start + len(HEADER):start + self.stride], header[_MIN], header[_MAX],
+                self.precision_bits, self.max_seconds,
+            ))
+        return merged, errors, unexpected
+
+
+def _worker(
+    base_url: str,
+    operations: list[Operation],
+    slots: range,
+    counters: SharedCounters,
+    ready,
+    stop,
+    cpu,
+    index: int,
+    timeout: float
+) -> None:
+    """Worker process entry point: one thread per slot until ``stop`` is set."""
+    def run(slot: int) -> None:
+        rng = random.Random(slot)
+        session = requests.Session()
+        recorders = counters.recorders(slot)
+        weights = [op.weight for op in operations]
+        choices = range(len(operations))
+
+        while not stop.is_set():
+            i = rng.choices(choices, weights=weights)[0]
+            op = operations[i]
+            histogram, header = recorders[i]
+            start = time.perf_counter()
+            try:
+                response = session.request(
+                    op.method, base_url + op.path, params=op.params, json=op.json_body(),
+                    headers=trace_headers(), timeout=timeout,
+                )
+            except requests.exceptions.RequestException:
+                header[_ERRORS] += 1
+                continue
+            histogram.record(time.perf_counter() - start)
+            header[_MIN] = histogram.min_value
+            header[_MAX] = histogram.max_seen
+            if response.status_code not in op.expected:
+                header[_UNEXPECTED] += 1
+        session.close()
+
+    threads = [threading.Thread(target=run, args=(slot,), daemon=True) for slot in slots]
+    ready.wait(STARTUP_TIMEOUT)
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu[index] = time.process_time()
+
+
+@dataclass
+class PoolTick:
+    """Merged counters of one coordinator interval."""
+
+    elapsed: float
+    requests: int
+    errors: int
+    throughput: float
+    latency: dict[str, float]
+    unexpected: int = 0
+
+
+@dataclass
+class PoolResult:
+    """Merged histograms and counters of a pool run, plus the per-interval timeline."""
+
+    histograms: dict[str, LogLinearHistogram] = field(default_factory=dict)
+    errors: Counter = field(default_factory=Counter)
+    unexpected: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+    cpu_seconds: float = 0.0
+    timeline: list[PoolTick] = field(default_factory=list)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(h) for h in self.histograms.values()) + sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the whole run."""
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of requests that raised or returned an unexpected status."""
+        if not self.total_requests:
+            return 0.0
+        return (sum(self.errors.values()) + sum(self.unexpected.values())) / self.total_requests
+
+    def summary(self, name: str) -> dict[str, float]:
+        return self.histograms[name].summary() if name in self.histograms else LogLinearHistogram().summary()
+
+    def overall(self) -> LogLinearHistogram:
+        merged = LogLinearHistogram()
+        for histogram in self.histograms.values():
+            merged.merge(histogram)
+        return merged
+
+
+class LoadPool:
+    """
+    Drive a weighted operation mix from a pool of worker processes.
+
+    Usage:
+        pool = LoadPool(base_url, mixed_workload(), processes=4, concurrency=64)
+        result = pool.run(30, on_tick=lambda tick: print(tick.throughput))
+        result.summary("list"), result.throughput
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        operations: list[Operation],
+        processes: int | None = None,
+        concurrency: int = 16,
+        timeout: float = 10.0,
+        interval: float = 1.0
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.operations = operations
+        self.concurrency = concurrency
+        self.processes = max(1, min(processes or os.cpu_count() or 1, concurrency))
+        self.timeout = timeout
+        self.interval = interval
+        # Forking a process that runs threads (the stand-in, log followers) is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list = []
+        self._coordinator: threading.Thread | None = None
+        self._on_tick: Callable[[PoolTick], None] | None = None
+        self._result = PoolResult()
+
+    def start(self, on_tick: Callable[[PoolTick], None] | None = None) -> "LoadPool":
+        """Start the worker processes; returns once they all send requests."""
+        context = self._context
+        self.counters = SharedCounters(self.concurrency, len(self.operations), context=context)
+        self._ready = context.Barrier(self.processes + 1)
+        self._stop = context.Event()
+        self._cpu = context.RawArray("d", self.processes)
+        self._on_tick = on_tick
+        self._result = PoolResult()
+
+        # Spread the threads (one slot each) as evenly as possible over the processes
+        per_process, extra = divmod(self.concurrency, self.processes)
+        first = 0
+        self._workers = []
+        for index in range(self.processes):
+            count = per_process + (1 if index < extra else 0)
+            self._workers.append(context.Process(
+                target=_worker,
+                args=(self.base_url, self.operations, range(first, first + count), self.counters,
+                      self._ready, self._stop, self._cpu, index, self.timeout),
+                name=f"load-pool-{index}", daemon=True,
+            ))
+            first += count
+        for worker in self._workers:
+            worker.start()
+
+        try:
+            self._ready.wait(STARTUP_TIMEOUT)
+        except threading.BrokenBarrierError:
+            self._stop.set()
+            raise RuntimeError(f"Load pool workers did not start within {STARTUP_TIMEOUT:.0f}s")
+        self._started = time.perf_counter()
+        self._last = (self._started, LogLinearHistogram(), 0, 0)
+        self._coordinator = threading.Thread(target=self._coordinate, name="load-pool", daemon=True)
+        self._coordinator.start()
+        return self
+
+    def stop(self) -> PoolResult:
+        """Stop the workers, take a final merge and return the result."""
+        self._stop.set()
+        stopped = time.perf_counter()
+        for worker in self._workers:
+            worker.join(self.timeout + 5)
+            if worker.is_alive():
+                worker.terminate()
+        if self._coordinator is not None:
+            self._coordinator.join()
+            self._coordinator = None
+
+        # Workers have exited, so this last merge is exact
+        self._tick()
+        self._result.elapsed = stopped - self._started
+        self._result.cpu_seconds = sum(self._cpu)
+        return self._result
+
+    def run(self, duration: float, on_tick: Callable[[PoolTick], None] | None = None) -> PoolResult:
+        """Run the workload for a fixed duration and return the result."""
+        self.start(on_tick)
+        self._stop.wait(duration)
+        return self.stop()
+
+    def _coordinate(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._tick()
+
+    def _tick(self) -> None:
+        result = PoolResult()
+        for i, op in enumerate(self.operations):
+            histogram, errors, unexpected = self.counters.snapshot(i)
+            result.histograms[op.name] = histogram
+            result.errors[op.name] = errors
+            result.unexpected[op.name] = unexpected
+
+        now = time.perf_counter()
+        overall = result.overall()
+        errors = sum(result.errors.values())
+        unexpected = sum(result.unexpected.values())
+        last_time, last_overall, last_errors, last_unexpected = self._last
+        window = overall.since(last_overall)
+        tick = PoolTick(
+            elapsed=now - self._started,
+            requests=len(window) + errors - last_errors,
+            errors=errors - last_errors,
+            throughput=(len(window) + errors - last_errors) / (now - last_time) if now > last_time else 0.0,
+            latency=window.summary(),
+            unexpected=unexpected - last_unexpected,
+        )
+        self._last = (now, overall, errors, unexpected)
+
+        result.timeline = self._result.timeline + [tick]
+        self._result = result
+        if self._on_tick is not None:
+            self._on_tick(tick)
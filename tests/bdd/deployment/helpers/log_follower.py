@@ -0,0 +1,362 @@
+"""Streaming follower of the compose project's container logs.
+
+One thread per container follows its log stream through the Docker SDK and
+feeds a bounded per-service ring buffer, so memory stays constant however
+chatty a service is. Error and warning lines (and the stack trace lines that
+follow an error) are indexed as they arrive, with their timestamps. Failing
+scenarios can then ask for the errors that happened during their own time
+window, with a few lines of context, instead of an arbitrary tail.
+
+Containers started after the follower (e.g. by ``task up``) are picked up
+from the Docker events stream. Other sources, such as the stand-in server,
+can push lines with ``feed()``. Listeners receive every line as it arrives,
+e.g. to parse access logs.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+from helpers.docker_events import COMPOSE_PROJECT, PROJECT_LABEL, SERVICE_LABEL
+
+# Lines kept per service
+DEFAULT_BUFFER_LINES = 2000
+
+# Indexed error/warning entries kept per service
+DEFAULT_INDEX_SIZE = 200
+
+ERROR_PATTERN = re.compile(
+    r"\b(error|fatal|panic|unhandled|exception|traceback)\b|❌|^--> \S+ \S+ 5\d\d\b",
+    re.IGNORECASE,
+)
+WARNING_PATTERN = re.compile(r"\bwarn(ing)?\b|⚠", re.IGNORECASE)
+
+# Continuation of a stack trace: Node "    at fn (file:1:2)", Python frames, "Caused by"
+STACK_PATTERN = re.compile(r"^\s+(at\s|File\s\")|^\s*Caused by\b|^\s{4,}\S")
+
+# Docker prefixes each line with an RFC 3339 timestamp when timestamps=True
+TIMESTAMP_PATTERN = re.compile(r"^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(\.\d+)?(Z|[+-]\d\d:\d\d)\s?")
+
+
+@dataclass
+class LogLine:
+    """One log line with its (Unix) timestamp."""
+
+    timestamp: float
+    service: str
+    text: str
+
+
+@dataclass
+class LogEntry:
+    """An indexed error or warning, with the stack trace lines that followed it."""
+
+    line: LogLine
+    level: str
+    stack: list[str] = field(default_factory=list)
+
+
+def split_timestamp(raw: str) -> tuple[float | None, str]:
+    """
+    Split a Docker timestamp prefix off a log line.
+
+    Returns:
+        Unix timestamp (None when absent) and the remaining text
+    """
+    match = TIMESTAMP_PATTERN.match(raw)
+    if not match:
+        return None, raw
+    seconds, fraction, zone = match.groups()
+    zone = "+00:00" if zone == "Z" else zone
+    parsed = datetime.fromisoformat(seconds + zone).astimezone(timezone.utc)
+    return parsed.timestamp() + float(fraction or 0), raw[match.end():]
+
+
+def classify(text: str) -> str | None:
+    """Return "error", "warning" or None for a log line."""
+    if ERROR_PATTERN.search(text):
+        return "error"
+    if WARNING_PATTERN.search(text):
+        return "warning"
+    return None
+
+
+class ServiceLog:
+    """Ring buffer and incremental error/warning index of one service."""
+
+    def __init__(self, service: str, buffer_lines: int, index_size: int):
+        self.service = service
+        self.lines: deque[LogLine] = deque(maxlen=buffer_lines)
+        self.index: deque[LogEntry] = deque(maxlen=index_size)
+        self.errors = 0
+        self.warnings = 0
+        self._open_error: LogEntry | None = None
+
+    def add(self, line: LogLine) -> None:
+        self.lines.append(line)
+
+        if self._open_error is not None and STACK_PATTERN.match(line.text):
+            self._open_error.stack.append(line.text)
+            return
+
+        level = classify(line.text)
+        self._open_error = None
+        if level is None:
+            return
+        entry = LogEntry(line, level)
+        self.index.append(entry)
+        if level == "error":
+            self.errors += 1
+            self._open_error = entry
+        else:
+            self.warnings += 1
+
+    def context(self, line: LogLine, before: int) -> list[LogLine]:
+        """Lines up to ``before`` lines before ``line``, if still buffered."""
+        lines = list(self.lines)
+        for position, candidate in enumerate(lines):
+            if candidate is line:
+                return lines[max(0, position - before):position]
+        return []
+
+
+class LogFollower:
+    """
+    Per-service log buffers fed from Docker log streams or pushed lines.
+
+    Usage:
+        follower = LogFollower().start()
+        since = time.time()
+        ...
+        print(follower.excerpt(since))
+        follower.stop()
+    """
+
+    def __init__(
+        self,
+        project: str = COMPOSE_PROJECT,
+        buffer_lines: int = DEFAULT_BUFFER_LINES,
+        index_size: int = DEFAULT_INDEX_SIZE
+    ):
+        self.project = project
+        self.buffer_lines = buffer_lines
+        self.index_size = index_size
+        self.services: dict[str, ServiceLog] = {}
+        # Called with (service, text) for every line
+        self.listeners: list[Callable[[str, str], None]] = []
+        self._lock = threading.Lock()
+        self._client = None
+        self._events = None
+        self._streams: dict[str, object] = {}
+        self._threads: list[threading.Thread] = []
+
+    # -------------------------------------------------------------------------
+    # Sources
+    # -------------------------------------------------------------------------
+
+    def start(self) -> "LogFollower":
+        """Follow every running container of the project, and any started later.
+
+        Raises:
+            docker.errors.DockerException: If the daemon is not reachable
+        """
+        import docker
+
+        self._client = docker.from_env()
+        label_filter = f"{PROJECT_LABEL}={self.project}"
+
+        since = int(time.time())
+        for container in self._client.containers.list(filters={"label": label_filter}):
+            # Lines from before the follower started are not part of any scenario
+            self._follow(container.id, container.labels.get(SERVICE_LABEL, container.name), time.time())
+
+        self._events = self._client.events(
+            decode=True,
+            since=since,
+            filters={"type": "container", "label": label_filter, "event": ["start"]},
+        )
+        self._spawn(self._consume_events, "log-follower-events")
+        return self
+
+    def stop(self) -> None:
+        """Close all streams and release the client."""
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        for stream in list(self._streams.values()):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        self._streams.clear()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads.clear()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def feed(self, service: str, text: str, timestamp: float | None = None) -> None:
+        """Add one line to a service's buffer (thread-safe)."""
+        line = LogLine(time.time() if timestamp is None else timestamp, service, text.rstrip("\r\n"))
+        with self._lock:
+            log = self.services.get(service)
+            if log is None:
+                log = self.services[service] = ServiceLog(service, self.buffer_lines, self.index_size)
+            log.add(line)
+        for listener in list(self.listeners):
+            listener(service, line.text)
+
+    def _spawn(self, target, name: str, *args) -> None:
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _follow(self, container_id: str, service: str, since: float) -> None:
+        if container_id in self._streams:
+            return
+        try:
+            stream = self._client.api.logs(
+                container_id, stream=True, follow=True, timestamps=True, since=since
+            )
+        except Exception:
+            return
+        self._streams[container_id] = stream
+        self._spawn(self._consume_logs, f"log-follower-{service}", stream, service, container_id)
+
+    def _consume_events(self) -> None:
+        try:
+            for event in self._events:
+                attributes = event.get("Actor", {}).get("Attributes", {})
+                container_id = event.get("id") or event.get("Actor", {}).get("ID")
+                if container_id:
+                    # From the start itself, so lines printed before the attach are kept
+                    started = event["timeNano"] / 1e9 if "timeNano" in event else event.get("time") or time.time()
+                    self._follow(
+                        container_id, attributes.get(SERVICE_LABEL, attributes.get("name", container_id)), started,
+                    )
+        except Exception:
+            # Stream closed by stop() or daemon went away
+            pass
+
+    def _consume_logs(self, stream, service: str, container_id: str) -> None:
+        # Chunks are multiplexed frames, not lines: reassemble before feeding
+        pending = b""
+        try:
+            for chunk in stream:
+                pending += chunk
+                *complete, pending = pending.split(b"\n")
+                for raw in complete:
+                    timestamp, text = split_timestamp(raw.decode("utf-8", errors="replace"))
+                    self.feed(service, text, timestamp)
+        except Exception:
+            pass
+        if pending:
+            timestamp, text = split_timestamp(pending.decode("utf-8", errors="replace"))
+            self.feed(service, text, timestamp)
+        # The stream ends when the container stops; a restart under the same id is followed anew
+        if self._streams.get(container_id) is stream:
+            self._streams.pop(container_id, None)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def entries(self, since: float, until: float | None = None) -> list[tuple[ServiceLog, LogEntry]]:
+        """Indexed errors and warnings between ``since`` and ``until``, oldest first."""
+        until = time.time() if until is None else until
+        with self._lock:
+            found = [
+                (log, entry)
+                for log in self.services.values()
+                for entry in log.index
+                if since <= entry.line.timestamp <= until
+            ]
+        return sorted(found, key=lambda item: item[1].line.timestamp)
+
+    def evicted_before(self, service: str) -> float | None:
+        """Timestamp before which a service's lines rotated out (None if none did)."""
+        with self._lock:
+            log = self.services.get(service)
+            if log is None or len(log.lines) < log.lines.maxlen:
+                return None
+            return log.lines[0].timestamp
+
+    def lines(
+        self,
+        since: float,
+        until: float,
+        service: str | None = None,
+        contains: str | None = None
+    ) -> list[LogLine]:
+        """Buffered lines between ``since`` and ``until``, optionally filtered."""
+        with self._lock:
+            logs = [self.services[service]] if service in self.services else (
+                [] if service is not None else list(self.services.values())
+            )
+            found = [
+                line
+                for log in logs
+                for line in log.lines
+                if since <= line.timestamp <= until and (contains is None or contains in line.text)
+            ]
+        return sorted(found, key=lambda line: line.timestamp)
+
+    def excerpt(
+        self,
+        since: float,
+        until: float | None = None,
+        context: int = 3,
+        limit: int = 20
+    ) -> str:
+        """
+        Errors and warnings of a time window with the lines that preceded them.
+
+        Args:
+            since: Window start (Unix time)
+            until: Window end (Unix time, default now)
+            context: Buffered lines shown before each entry
+            limit: Maximum number of entries (errors first)
+
+        Returns:
+            Formatted excerpt, empty when nothing was indexed in the window
+        """
+        found = self.entries(since, until)
+        found.sort(key=lambda item: item[1].level != "error")
+        found = sorted(found[:limit], key=lambda item: item[1].line.timestamp)
+
+        blocks = []
+        with self._lock:
+            for log, entry in found:
+                block = [f"[{log.service}] {entry.level.upper()} at {_format_time(entry.line.timestamp)}"]
+                block += [f"    {line.text}" for line in log.context(entry.line, context)]
+                block.append(f"  > {entry.line.text}")
+                block += [f"  > {line}" for line in entry.stack]
+                blocks.append("\n".join(block))
+        return "\n\n".join(blocks)
+
+    def tail(self, service: str, lines: int = 50) -> list[str]:
+        """Last buffered lines of a service."""
+        with self._lock:
+            log = self.services.get(service)
+            return [line.text for line in list(log.lines)[-lines:]] if log else []
+
+    def report_rows(self, since: float, until: float | None = None) -> list[list]:
+        """Per-service error/warning counts of a time window, with the first error."""
+        counts: dict[str, list] = {}
+        for log, entry in self.entries(since, until):
+            row = counts.setdefault(log.service, [log.service, 0, 0, ""])
+            if entry.level == "error":
+                row[1] += 1
+                row[3] = row[3] or entry.line.text[:80]
+            else:
+                row[2] += 1
+        return sorted(counts.values())
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%H:%M:%S.%f")[:-3]
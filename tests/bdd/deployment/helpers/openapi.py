@@ -0,0 +1,281 @@
+"""OpenAPI-driven workload generation.
+
+Parses the live OpenAPI document, synthesizes a valid request for every
+operation from its parameter and request-body schemas, and turns each one
+into a load ``Operation`` so new routes get benchmark coverage without
+hand-written steps.
+"""
+
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import requests
+
+from helpers.load import LoadGenerator, Operation, feedback_payload
+
+# Methods benchmarked by default; DELETE would empty the seeded fixtures
+DEFAULT_METHODS = ("get", "post", "put", "patch")
+
+# Nesting depth beyond which optional properties are no longer generated
+MAX_OPTIONAL_DEPTH = 2
+
+# Hard stop for recursive schemas with required self-references
+MAX_DEPTH = 8
+
+PATH_PARAMETER = re.compile(r"{([^}]+)}")
+
+
+def resolve_ref(spec: dict, ref: str) -> dict:
+    """Resolve a local JSON reference such as ``#/components/schemas/Feedback``."""
+    if not ref.startswith("#/"):
+        raise ValueError(f"Only local references are supported: {ref}")
+
+    node: Any = spec
+    for part in ref[2:].split("/"):
+        node = node[part.replace("~1", "/").replace("~0", "~")]
+    return node
+
+
+class SchemaSampler:
+    """Generate a minimal valid value for an OpenAPI schema."""
+
+    def __init__(self, spec: dict):
+        self.spec = spec
+
+    def sample(self, schema: dict, depth: int = 0) -> Any:
+        if depth > MAX_DEPTH:
+            return None
+        if "$ref" in schema:
+            return self.sample(resolve_ref(self.spec, schema["$ref"]), depth)
+
+        for key in ("example", "default", "const"):
+            if key in schema:
+                return schema[key]
+        if schema.get("enum"):
+            return schema["enum"][0]
+
+        if "allOf" in schema:
+            merged: dict = {}
+            for part in schema["allOf"]:
+                value = self.sample(part, depth)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        for key in ("oneOf", "anyOf"):
+            if schema.get(key):
+                # Prefer a non-null variant
+                variants = [v for v in schema[key] if v.get("type") != "null"]
+                return self.sample((variants or schema[key])[0], depth)
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != "null"), "null")
+        if schema_type is None and "properties" in schema:
+            schema_type = "object"
+
+        if schema_type == "object":
+            return self._sample_object(schema, depth)
+        if schema_type == "array":
+            count = max(1, schema.get("minItems", 1))
+            return [self.sample(schema.get("items", {}), depth + 1) for _ in range(count)]
+        if schema_type == "string":
+            return self._sample_string(schema)
+        if schema_type == "integer":
+            return int(schema.get("minimum", 1))
+        if schema_type == "number":
+            return float(schema.get("minimum", 1))
+        if schema_type == "boolean":
+            return True
+        return None
+
+    def _sample_object(self, schema: dict, depth: int) -> dict:
+        required = set(schema.get("required", []))
+        value = {}
+        for name, prop in schema.get("properties", {}).items():
+            if name in required or depth < MAX_OPTIONAL_DEPTH:
+                if prop.get("readOnly"):
+                    continue
+                value[name] = self.sample(prop, depth + 1)
+        return value
+
+    @staticmethod
+    def _sample_string(schema: dict) -> str:
+        fmt = schema.get("format")
+        if fmt == "date-time":
+            return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        if fmt == "date":
+            return datetime.now(timezone.utc).date().isoformat()
+        if fmt == "email":
+            return "bdd@example.com"
+        if fmt == "uuid":
+            return str(uuid.uuid4())
+        if fmt in ("uri", "url"):
+            return "http://localhost/bdd"
+        value = "bdd"
+        min_length = schema.get("minLength", 0)
+        if len(value) < min_length:
+            value = value.ljust(min_length, "x")
+        return value[:schema.get("maxLength", len(value))]
+
+
+@dataclass
+class SynthesizedOperation:
+    """A benchmarkable operation, or the reason it was skipped."""
+
+    operation: Operation
+    skipped: str | None = None
+
+
+def seed_path_values(base_url: str, timeout: float = 10.0) -> dict[str, str]:
+    """
+    Create fixtures that path parameters can point at.
+
+    Returns:
+        Mapping of path parameter name to an existing resource id
+    """
+    values = {"chunkNumber": "0"}
+    session = requests.Session()
+    try:
+        response = session.post(
+            f"{base_url}/api/v1/feedback", json=feedback_payload("bdd-openapi"), timeout=timeout
+        )
+        if response.status_code == 201:
+            values["id"] = response.json()["id"]
+
+        response = session.post(
+            f"{base_url}/api/v1/videos/init",
+            json={
+                "projectId": "bdd-openapi",
+                "sessionId": uuid.uuid4().hex,
+                "filename": "bdd.webm",
+                "mimeType": "video/webm",
+                "size": 1024,
+            },
+            timeout=timeout,
+        )
+        if response.status_code == 201:
+            values["videoId"] = response.json()["videoId"]
+    except (requests.exceptions.RequestException, ValueError, KeyError):
+        pass
+    finally:
+        session.close()
+    return values
+
+
+def synthesize_operations(
+    spec: dict,
+    path_values: dict[str, str] | None = None,
+    methods: tuple[str, ...] = DEFAULT_METHODS,
+) -> list[SynthesizedOperation]:
+    """
+    Build one request per documented operation.
+
+    Args:
+        spec: Parsed OpenAPI document
+        path_values: Known values for path parameters (e.g. seeded ids)
+        methods: HTTP methods to include
+
+    Returns:
+        Synthesized operations in document order
+    """
+    sampler = SchemaSampler(spec)
+    path_values = path_values or {}
+    operations = []
+
+    for path, path_item in spec.get("paths", {}).items():
+        shared_parameters = path_item.get("parameters", [])
+        for method, definition in path_item.items():
+            if method not in methods:
+                continue
+
+            name = definition.get("operationId") or f"{method.upper()} {path}"
+            parameters = [
+                resolve_ref(spec, p["$ref"]) if "$ref" in p else p
+                for p in shared_parameters + definition.get("parameters", [])
+            ]
+
+            concrete_path = path
+            query = {}
+            for parameter in parameters:
+                schema = parameter.get("schema", {})
+                if parameter.get("in") == "path":
+                    value = path_values.get(parameter["name"]) or sampler.sample(schema)
+                    concrete_path = concrete_path.replace(f"{{{parameter['name']}}}", str(value))
+                elif parameter.get("in") == "query" and parameter.get("required"):
+                    query[parameter["name"]] = sampler.sample(schema)
+
+            body = None
+            skipped = None
+            request_body = definition.get("requestBody")
+            if request_body and "$ref" in request_body:
+                request_body = resolve_ref(spec, request_body["$ref"])
+            if request_body:
+                content = request_body.get("content", {})
+                if "application/json" in content:
+                    body = sampler.sample(content["application/json"].get("schema", {}))
+                else:
+                    skipped = f"unsupported request body: {', '.join(content) or 'none'}"
+            if PATH_PARAMETER.search(concrete_path):
+                skipped = "unresolved path parameter"
+
+            expected = tuple(
+                int(code) for code in definition.get("responses", {})
+                if code.isdigit() and code.startswith("2")
+            ) or (200,)
+
+            operations.append(SynthesizedOperation(
+                Operation(
+                    name=name,
+                    method=method.upper(),
+                    path=concrete_path,
+                    params=query or None,
+                    body=body,
+                    expected=expected,
+                ),
+                skipped=skipped,
+            ))
+
+    return operations
+
+
+def benchmark_operations(
+    base_url: str,
+    operations: list[SynthesizedOperation],
+    concurrency: int,
+    duration: float,
+    on_response: Callable[[Operation, requests.Response, float], None] | None = None,
+) -> list[list[Any]]:
+    """
+    Benchmark each operation on its own at a fixed concurrency.
+
+    Args:
+        on_response: Optional per-response hook passed to the load generator
+
+    Returns:
+        Latency matrix rows: operation, request, count, p50, p90, p99, max,
+        unexpected-status share and 5xx count (skipped operations carry
+        the reason instead of numbers)
+    """
+    rows = []
+    for synthesized in operations:
+        op = synthesized.operation
+        label = f"{op.method} {op.path}"
+        if synthesized.skipped:
+            rows.append([op.name, label, 0, None, None, None, None, synthesized.skipped, 0])
+            continue
+
+        result = LoadGenerator(
+            base_url, [op], concurrency=concurrency, on_response=on_response
+        ).run(duration)
+        summary = result.summary(op.name)
+        server_errors = sum(
+            count for status, count in result.statuses[op.name].items() if status >= 500
+        )
+        rows.append([
+            op.name, label, summary["count"], summary["p50"], summary["p90"],
+            summary["p99"], summary["max"], f"{result.error_rate:.0%}", server_errors,
+        ])
+    return rows
@@ -0,0 +1,154 @@
+"""Throughput and readiness over time, for dependency outage scenarios.
+
+``Timeline`` is an ``on_response``/``on_error`` hook pair for the load
+generator. It counts successful and failed requests per time bucket, and
+keeps the longest time any request took to return. ``ReadinessWatcher`` polls
+``/api/v1/health/ready`` and records when the answer changes. Together they
+give the error rate during an outage, when readiness dropped and returned,
+and how long throughput took to get back to its baseline.
+"""
+
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import requests
+
+
+class Timeline:
+    """
+    Per-bucket request outcomes of a load run.
+
+    Usage:
+        timeline = Timeline()
+        LoadGenerator(url, ops, on_response=timeline, on_error=timeline.on_error).run(60)
+        timeline.rate(since, until)
+    """
+
+    def __init__(self, bucket: float = 1.0):
+        self.bucket = bucket
+        self.started = time.time()
+        self.ok: Counter = Counter()
+        self.failed: Counter = Counter()
+        self.longest = 0.0
+        self.longest_op = ""
+        self._lock = threading.Lock()
+
+    def __call__(self, op, response: requests.Response, latency: float) -> None:
+        self._record(op.name, response.status_code in op.expected, latency)
+
+    def on_error(self, op, error: Exception, elapsed: float) -> None:
+        self._record(op.name, False, elapsed)
+
+    def _record(self, name: str, ok: bool, duration: float) -> None:
+        index = int((time.time() - self.started) // self.bucket)
+        with self._lock:
+            (self.ok if ok else self.failed)[index] += 1
+            if duration > self.longest:
+                self.longest, self.longest_op = duration, name
+
+    def _buckets(self, since: float, until: float) -> range:
+        # Whole buckets only: a partly covered bucket would understate the rate
+        first = math.ceil((since - self.started) / self.bucket)
+        last = math.floor((until - self.started) / self.bucket)
+        return range(first, max(first, last))
+
+    def rate(self, since: float, until: float) -> float:
+        """Successful requests per second between two wall-clock times."""
+        buckets = self._buckets(since, until)
+        if not buckets:
+            return 0.0
+        return sum(self.ok[i] for i in buckets) / (len(buckets) * self.bucket)
+
+    def error_rate(self, since: float, until: float) -> float:
+        """Fraction of requests that failed between two wall-clock times."""
+        buckets = self._buckets(since, until)
+        ok = sum(self.ok[i] for i in buckets)
+        failed = sum(self.failed[i] for i in buckets)
+        return failed / (ok + failed) if ok + failed else 0.0
+
+    def recovered_at(
+        self,
+        since: float,
+        until: float,
+        baseline: float,
+        tolerance: float = 0.8,
+        sustain: int = 3
+    ) -> float | None:
+        """
+        Start of the first run of ``sustain`` buckets at ``tolerance`` x baseline.
+
+        Returns:
+            Wall-clock time throughput was back, or None if it never was
+        """
+        threshold = baseline * tolerance * self.bucket
+        streak = 0
+        for index in self._buckets(since, until):
+            streak = streak + 1 if self.ok[index] >= threshold else 0
+            if streak == sustain:
+                return self.started + (index - sustain + 1) * self.bucket
+        return None
+
+
+@dataclass
+class Transition:
+    """A change of the readiness answer."""
+
+    at: float
+    ready: bool
+    detail: str
+
+
+class ReadinessWatcher:
+    """
+    Poll a readiness endpoint and keep its transitions.
+
+    A non-200 answer, a timeout or a refused connection all count as unready,
+    as they would for an orchestrator.
+    """
+
+    def __init__(self, url: str, interval: float = 0.25, timeout: float = 1.0):
+        self.url = url
+        self.interval = interval
+        self.timeout = timeout
+        self.transitions: list[Transition] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "ReadinessWatcher":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="readiness", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> list[Transition]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 5)
+        return self.transitions
+
+    def first(self, ready: bool, since: float) -> Transition | None:
+        """First transition to ``ready`` at or after ``since``."""
+        for transition in self.transitions:
+            if transition.ready is ready and transition.at >= since:
+                return transition
+        return None
+
+    @property
+    def ready(self) -> bool | None:
+        return self.transitions[-1].ready if self.transitions else None
+
+    def _watch(self) -> None:
+        session = requests.Session()
+        while not self._stop.is_set():
+            try:
+                response = session.get(self.url, timeout=self.timeout)
+                ready, detail = response.status_code == 200, str(response.status_code)
+            except requests.exceptions.RequestException as e:
+                ready, detail = False, type(e).__name__
+            if ready is not self.ready:
+                self.transitions.append(Transition(time.time(), ready, detail))
+            self._stop.wait(self.interval)
+        session.close()
@@ -0,0 +1,257 @@
+"""Page-weight crawler for the webui and feedback-example pages.
+
+Loads a page's HTML, follows the scripts, stylesheets and preloads it
+references, then the static and dynamic ``import`` specifiers of every
+JavaScript module and the ``@import``/``url()`` references of every
+stylesheet. Each round of newly discovered assets is fetched concurrently.
+Only same-origin assets are followed; the page weight is what the services
+ship, not third-party embeds.
+
+Every asset is fetched the way a browser would ask for it
+(``Accept-Encoding: gzip, deflate, br``; br only with the optional
+``brotli`` package). Its transfer size is the body as
+received on the wire, and its decoded size the body after content decoding.
+"""
+
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import requests
+
+try:
+    import brotli
+except ImportError:  # Optional: without it br is not offered to the server
+    brotli = None
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+DECODE_ERRORS = (zlib.error, brotli.error) if brotli is not None else (zlib.error,)
+
+# Text assets larger than this should be served compressed
+COMPRESSIBLE_MIN_BYTES = 1024
+
+JS_IMPORT = re.compile(
+    r"""(?:\bimport\s*\(\s*|\bimport\s+(?:[\w*{}\s,$]+\s+from\s+)?|\bexport\s+[\w*{}\s,$]+\s+from\s+)"""
+    r"""["']([^"'\s]+)["']"""
+)
+CSS_REFERENCE = re.compile(r"""@import\s+(?:url\()?\s*["']?([^"')\s;]+)|url\(\s*["']?([^"')\s]+)""")
+
+# Content types whose body is searched for further references
+PARSED_TYPES = re.compile(r"html|javascript|css")
+
+LINK_RELS = {"stylesheet": "style", "modulepreload": "script", "preload": None, "icon": "image"}
+
+
+class AssetParser(HTMLParser):
+    """Collect the script, stylesheet and preload URLs of an HTML document."""
+
+    def __init__(self):
+        super().__init__()
+        self.references: list[tuple[str, str]] = []
+        self.inline_scripts: list[str] = []
+        self._in_script = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "script":
+            if attributes.get("src"):
+                self.references.append((attributes["src"], "script"))
+            else:
+                self._in_script = True
+        elif tag == "link" and attributes.get("href"):
+            for rel in attributes.get("rel", "").lower().split():
+                if rel in LINK_RELS:
+                    kind = LINK_RELS[rel] or attributes.get("as", "other")
+                    self.references.append((attributes["href"], kind))
+                    break
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._in_script = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_script:
+            self.inline_scripts.append(data)
+
+
+@dataclass
+class Asset:
+    """One fetched resource of a page."""
+
+    url: str
+    kind: str
+    status: int | None = None
+    content_type: str = ""
+    encoding: str = ""
+    transfer_bytes: int = 0
+    decoded_bytes: int | None = None
+    cache_control: str = ""
+    etag: str = ""
+    error: str = ""
+
+    @property
+    def path(self) -> str:
+        split = urlsplit(self.url)
+        return split.path + (f"?{split.query}" if split.query else "")
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+    @property
+    def compressible(self) -> bool:
+        text = any(t in self.content_type for t in ("text/", "javascript", "json", "svg", "xml"))
+        return text and (self.decoded_bytes or 0) >= COMPRESSIBLE_MIN_BYTES
+
+    @property
+    def cacheable(self) -> bool:
+        return bool(self.etag) or ("max-age" in self.cache_control and "no-store" not in self.cache_control)
+
+
+@dataclass
+class PageWeight:
+    """All assets of a crawled page."""
+
+    url: str
+    assets: list[Asset] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return len(self.assets)
+
+    @property
+    def transfer_bytes(self) -> int:
+        return sum(asset.transfer_bytes for asset in self.assets)
+
+    @property
+    def decoded_bytes(self) -> int:
+        return sum(asset.decoded_bytes or asset.transfer_bytes for asset in self.assets)
+
+    def failed(self) -> list[Asset]:
+        return [asset for asset in self.assets if not asset.ok]
+
+    def uncompressed(self) -> list[Asset]:
+        """Compressible text assets served without a content encoding."""
+        return [asset for asset in self.assets if asset.compressible and not asset.encoding]
+
+    def uncacheable(self) -> list[Asset]:
+        """Assets other than the document that carry neither max-age nor ETag."""
+        return [asset for asset in self.assets[1:] if asset.ok and not asset.cacheable]
+
+    def by_kind(self) -> dict[str, list[Asset]]:
+        kinds: dict[str, list[Asset]] = {}
+        for asset in self.assets:
+            kinds.setdefault(asset.kind, []).append(asset)
+        return kinds
+
+
+def decode_body(body: bytes, encoding: str) -> bytes | None:
+    """Body after content decoding (None if the encoding is unsupported or corrupt)."""
+    try:
+        if not encoding or encoding == "identity":
+            return body
+        if encoding == "gzip":
+            return zlib.decompress(body, wbits=47)
+        if encoding == "deflate":
+            return zlib.decompress(body)
+        if encoding == "br" and brotli is not None:
+            return brotli.decompress(body)
+    except DECODE_ERRORS:
+        return None
+    return None
+
+
+def references(asset: Asset, text: str) -> list[tuple[str, str]]:
+    """URLs (with their kind) referenced by a fetched HTML, JS or CSS body."""
+    if "html" in asset.content_type:
+        parser = AssetParser()
+        parser.feed(text)
+        found = list(parser.references)
+        for script in parser.inline_scripts:
+            found += _module_imports(script)
+        return found
+    if "javascript" in asset.content_type or asset.kind == "script":
+        return _module_imports(text)
+    if "css" in asset.content_type:
+        return [
+            (first or second, "style" if first else "other")
+            for first, second in CSS_REFERENCE.findall(text)
+        ]
+    return []
+
+
+def _module_imports(source: str) -> list[tuple[str, str]]:
+    # Bare specifiers ("react") are resolved by a bundler or import map, not by URL
+    return [
+        (spec, "script") for spec in JS_IMPORT.findall(source)
+        if spec.startswith(("/", "./", "../", "http://", "https://"))
+    ]
+
+
+class PageCrawler:
+    """
+    Crawl a page and its same-origin assets with concurrent fetches.
+
+    Usage:
+        page = PageCrawler(concurrency=8).crawl("http://localhost:19568/")
+        page.transfer_bytes, page.requests
+    """
+
+    def __init__(self, concurrency: int = 8, timeout: float = 15.0, max_assets: int = 2000):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_assets = max_assets
+        self._local = threading.local()
+
+    def crawl(self, url: str) -> PageWeight:
+        page = PageWeight(url)
+        origin = urlsplit(url)[:2]
+        seen = {url}
+        frontier = [(url, "document")]
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while frontier and len(page.assets) < self.max_assets:
+                fetched = list(pool.map(lambda ref: self._fetch(*ref), frontier))
+                frontier = []
+                for asset, text in fetched:
+                    page.assets.append(asset)
+                    for reference, kind in references(asset, text):
+                        target = urldefrag(urljoin(asset.url, reference))[0]
+                        if urlsplit(target)[:2] != origin or target in seen:
+                            continue  # Bare specifiers, data: URLs and other origins
+                        seen.add(target)
+                        frontier.append((target, kind))
+        return page
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return self._local.session
+
+    def _fetch(self, url: str, kind: str) -> tuple[Asset, str]:
+        asset = Asset(url, kind)
+        try:
+            response = self._session().get(url, timeout=self.timeout, stream=True)
+            raw = response.raw.read(decode_content=False)
+        except requests.exceptions.RequestException as e:
+            asset.error = type(e).__name__
+            return asset, ""
+
+        asset.status = response.status_code
+        asset.content_type = response.headers.get("Content-Type", "")
+        asset.encoding = response.headers.get("Content-Encoding", "").lower()
+        asset.cache_control = response.headers.get("Cache-Control", "")
+        asset.etag = response.headers.get("ETag", "")
+        asset.transfer_bytes = len(raw)
+        response.close()
+
+        body = decode_body(raw, asset.encoding)
+        asset.decoded_bytes = len(body) if body is not None else None
+        if not asset.ok or body is None or not PARSED_TYPES.search(asset.content_type):
+            return asset, ""
+        return asset, body.decode("utf-8", errors="replace")
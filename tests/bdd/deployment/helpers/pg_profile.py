@@ -0,0 +1,281 @@
+"""Statement-level profiling of the feedback queries on PostgreSQL.
+
+The feedback-server currently runs on SQLite, so the profiler does not wait
+for the server to issue queries. It applies the server's PostgreSQL
+migration to a scratch database, seeds it in bulk with ``generate_series``,
+and replays the SQL that the list, search and stats routes build with
+Drizzle (``routes/feedback.ts``). Values vary between iterations, and
+``pg_stat_statements`` normalizes them away.
+
+Every workload statement starts with a ``/* bdd:<name> */`` comment, which
+``pg_stat_statements`` keeps in the stored query text. Ranked statistics can
+then be mapped back to the workload, and the top offenders re-run under
+``EXPLAIN (ANALYZE, BUFFERS)`` with concrete values.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Callable
+
+from helpers.postgres import Psql, migration_sql
+
+# Tables with at least this many live rows count as large for seq-scan flags
+LARGE_TABLE_ROWS = 10_000
+
+STATUSES = ("pending", "in_progress", "resolved", "closed", "archived")
+TYPES = ("bug", "feature", "improvement", "question", "other")
+PRIORITIES = ("low", "medium", "high", "critical")
+TITLE_WORDS = ("button broken", "slow page", "layout glitch", "login fails", "typo")
+
+PROJECTS = 20
+TAGS = 30
+PAGE_SIZE = 20
+
+
+def seed_sql(rows: int) -> str:
+    """Bulk-insert ``rows`` feedback items plus related rows, then ANALYZE."""
+    def array(values: tuple[str, ...]) -> str:
+        return "ARRAY[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+    return f"""
+INSERT INTO feedback (id, project_id, session_id, title, description, type, status, priority,
+                      user_email, user_name, tags, created_at, updated_at)
+SELECT 'fb-' || g, 'project-' || (g % {PROJECTS}), 'session-' || (g % 500),
+       'Feedback ' || g || ' ' || ({array(TITLE_WORDS)})[1 + g % {len(TITLE_WORDS)}],
+       repeat('Steps to reproduce. ', 1 + g % 10),
+       ({array(TYPES)})[1 + g % {len(TYPES)}]::feedback_type,
+       ({array(STATUSES)})[1 + (g / 7) % {len(STATUSES)}]::feedback_status,
+       ({array(PRIORITIES)})[1 + (g / 3) % {len(PRIORITIES)}]::feedback_priority,
+       'user' || (g % 1000) || '@example.com', 'User ' || (g % 1000),
+       jsonb_build_array('tag-' || (g % {TAGS}), 'area-' || (g % 7)),
+       now() - make_interval(mins => g), now() - make_interval(mins => g)
+FROM generate_series(1, {rows}) g;
+
+INSERT INTO screenshots (id, feedback_id, data_url, width, height)
+SELECT 'ss-' || g, 'fb-' || g, 'data:image/png;base64,' || repeat('A', 256), 1280, 720
+FROM generate_series(1, {rows}, 2) g;
+
+INSERT INTO console_logs (id, feedback_id, level, message, timestamp)
+SELECT 'cl-' || g || '-' || n, 'fb-' || g, 'error', 'Uncaught TypeError ' || n, now()::text
+FROM generate_series(1, {rows}, 3) g, generate_series(1, 5) n;
+
+INSERT INTO videos (id, feedback_id, filename, status, size)
+SELECT 'vid-' || g, 'fb-' || g, 'recording.webm', 'ready', 1048576
+FROM generate_series(1, {rows}, 10) g;
+
+INSERT INTO sync_queue (id, feedback_id, operation, payload)
+SELECT 'sq-' || g, 'fb-' || g, 'update', '{{}}'::jsonb
+FROM generate_series(1, {rows}, 4) g;
+
+ANALYZE;
+"""
+
+
+@dataclass
+class WorkloadQuery:
+    """A route's SQL with a generator of concrete statements."""
+
+    name: str
+    route: str
+    build: Callable[[random.Random, int], str]
+
+    def sql(self, rng: random.Random, rows: int) -> str:
+        return f"/* bdd:{self.name} */ {self.build(rng, rows)}"
+
+
+def _project(rng: random.Random) -> str:
+    return f"project-{rng.randrange(PROJECTS)}"
+
+
+def _page(rng: random.Random, rows: int) -> int:
+    return rng.randrange(max(1, rows // PROJECTS // PAGE_SIZE)) * PAGE_SIZE
+
+
+def _ids(rng: random.Random, rows: int) -> str:
+    return ", ".join(f"'fb-{rng.randint(1, rows)}'" for _ in range(PAGE_SIZE))
+
+
+def feedback_workload() -> list[WorkloadQuery]:
+    """SQL issued by the list, get, stats, export and search routes."""
+    return [
+        # GET /api/v1/feedback?projectId=...
+        WorkloadQuery("list_count_by_project", "GET /api/v1/feedback", lambda rng, rows:
+            f"SELECT count(*) FROM feedback WHERE project_id = '{_project(rng)}'"),
+        WorkloadQuery("list_page_by_project", "GET /api/v1/feedback", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE project_id = '{_project(rng)}' "
+            f"ORDER BY created_at DESC LIMIT {PAGE_SIZE} OFFSET {_page(rng, rows)}"),
+        # GET /api/v1/feedback?status=...&sortBy=priority
+        WorkloadQuery("list_page_by_status_priority", "GET /api/v1/feedback", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE status = '{rng.choice(STATUSES)}' "
+            f"ORDER BY priority DESC LIMIT {PAGE_SIZE}"),
+        # GET /api/v1/feedback?search=...
+        WorkloadQuery("list_count_title_search", "GET /api/v1/feedback", lambda rng, rows:
+            f"SELECT count(*) FROM feedback WHERE title LIKE '%{rng.choice(TITLE_WORDS)}%'"),
+        WorkloadQuery("list_page_title_search", "GET /api/v1/feedback", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE title LIKE '%{rng.choice(TITLE_WORDS)}%' "
+            f"ORDER BY created_at DESC LIMIT {PAGE_SIZE}"),
+        # GET /api/v1/feedback/:id
+        WorkloadQuery("get_by_id", "GET /api/v1/feedback/:id", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE id = 'fb-{rng.randint(1, rows)}'"),
+        # GET /api/v1/feedback/stats (with and without projectId)
+        WorkloadQuery("stats_by_status", "GET /api/v1/feedback/stats", lambda rng, rows:
+            f"SELECT status, count(*) FROM feedback WHERE project_id = '{_project(rng)}' GROUP BY status"),
+        WorkloadQuery("stats_by_type", "GET /api/v1/feedback/stats", lambda rng, rows:
+            f"SELECT type, count(*) FROM feedback WHERE project_id = '{_project(rng)}' GROUP BY type"),
+        WorkloadQuery("stats_by_priority", "GET /api/v1/feedback/stats", lambda rng, rows:
+            f"SELECT priority, count(*) FROM feedback WHERE project_id = '{_project(rng)}' GROUP BY priority"),
+        WorkloadQuery("stats_total_all", "GET /api/v1/feedback/stats", lambda rng, rows:
+            "SELECT status, count(*) FROM feedback GROUP BY status"),
+        # GET /api/v1/feedback/export?projectId=...
+        WorkloadQuery("export_by_project", "GET /api/v1/feedback/export", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE project_id = '{_project(rng)}' ORDER BY created_at DESC"),
+        # POST /api/v1/feedback/search
+        WorkloadQuery("search_count_text", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT count(*) FROM feedback WHERE (title LIKE '%{rng.choice(TITLE_WORDS)}%' "
+            f"OR description LIKE '%{rng.choice(TITLE_WORDS)}%')"),
+        WorkloadQuery("search_page_text", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE (title LIKE '%{rng.choice(TITLE_WORDS)}%' "
+            f"OR description LIKE '%{rng.choice(TITLE_WORDS)}%') "
+            f"ORDER BY created_at DESC LIMIT {PAGE_SIZE}"),
+        # Drizzle emits "tags LIKE ..." on a jsonb column; PostgreSQL needs the cast
+        WorkloadQuery("search_page_tag", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE tags::text LIKE '%\"tag-{rng.randrange(TAGS)}\"%' "
+            f"ORDER BY created_at DESC LIMIT {PAGE_SIZE}"),
+        WorkloadQuery("search_page_multi_status", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT * FROM feedback WHERE status IN ('{rng.choice(STATUSES)}', '{rng.choice(STATUSES)}') "
+            f"AND project_id = '{_project(rng)}' ORDER BY updated_at DESC LIMIT {PAGE_SIZE}"),
+        WorkloadQuery("search_has_screenshots", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT feedback_id, count(*) FROM screenshots WHERE feedback_id IN ({_ids(rng, rows)}) "
+            f"GROUP BY feedback_id"),
+        WorkloadQuery("search_has_console_logs", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT feedback_id, count(*) FROM console_logs WHERE feedback_id IN ({_ids(rng, rows)}) "
+            f"GROUP BY feedback_id"),
+        WorkloadQuery("search_has_video", "POST /api/v1/feedback/search", lambda rng, rows:
+            f"SELECT feedback_id FROM videos WHERE feedback_id IN ({_ids(rng, rows)}) AND status = 'ready'"),
+    ]
+
+
+@dataclass
+class StatementStats:
+    """pg_stat_statements counters of one workload query."""
+
+    name: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    rows: int
+    shared_hit: int
+    shared_read: int
+
+
+@dataclass
+class PlanSummary:
+    """Headline numbers of one ``EXPLAIN (ANALYZE, BUFFERS)`` run."""
+
+    name: str
+    execution_ms: float
+    shared_hit: int
+    shared_read: int
+    seq_scans: list[tuple[str, int]] = field(default_factory=list)
+    plan: dict = field(default_factory=dict)
+
+    def large_seq_scans(self, table_rows: dict[str, int]) -> list[str]:
+        return [
+            relation for relation, _ in self.seq_scans
+            if table_rows.get(relation, 0) >= LARGE_TABLE_ROWS
+        ]
+
+
+def _walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+class PostgresProfiler:
+    """
+    Seed a scratch database, replay a workload and rank its statements.
+
+    Usage:
+        profiler = PostgresProfiler(psql, "bdd_profile")
+        profiler.create(rows=50_000)
+        profiler.run(feedback_workload(), iterations=50)
+        stats = profiler.statement_stats()
+        plans = [profiler.explain(q) for q in top]
+        profiler.drop()
+    """
+
+    def __init__(self, psql: Psql, database: str, seed: int = 0):
+        self.psql = psql
+        self.database = database
+        self.rows = 0
+        self._rng = random.Random(seed)
+
+    def create(self, rows: int) -> None:
+        """Create the database with the server schema and seed it."""
+        self.drop()
+        self.psql.run(f'CREATE DATABASE "{self.database}";')
+        self.psql.run(
+            "CREATE EXTENSION IF NOT EXISTS pg_stat_statements;\n"
+            + migration_sql(self.psql.repo_root) + "\n" + seed_sql(rows),
+            database=self.database,
+        )
+        self.rows = rows
+
+    def drop(self) -> None:
+        self.psql.run(f'DROP DATABASE IF EXISTS "{self.database}" WITH (FORCE);')
+
+    def run(self, workload: list[WorkloadQuery], iterations: int) -> None:
+        """Reset statistics, then run every query ``iterations`` times in one session."""
+        script = ["SELECT pg_stat_statements_reset();", "SELECT pg_stat_reset();", "\\o /dev/null"]
+        for _ in range(iterations):
+            for query in workload:
+                script.append(query.sql(self._rng, self.rows) + ";")
+        self.psql.run("\n".join(script), database=self.database)
+
+    def statement_stats(self) -> list[StatementStats]:
+        """Workload statements ranked by total execution time."""
+        rows = self.psql.rows("""
+            SELECT substring(query from '^/\\* bdd:([a-z_]+) \\*/') AS name,
+                   calls, total_exec_time, mean_exec_time, rows,
+                   shared_blks_hit, shared_blks_read
+            FROM pg_stat_statements
+            WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+              AND query LIKE '/* bdd:%'
+            ORDER BY total_exec_time DESC
+        """, database=self.database)
+        return [
+            StatementStats(
+                row["name"], row["calls"], row["total_exec_time"], row["mean_exec_time"],
+                row["rows"], row["shared_blks_hit"], row["shared_blks_read"],
+            )
+            for row in rows
+        ]
+
+    def table_stats(self) -> dict[str, dict]:
+        """Live rows and scan counters per table, keyed by table name."""
+        rows = self.psql.rows("""
+            SELECT relname, n_live_tup, seq_scan, seq_tup_read, coalesce(idx_scan, 0) AS idx_scan
+            FROM pg_stat_user_tables
+        """, database=self.database)
+        return {row["relname"]: row for row in rows}
+
+    def explain(self, query: WorkloadQuery) -> PlanSummary:
+        """Run one concrete instance of a query under EXPLAIN (ANALYZE, BUFFERS)."""
+        sql = query.sql(self._rng, self.rows)
+        result = self.psql.value(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql};", database=self.database
+        )[0]
+        plan = result["Plan"]
+        return PlanSummary(
+            name=query.name,
+            execution_ms=result.get("Execution Time", 0.0),
+            shared_hit=plan.get("Shared Hit Blocks", 0),
+            shared_read=plan.get("Shared Read Blocks", 0),
+            seq_scans=[
+                (node["Relation Name"], node.get("Actual Rows", 0))
+                for node in _walk(plan)
+                if node.get("Node Type") == "Seq Scan"
+            ],
+            plan=result,
+        )
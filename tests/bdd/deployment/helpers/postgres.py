@@ -0,0 +1,115 @@
+"""Access to the compose postgres service through ``docker compose exec``.
+
+The harness has no PostgreSQL driver dependency: statements run through
+``psql`` inside the postgres container, and results come back as JSON built
+by the server (``json_agg``), so they need no text-table parsing.
+"""
+
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Any
+
+# Compose overrides shipped with the harness
+COMPOSE_OVERRIDE_DIR = Path(__file__).parent.parent / "compose"
+
+# Credentials of the compose postgres service (same defaults as docker-compose.yml)
+POSTGRES_USER = os.environ.get("POSTGRES_USER", "feedback")
+POSTGRES_DB = os.environ.get("POSTGRES_DB", "feedback")
+
+# PostgreSQL migration of the feedback-server (source of the schema DDL)
+PG_MIGRATION = Path("packages/feedback-server/src/db/migrate.pg.ts")
+
+# Why the feedback-server cannot run on postgres yet; set to None once
+# db/index.ts honours a postgres:// DATABASE_URL
+SERVER_POSTGRES_UNWIRED: str | None = (
+    "packages/feedback-server/src/db/index.ts always opens bun:sqlite; "
+    "db/factory.ts (the postgres driver) is not wired in"
+)
+
+SQL_TEMPLATE = re.compile(r"sql`(.*?)`", re.DOTALL)
+
+
+class PsqlError(RuntimeError):
+    """psql exited with an error."""
+
+
+def compose_file_args(repo_root: Path, *overrides: Path) -> list[str]:
+    """
+    ``-f`` arguments for the repository compose files plus harness overrides.
+
+    Passing ``-f`` disables the automatic ``docker-compose.override.yml``, so
+    it is listed explicitly when present.
+    """
+    args = ["-f", str(repo_root / "docker-compose.yml")]
+    if (repo_root / "docker-compose.override.yml").exists():
+        args += ["-f", str(repo_root / "docker-compose.override.yml")]
+    for override in overrides:
+        args += ["-f", str(override)]
+    return args
+
+
+def migration_sql(repo_root: Path) -> str:
+    """
+    DDL of ``runPostgresMigrations`` extracted from the server's migration.
+
+    Reading the statements from the TypeScript source keeps the harness
+    schema identical to the one the server would create.
+    """
+    source = (repo_root / PG_MIGRATION).read_text()
+    body = source.split("export async function dropPostgresTables", 1)[0]
+    return "\n".join(statement.strip() for statement in SQL_TEMPLATE.findall(body))
+
+
+class Psql:
+    """
+    Run SQL in the compose postgres container.
+
+    Usage:
+        psql = Psql(repo_root, compose_file_args(repo_root))
+        psql.run("CREATE DATABASE scratch")
+        psql.rows("SELECT relname FROM pg_class", database="scratch")
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        compose_args: list[str] | None = None,
+        user: str = POSTGRES_USER,
+        database: str = POSTGRES_DB
+    ):
+        self.repo_root = repo_root
+        self.compose_args = compose_args or []
+        self.user = user
+        self.database = database
+
+    def run(self, sql: str, database: str | None = None, timeout: int = 600) -> str:
+        """
+        Execute a script and return its unaligned, tuples-only output.
+
+        Raises:
+            PsqlError: On any SQL error (ON_ERROR_STOP) or exec failure
+        """
+        cmd = [
+            "docker", "compose", *self.compose_args, "exec", "-T", "postgres",
+            "psql", "-X", "-q", "-A", "-t", "-v", "ON_ERROR_STOP=1",
+            "-U", self.user, "-d", database or self.database,
+        ]
+        result = subprocess.run(
+            cmd, cwd=self.repo_root, input=sql, capture_output=True, text=True, timeout=timeout
+        )
+        if result.returncode != 0:
+            raise PsqlError(result.stderr.strip() or f"psql exited with {result.returncode}")
+        return result.stdout
+
+    def value(self, sql: str, database: str | None = None) -> Any:
+        """Execute a statement returning one JSON value and decode it."""
+        output = self.run(sql, database).strip()
+        return json.loads(output) if output else None
+
+    def rows(self, query: str, database: str | None = None) -> list[dict]:
+        """Execute a SELECT and return its rows as dictionaries."""
+        query = query.strip().rstrip(";")
+        return self.value(f"SELECT coalesce(json_agg(t), '[]'::json) FROM ({query}) t;", database)
@@ -0,0 +1,91 @@
+"""High-frequency prober for orchestrator health endpoints.
+
+Mimics what a kubelet or compose healthcheck does: hit each probe endpoint at
+a fixed interval with a hard timeout, and record latency, failures and
+timeouts per endpoint.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+import requests
+
+from helpers.stats import summarize
+
+
+@dataclass
+class ProbeResult:
+    """Per-endpoint probe latencies and failure counts."""
+
+    samples: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    timeouts: Counter = field(default_factory=Counter)
+    failures: Counter = field(default_factory=Counter)
+
+    def summary(self, name: str) -> dict[str, float]:
+        return summarize(self.samples.get(name, []))
+
+
+class Prober:
+    """
+    Probe a set of endpoints at a fixed interval, one thread per endpoint.
+
+    A probe that does not answer within ``timeout`` counts as a timeout;
+    any non-2xx answer counts as a failure, as it would for an orchestrator.
+    """
+
+    def __init__(self, endpoints: dict[str, str], interval: float = 0.1, timeout: float = 1.0):
+        self.endpoints = endpoints
+        self.interval = interval
+        self.timeout = timeout
+        self.result = ProbeResult()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> "Prober":
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._probe, args=(name, url), name=f"probe-{name}", daemon=True)
+            for name, url in self.endpoints.items()
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> ProbeResult:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=self.timeout + 5)
+        return self.result
+
+    def run(self, duration: float) -> ProbeResult:
+        """Probe for a fixed duration and return the result."""
+        self.start()
+        self._stop.wait(duration)
+        return self.stop()
+
+    def _probe(self, name: str, url: str) -> None:
+        session = requests.Session()
+        next_probe = time.perf_counter()
+
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                response = session.get(url, timeout=self.timeout)
+                latency = time.perf_counter() - start
+                self.result.samples[name].append(latency)
+                if not 200 <= response.status_code < 300:
+                    self.result.failures[name] += 1
+            except requests.exceptions.Timeout:
+                # Count the full timeout as latency so percentiles include it
+                self.result.samples[name].append(self.timeout)
+                self.result.timeouts[name] += 1
+            except requests.exceptions.RequestException:
+                self.result.failures[name] += 1
+
+            # Fixed-rate schedule: a slow probe does not shift later probes
+            next_probe += self.interval
+            self._stop.wait(max(0.0, next_probe - time.perf_counter()))
+
+        session.close()
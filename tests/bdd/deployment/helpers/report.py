@@ -0,0 +1,148 @@
+"""Session-wide performance report for BDD scenarios.
+
+Benchmark steps add tables to the shared ``REPORT``; the root conftest prints
+them in the terminal summary and writes them as JSON for CI to pick up.
+Steps also add metrics: latency distributions and scalar figures such as
+throughput, which the root conftest records in the baseline store.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from helpers.histogram import LogLinearHistogram
+
+
+@dataclass
+class Metric:
+    """A latency distribution or a scalar figure of one scenario."""
+
+    scenario: str
+    name: str
+    unit: str
+    higher_is_better: bool = False
+    histogram: LogLinearHistogram | None = None
+    value: float | None = None
+
+
+class PerformanceReport:
+    """Collect named result tables produced by benchmark scenarios."""
+
+    def __init__(self):
+        self.sections: list[dict[str, Any]] = []
+        self.metrics: list[Metric] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.sections)
+
+    def add_table(
+        self,
+        title: str,
+        columns: list[str],
+        rows: list[list[Any]],
+        scenario: str | None = None,
+    ) -> None:
+        """
+        Add a result table to the report.
+
+        Args:
+            title: Section heading
+            columns: Column headers
+            rows: Table rows, one value per column
+            scenario: Scenario the table belongs to (optional)
+        """
+        self.sections.append({
+            "title": title,
+            "scenario": scenario,
+            "columns": columns,
+            "rows": rows,
+        })
+
+    def set_table(
+        self,
+        title: str,
+        columns: list[str],
+        rows: list[list[Any]],
+        scenario: str | None = None,
+    ) -> None:
+        """Add a table, replacing an earlier one with the same title and scenario."""
+        self.sections = [
+            s for s in self.sections
+            if (s["title"], s["scenario"]) != (title, scenario)
+        ]
+        self.add_table(title, columns, rows, scenario=scenario)
+
+    def add_latency(
+        self,
+        scenario: str,
+        name: str,
+        samples: Iterable[float] | LogLinearHistogram
+    ) -> None:
+        """
+        Add a latency distribution for the baseline store.
+
+        Args:
+            scenario: Scenario the latencies belong to
+            name: Metric name, unique within the scenario
+            samples: Latencies in seconds, or a histogram of them
+        """
+        if not isinstance(samples, LogLinearHistogram):
+            histogram = LogLinearHistogram()
+            for sample in samples:
+                histogram.record(sample)
+            samples = histogram
+        if samples.total:
+            self.metrics.append(Metric(scenario, name, "ms", histogram=samples))
+
+    def add_value(
+        self,
+        scenario: str,
+        name: str,
+        value: float | None,
+        unit: str,
+        higher_is_better: bool = False
+    ) -> None:
+        """Add a scalar figure (throughput, size, duration) for the baseline store."""
+        if value is not None:
+            self.metrics.append(Metric(scenario, name, unit, higher_is_better, value=float(value)))
+
+    def render(self) -> str:
+        """Render all sections as plain-text tables."""
+        blocks = []
+        for section in self.sections:
+            rows = [[_format_cell(v) for v in row] for row in section["rows"]]
+            widths = [len(c) for c in section["columns"]]
+            for row in rows:
+                for i, cell in enumerate(row):
+                    widths[i] = max(widths[i], len(cell))
+
+            heading = section["title"]
+            if section["scenario"]:
+                heading += f" ({section['scenario']})"
+
+            lines = [heading]
+            lines.append("  ".join(c.ljust(w) for c, w in zip(section["columns"], widths)))
+            lines.append("  ".join("-" * w for w in widths))
+            for row in rows:
+                lines.append("  ".join(c.ljust(w) for c, w in zip(row, widths)))
+            blocks.append("\n".join(lines))
+
+        return "\n\n".join(blocks)
+
+    def write_json(self, path: Path) -> None:
+        """Write all sections to a JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.sections, indent=2, default=str))
+
+
+def _format_cell(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    if value is None:
+        return "-"
+    return str(value)
+
+
+# Shared report for the whole test session
+REPORT = PerformanceReport()
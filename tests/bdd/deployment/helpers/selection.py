@@ -0,0 +1,201 @@
+"""Change-aware scenario selection and memoized static scenarios.
+
+Feature tags, and the ``@inputs-<name>`` tags of static scenarios, map to the
+repository paths they depend on (``DEPENDENCIES``). A ``service:<name>``
+entry expands to the compose service's Dockerfile and the paths it copies
+from the build context; ``service:*`` means every built service.
+
+Given the files changed since a git base, a scenario is affected when one of
+its paths, its own feature or step definition file, or the shared harness
+changed. A scenario tagged ``@inputs-*`` depends on those inputs only, and
+its result is memoized: it passes without running again while the content
+hash of its inputs matches the one of its last passing run.
+"""
+
+import fnmatch
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+
+import yaml
+
+from helpers.build_orchestrator import _dockerfile_sources
+
+# Tag prefix of the narrow inputs of a static, memoizable scenario
+INPUTS_TAG_PREFIX = "inputs-"
+
+COMPOSE_FILES = ["docker-compose.yml", "docker-compose.override.yml"]
+TASKFILES = ["Taskfile.yml", "taskfiles/*"]
+
+# Root files of the bun workspace that every image build reads
+WORKSPACE_FILES = ["package.json", "bun.lock*", "bunfig.toml", "tsconfig*.json"]
+
+# Repository paths each tag depends on
+DEPENDENCIES: dict[str, list[str]] = {
+    "quick-evaluation": ["service:*", *COMPOSE_FILES, *TASKFILES, ".env.example"],
+    "developer-workflow": ["service:*", *COMPOSE_FILES, *TASKFILES],
+    "production-deployment": ["service:*", *COMPOSE_FILES, "docker-compose.prod.yml", ".env.example"],
+    "diagnostics": ["service:*", *COMPOSE_FILES, *TASKFILES],
+    "safety": ["service:*", *COMPOSE_FILES, *TASKFILES],
+    "endpoint-validation": ["service:*", *COMPOSE_FILES],
+    "build-performance": ["service:*", *COMPOSE_FILES],
+    "load-performance": ["service:feedback-server", *COMPOSE_FILES],
+    "database-profiling": ["packages/feedback-server/src/db/*", *COMPOSE_FILES],
+    "backend-comparison": ["service:feedback-server", *COMPOSE_FILES],
+    "dependency-outage": ["service:feedback-server", *COMPOSE_FILES],
+    "page-weight": ["service:feedback-webui", "service:feedback-example", *COMPOSE_FILES],
+    "response-compression": ["service:feedback-server", *COMPOSE_FILES],
+    "attachment-ingestion": ["service:feedback-server", *COMPOSE_FILES],
+    "inputs-taskfile": TASKFILES,
+    "inputs-compose": COMPOSE_FILES,
+}
+
+# Harness files every scenario depends on (relative to the repository root)
+HARNESS = [
+    "tests/bdd/deployment/conftest.py",
+    "tests/bdd/deployment/pytest.ini",
+    "tests/bdd/deployment/requirements.txt",
+    "tests/bdd/deployment/step_defs/conftest.py",
+    "tests/bdd/deployment/helpers/*",
+    "tests/bdd/deployment/compose/*",
+]
+
+
+def git_files(repo_root: Path, *args: str) -> list[str]:
+    """Paths printed by a git command, one per line."""
+    result = subprocess.run(
+        ["git", *args], cwd=repo_root, capture_output=True, text=True, timeout=60
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(repo_root: Path, base: str = "HEAD") -> set[str]:
+    """
+    Files changed since the merge base of ``base`` and HEAD.
+
+    Includes committed, staged, unstaged and untracked (not ignored) changes,
+    so ``base=origin/main`` covers a whole PR branch.
+    """
+    merge_base = git_files(repo_root, "merge-base", base, "HEAD")[0]
+    return set(git_files(repo_root, "diff", "--name-only", merge_base)) | set(
+        git_files(repo_root, "ls-files", "--others", "--exclude-standard")
+    )
+
+
+def service_patterns(repo_root: Path) -> dict[str, list[str]]:
+    """
+    Path patterns of every built compose service: Dockerfile plus copied sources.
+
+    A ``COPY . .`` of the whole context is narrowed to the workspace packages
+    whose manifests the Dockerfile copies, plus the root workspace files;
+    counting every file of the monorepo would select everything on any change.
+    """
+    with open(repo_root / "docker-compose.yml") as f:
+        services = (yaml.safe_load(f) or {}).get("services", {})
+
+    patterns: dict[str, list[str]] = {}
+    for name, config in services.items():
+        build = config.get("build")
+        if not build:
+            continue
+        if isinstance(build, str):
+            build = {"context": build}
+        context = Path(build.get("context", "."))
+        dockerfile = context / build.get("dockerfile", "Dockerfile")
+
+        sources = [
+            (context / source).as_posix().removeprefix("./").rstrip("/")
+            for source in _dockerfile_sources(repo_root / dockerfile)
+        ]
+        if "." in sources:
+            sources = [
+                *WORKSPACE_FILES,
+                *{str(Path(s).parent) for s in sources if s.endswith("package.json")},
+            ]
+        patterns[name] = [dockerfile.as_posix()]
+        for source in sources:
+            patterns[name] += [source, f"{source}/*"]
+    return patterns
+
+
+class ScenarioSelector:
+    """
+    Decide which scenarios a change affects and which static ones are memoized.
+
+    Usage:
+        selector = ScenarioSelector(repo_root, cache_dir / "selection.json")
+        selector.affected(tags, own_files, changed)
+        selector.memoized(nodeid, tags, own_files)
+        selector.record_pass(nodeid, tags, own_files)
+        selector.save()
+    """
+
+    def __init__(self, repo_root: Path, memo_path: Path):
+        self.repo_root = repo_root
+        self.memo_path = memo_path
+        self.services = service_patterns(repo_root)
+        self._tracked = git_files(repo_root, "ls-files", "-co", "--exclude-standard")
+        self._file_hashes: dict[str, str] = {}
+        try:
+            self.memo: dict[str, str] = json.loads(memo_path.read_text())
+        except (OSError, ValueError):
+            self.memo = {}
+
+    def patterns(self, tags: set[str], own_files: list[str]) -> list[str]:
+        """Path patterns a scenario depends on; ``@inputs-*`` tags narrow them."""
+        inputs = {tag for tag in tags if tag.startswith(INPUTS_TAG_PREFIX)}
+        patterns = [*HARNESS, *own_files]
+        for tag in sorted(inputs or tags):
+            for entry in DEPENDENCIES.get(tag, []):
+                if entry == "service:*":
+                    patterns += [p for service in self.services.values() for p in service]
+                elif entry.startswith("service:"):
+                    patterns += self.services.get(entry.split(":", 1)[1], [])
+                else:
+                    patterns.append(entry)
+        return patterns
+
+    def affected(self, tags: set[str], own_files: list[str], changed: set[str]) -> list[str]:
+        """Changed files the scenario depends on (empty when it is unaffected)."""
+        patterns = self.patterns(tags, own_files)
+        return sorted(
+            path for path in changed
+            if any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+        )
+
+    def input_hash(self, tags: set[str], own_files: list[str]) -> str:
+        """Content hash of every tracked file the scenario depends on."""
+        patterns = self.patterns(tags, own_files)
+        digest = hashlib.sha256()
+        for path in self._tracked:
+            if any(fnmatch.fnmatch(path, pattern) for pattern in patterns):
+                digest.update(path.encode())
+                digest.update(self._hash_file(path).encode())
+        return digest.hexdigest()
+
+    def memoizable(self, tags: set[str]) -> bool:
+        return any(tag.startswith(INPUTS_TAG_PREFIX) for tag in tags)
+
+    def memoized(self, nodeid: str, tags: set[str], own_files: list[str]) -> bool:
+        """True when the scenario passed before with identical inputs."""
+        return self.memoizable(tags) and self.memo.get(nodeid) == self.input_hash(tags, own_files)
+
+    def record_pass(self, nodeid: str, tags: set[str], own_files: list[str]) -> None:
+        if self.memoizable(tags):
+            self.memo[nodeid] = self.input_hash(tags, own_files)
+
+    def save(self) -> None:
+        self.memo_path.parent.mkdir(parents=True, exist_ok=True)
+        self.memo_path.write_text(json.dumps(self.memo, indent=2, sort_keys=True))
+
+    def _hash_file(self, path: str) -> str:
+        if path not in self._file_hashes:
+            try:
+                content = (self.repo_root / path).read_bytes()
+            except OSError:
+                content = b""
+            self._file_hashes[path] = hashlib.sha256(content).hexdigest()
+        return self._file_hashes[path]
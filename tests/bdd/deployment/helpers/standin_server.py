@@ -0,0 +1,1434 @@
+"""In-process stand-in for the feedback-server, WebUI and feedback-example.
+
+A pure-stdlib asyncio HTTP/1.1 and WebSocket server that implements the
+health, docs, feedback, video-chunk and sync contracts of
+``packages/feedback-server/src/routes`` on an in-memory store, plus minimal
+HTML pages on the WebUI and example ports. It binds the same ports as the
+compose stack, so the harness reaches it through ``SERVICE_URLS`` and the
+load, latency and timeout tooling runs in seconds without containers.
+
+Latency and server errors can be injected into every feedback-server
+request. Request and response lines are logged in the Hono logger format
+the real server prints.
+"""
+
+import asyncio
+import base64
+import csv
+import hashlib
+import io
+import json
+import math
+import random
+import re
+import secrets
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from urllib.parse import parse_qsl, urlsplit
+
+import yaml
+
+SERVER_VERSION = "0.1.0"
+
+# Mirrors packages/feedback-server/src/routes/video.ts
+CHUNK_SIZE = 5 * 1024 * 1024
+MAX_VIDEO_SIZE = 500 * 1024 * 1024
+
+FEEDBACK_TYPES = ("bug", "feature", "improvement", "question", "other")
+FEEDBACK_STATUSES = ("pending", "in_progress", "resolved", "closed", "archived")
+FEEDBACK_PRIORITIES = ("low", "medium", "high", "critical")
+
+# Generated OpenAPI document locations, as tried by routes/docs.ts
+OPENAPI_CANDIDATES = (
+    "packages/generated/openapi/openapi.yaml",
+    "packages/feedback-server/src/generated/openapi.yaml",
+)
+
+# Server log lines kept in memory
+MAX_LOG_LINES = 10_000
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def new_id() -> str:
+    """Return a nanoid-like 21 character id."""
+    return secrets.token_urlsafe(16)[:21]
+
+
+# =============================================================================
+# HTTP PRIMITIVES
+# =============================================================================
+
+@dataclass
+class FaultConfig:
+    """Latency and errors injected into every feedback-server request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def delay(self, rng: random.Random) -> float:
+        """Return the injected delay in seconds."""
+        if not self.latency_ms and not self.jitter_ms:
+            return 0.0
+        return max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes = b""
+    params: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        """Decode the JSON body; raises ValueError on malformed JSON."""
+        return json.loads(self.body or b"null")
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "application/json"
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def encode(self, keep_alive: bool, head: bool = False) -> bytes:
+        lines = [f"HTTP/1.1 {self.status} {HTTPStatus(self.status).phrase}"]
+        if self.status != 204:
+            lines.append(f"Content-Type: {self.content_type}")
+            lines.append(f"Content-Length: {len(self.body)}")
+        lines.extend(f"{name}: {value}" for name, value in self.headers.items())
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        head_bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head_bytes if head or self.status == 204 else head_bytes + self.body
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    return Response(status, json.dumps(data, separators=(",", ":")).encode())
+
+
+def not_found(request: Request) -> Response:
+    return json_response({
+        "error": "Not Found",
+        "message": f"Route {request.method} {request.path} not found",
+        "statusCode": 404,
+    }, 404)
+
+
+def validation_failed(message: str) -> Response:
+    """400 in the shape of @hono/zod-validator failures."""
+    return json_response({
+        "success": False,
+        "error": {"name": "ZodError", "issues": [{"message": message}]},
+    }, 400)
+
+
+def app_error(status: int, name: str, message: str, code: str) -> Response:
+    """Error in the shape of the server's AppError handler."""
+    return json_response({"error": name, "message": message, "code": code}, status)
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class Router:
+    """Method + path-pattern routing with ``:param`` segments."""
+
+    def __init__(self):
+        self.routes: list[tuple[str, re.Pattern, Handler]] = []
+
+    def add(self, method: str, pattern: str, handler: Handler) -> None:
+        regex = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", pattern.rstrip("/"))
+        self.routes.append((method, re.compile(f"^{regex}/?$"), handler))
+
+    def resolve(self, request: Request) -> Handler | None:
+        method = "GET" if request.method == "HEAD" else request.method
+        for route_method, regex, handler in self.routes:
+            match = regex.match(request.path)
+            if match and route_method == method:
+                request.params = match.groupdict()
+                return handler
+        return None
+
+
+# =============================================================================
+# IN-MEMORY STORE
+# =============================================================================
+
+def _check_create(data: Any) -> str | None:
+    """Validate a create-feedback body; returns an error message or None."""
+    if not isinstance(data, dict):
+        return "Expected object"
+    for name in ("projectId", "sessionId", "title"):
+        if not isinstance(data.get(name), str) or not data[name]:
+            return f"{name}: Required"
+    if len(data["title"]) > 200:
+        return "title: String must contain at most 200 character(s)"
+    if data.get("type", "bug") not in FEEDBACK_TYPES:
+        return "type: Invalid enum value"
+    if data.get("priority", "medium") not in FEEDBACK_PRIORITIES:
+        return "priority: Invalid enum value"
+    return None
+
+
+class FeedbackStore:
+    """Feedback, attachments, videos and the sync log, all in memory."""
+
+    def __init__(self):
+        self.feedback: dict[str, dict] = {}
+        self.attachments: dict[str, dict[str, list]] = {}
+        self.versions: dict[str, int] = {}
+        self.videos: dict[str, dict] = {}
+        self.chunks: dict[str, set[int]] = defaultdict(set)
+        self.changes: list[dict] = []
+        self.sync_queue: list[dict] = []
+
+    def create(self, data: dict, status: str = "pending") -> dict:
+        now = now_iso()
+        item = {
+            "id": new_id(),
+            "projectId": data["projectId"],
+            "sessionId": data.get("sessionId") or new_id(),
+            "title": data["title"],
+            "description": data.get("description"),
+            "type": data.get("type", "bug"),
+            "status": data.get("status", status),
+            "priority": data.get("priority", "medium"),
+            "environment": data.get("environment"),
+            "userEmail": data.get("userEmail"),
+            "userName": data.get("userName"),
+            "videoId": None,
+            "tags": data.get("tags"),
+            "metadata": data.get("metadata"),
+            "createdAt": now,
+            "updatedAt": now,
+            "syncedAt": None,
+        }
+        self.feedback[item["id"]] = item
+        self.versions[item["id"]] = 1
+        self.attachments[item["id"]] = {
+            "screenshots": [
+                {"id": new_id(), "feedbackId": item["id"], "capturedAt": now, **s}
+                for s in data.get("screenshots") or []
+            ],
+            "consoleLogs": [
+                {"id": new_id(), "feedbackId": item["id"], **log}
+                for log in data.get("consoleLogs") or []
+            ],
+            "networkRequests": [
+                {"id": new_id(), "feedbackId": item["id"], **r}
+                for r in data.get("networkRequests") or []
+            ],
+        }
+        self._record_change(item, "create")
+        return item
+
+    def update(self, item_id: str, data: dict) -> dict | None:
+        item = self.feedback.get(item_id)
+        if item is None:
+            return None
+        item.update({k: v for k, v in data.items() if k not in ("id", "createdAt")})
+        item["updatedAt"] = now_iso()
+        self.versions[item_id] += 1
+        self._record_change(item, "update")
+        return item
+
+    def delete(self, item_id: str) -> bool:
+        item = self.feedback.pop(item_id, None)
+        if item is None:
+            return False
+        self.attachments.pop(item_id, None)
+        self._record_change(item, "delete")
+        return True
+
+    def query(
+        self,
+        predicate: Callable[[dict], bool],
+        sort_by: str,
+        descending: bool,
+        page: int,
+        size: int,
+    ) -> tuple[list[dict], int]:
+        """Return one page of matching items and the total match count."""
+        matches = [item for item in self.feedback.values() if predicate(item)]
+        matches.sort(key=lambda item: item.get(sort_by) or "", reverse=descending)
+        offset = (page - 1) * size
+        return matches[offset:offset + size], len(matches)
+
+    def _record_change(self, item: dict, operation: str) -> None:
+        timestamp = now_iso()
+        self.changes.append({
+            "entityType": "feedback",
+            "entityId": item["id"],
+            "operation": operation,
+            "payload": item if operation != "delete" else {},
+            "timestamp": timestamp,
+            "version": self.versions.get(item["id"], 1),
+            "projectId": item["projectId"],
+        })
+        self.sync_queue.append({
+            "id": new_id(), "operation": operation, "entityId": item["id"],
+            "createdAt": timestamp, "processedAt": None, "retryCount": 0,
+        })
+
+
+# =============================================================================
+# FEEDBACK-SERVER APPLICATION
+# =============================================================================
+
+def _int_param(value: str | None, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+    """Coerce a query parameter like z.coerce.number(); raises ValueError when out of range."""
+    number = default if value in (None, "") else int(value)
+    if number < minimum or (maximum is not None and number > maximum):
+        raise ValueError(f"{number} is out of range")
+    return number
+
+
+class FeedbackServerApp:
+    """Routes of the feedback-server on top of ``FeedbackStore``."""
+
+    def __init__(self, faults: FaultConfig | None = None, repo_root: Path | None = None, seed: int = 0):
+        self.faults = faults or FaultConfig()
+        self.repo_root = repo_root
+        self.store = FeedbackStore()
+        self.logs: deque[str] = deque(maxlen=MAX_LOG_LINES)
+        self.log_listeners: list[Callable[[str], None]] = []
+        self.websockets: set["WebSocketConnection"] = set()
+        self.started = time.monotonic()
+        self._rng = random.Random(seed)
+        self._spec: dict | None = None
+        self.router = Router()
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        add = self.router.add
+        add("GET", "/", self.server_info)
+        add("GET", "/ws", self.websocket_info)
+
+        add("GET", "/api/v1/health", self.health)
+        add("GET", "/api/v1/health/detailed", self.health_detailed)
+        add("GET", "/api/v1/health/ready", self.health_ready)
+        add("GET", "/api/v1/health/live", self.health_live)
+
+        add("GET", "/api/docs", self.docs_ui)
+        add("GET", "/api/docs/openapi.json", self.docs_json)
+        add("GET", "/api/docs/openapi.yaml", self.docs_yaml)
+
+        # Static segments before :id, as in routes/feedback.ts
+        add("GET", "/api/v1/feedback", self.list_feedback)
+        add("GET", "/api/v1/feedback/stats", self.feedback_stats)
+        add("GET", "/api/v1/feedback/export", self.export_feedback)
+        add("POST", "/api/v1/feedback/import", self.import_feedback)
+        add("PATCH", "/api/v1/feedback/bulk", self.bulk_update)
+        add("DELETE", "/api/v1/feedback/bulk", self.bulk_delete)
+        add("POST", "/api/v1/feedback/search", self.search_feedback)
+        add("GET", "/api/v1/feedback/:id", self.get_feedback)
+        add("POST", "/api/v1/feedback", self.create_feedback)
+        add("PATCH", "/api/v1/feedback/:id", self.update_feedback)
+        add("DELETE", "/api/v1/feedback/:id", self.delete_feedback)
+
+        add("POST", "/api/v1/videos/init", self.init_video)
+        add("PUT", "/api/v1/videos/:videoId/chunks/:chunkNumber", self.upload_chunk)
+        add("POST", "/api/v1/videos/:videoId/complete", self.complete_video)
+        add("GET", "/api/v1/videos", self.list_videos)
+        add("GET", "/api/v1/videos/:videoId", self.get_video)
+        add("DELETE", "/api/v1/videos/:videoId", self.delete_video)
+
+        add("POST", "/api/v1/sync", self.sync)
+        add("GET", "/api/v1/sync/changes", self.sync_changes)
+        add("GET", "/api/v1/sync/status", self.sync_status)
+        add("POST", "/api/v1/sync/process", self.sync_process)
+        add("DELETE", "/api/v1/sync/cleanup", self.sync_cleanup)
+        add("POST", "/api/v1/sync/batch", self.sync_batch)
+
+    async def __call__(self, request: Request) -> Response:
+        start = time.perf_counter()
+        self._log(f"<-- {request.method} {request.path}")
+
+        delay = self.faults.delay(self._rng)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.faults.error_rate and self._rng.random() < self.faults.error_rate:
+            response = json_response({
+                "error": "Internal Server Error", "message": "Injected failure",
+            }, 500)
+        else:
+            handler = self.router.resolve(request)
+            try:
+                response = await handler(request) if handler else not_found(request)
+            except ValueError as e:
+                response = validation_failed(str(e))
+            except (TypeError, KeyError, AttributeError) as e:
+                self._log(f"Unhandled error: {type(e).__name__}: {e}")
+                response = json_response({
+                    "error": "Internal Server Error", "message": str(e),
+                }, 500)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self._log(f"--> {request.method} {request.path} {response.status} {elapsed:.0f}ms")
+        return response
+
+    def _log(self, line: str) -> None:
+        self.logs.append(line)
+        for listener in self.log_listeners:
+            listener(line)
+
+    def broadcast(self, event: dict) -> None:
+        message = json.dumps(event)
+        for connection in list(self.websockets):
+            connection.send_text(message)
+
+    # -------------------------------------------------------------------------
+    # Info, health and docs
+    # -------------------------------------------------------------------------
+
+    async def server_info(self, request: Request) -> Response:
+        return json_response({
+            "name": "@react-visual-feedback/server",
+            "version": SERVER_VERSION,
+            "apiVersion": "v1",
+            "docs": "/api/v1/docs",
+            "health": "/api/v1/health",
+        })
+
+    async def websocket_info(self, request: Request) -> Response:
+        return json_response({
+            "message": "WebSocket endpoint. Connect using ws:// or wss:// protocol.",
+            "stats": {"totalConnections": len(self.websockets)},
+            "upgradeRequired": True,
+        })
+
+    def _uptime(self) -> int:
+        return int(time.monotonic() - self.started)
+
+    async def health(self, request: Request) -> Response:
+        return json_response({
+            "status": "healthy",
+            "version": SERVER_VERSION,
+            "uptime": self._uptime(),
+            "timestamp": now_iso(),
+        })
+
+    async def health_detailed(self, request: Request) -> Response:
+        return json_response({
+            "status": "healthy",
+            "version": SERVER_VERSION,
+            "uptime": self._uptime(),
+            "timestamp": now_iso(),
+            "components": [
+                {"name": "database", "status": "healthy", "responseTime": 0},
+                {"name": "storage", "status": "healthy", "responseTime": 0},
+            ],
+        })
+
+    async def health_ready(self, request: Request) -> Response:
+        return json_response({"ready": True})
+
+    async def health_live(self, request: Request) -> Response:
+        return json_response({"alive": True})
+
+    async def docs_ui(self, request: Request) -> Response:
+        html = (
+            "<!doctype html><html><head><title>SwaggerUI</title></head><body>"
+            '<div id="swagger-ui"></div>'
+            '<script>window.ui = SwaggerUIBundle({url: "/api/docs/openapi.json"})</script>'
+            "</body></html>"
+        )
+        return Response(200, html.encode(), "text/html; charset=UTF-8")
+
+    def openapi_spec(self) -> dict:
+        """The generated spec when it exists in the repo, else the built-in one."""
+        if self._spec is None:
+            self._spec = builtin_openapi()
+            for candidate in OPENAPI_CANDIDATES if self.repo_root is not None else ():
+                path = self.repo_root / candidate
+                if path.exists():
+                    self._spec = yaml.safe_load(path.read_text())
+                    break
+        return self._spec
+
+    async def docs_json(self, request: Request) -> Response:
+        return json_response(self.openapi_spec())
+
+    async def docs_yaml(self, request: Request) -> Response:
+        return Response(200, yaml.safe_dump(self.openapi_spec()).encode(), "text/yaml")
+
+    # -------------------------------------------------------------------------
+    # Feedback
+    # -------------------------------------------------------------------------
+
+    async def list_feedback(self, request: Request) -> Response:
+        q = request.query
+        page = _int_param(q.get("page"), 1)
+        limit = _int_param(q.get("limit"), 20, maximum=100)
+        sort_by = q.get("sortBy", "createdAt")
+        if sort_by not in ("createdAt", "updatedAt", "priority"):
+            return validation_failed("sortBy: Invalid enum value")
+
+        search = (q.get("search") or "").lower()
+
+        def matches(item: dict) -> bool:
+            for name in ("projectId", "status", "type", "priority"):
+                if q.get(name) and item[name] != q[name]:
+                    return False
+            return not search or search in item["title"].lower() \
+                or search in (item["description"] or "").lower()
+
+        items, total = self.store.query(matches, sort_by, q.get("sortOrder") != "asc", page, limit)
+        return json_response({
+            "items": items,
+            "pagination": {
+                "page": page, "limit": limit, "total": total,
+                "totalPages": math.ceil(total / limit),
+            },
+        })
+
+    async def feedback_stats(self, request: Request) -> Response:
+        project_id = request.query.get("projectId")
+        items = [i for i in self.store.feedback.values() if not project_id or i["projectId"] == project_id]
+        by = {"byStatus": "status", "byType": "type", "byPriority": "priority"}
+        stats: dict[str, Any] = {"total": len(items)}
+        for key, column in by.items():
+            counts: dict[str, int] = defaultdict(int)
+            for item in items:
+                counts[item[column]] += 1
+            stats[key] = dict(counts)
+        return json_response(stats)
+
+    async def export_feedback(self, request: Request) -> Response:
+        project_id = request.query.get("projectId")
+        items = sorted(
+            (i for i in self.store.feedback.values() if not project_id or i["projectId"] == project_id),
+            key=lambda i: i["createdAt"], reverse=True,
+        )
+        columns = ["id", "projectId", "title", "description", "type", "status",
+                   "priority", "userEmail", "userName", "createdAt"]
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(columns)
+        for item in items:
+            writer.writerow([item.get(c) or "" for c in columns])
+        filename = f"feedback-export-{datetime.now(timezone.utc).date().isoformat()}.csv"
+        return Response(200, out.getvalue().rstrip("\n").encode(), "text/csv", {
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        })
+
+    async def import_feedback(self, request: Request) -> Response:
+        if "text/csv" in request.headers.get("content-type", ""):
+            rows = list(csv.DictReader(io.StringIO(request.body.decode())))
+            items = [{k: v for k, v in row.items() if v} for row in rows]
+            skip_errors = request.query.get("skipErrors") == "true"
+        else:
+            try:
+                body = request.json()
+            except ValueError:
+                return json_response({"success": False, "error": "Invalid JSON"}, 400)
+            if not isinstance(body, dict) or not isinstance(body.get("items"), list):
+                return json_response({"success": False, "error": "Invalid request format"}, 400)
+            items = body["items"]
+            skip_errors = bool(body.get("skipErrors", False))
+
+        if not items:
+            return json_response({
+                "success": True, "imported": 0, "failed": 0, "errors": [],
+                "message": "No items to import",
+            })
+
+        imported_ids: list[str] = []
+        errors = []
+        for index, item in enumerate(items):
+            error = _check_create({"sessionId": new_id(), **item} if isinstance(item, dict) else item)
+            if error is None and item.get("status", "pending") not in FEEDBACK_STATUSES:
+                error = "status: Invalid enum value"
+            if error:
+                errors.append({"index": index, "error": "Validation failed", "details": [{"message": error}]})
+                continue
+            imported_ids.append(self.store.create(item)["id"])
+
+        failed = len(errors)
+        status = 400 if failed and not skip_errors else 207 if failed else 201
+        return json_response({
+            "success": failed == 0,
+            "imported": len(imported_ids),
+            "failed": failed,
+            **({"errors": errors} if errors else {}),
+            "importedIds": imported_ids,
+            "message": f"Successfully imported {len(imported_ids)} items" if not failed
+            else f"Imported {len(imported_ids)} items with {failed} failures",
+        }, status)
+
+    async def bulk_update(self, request: Request) -> Response:
+        body = request.json()
+        if not isinstance(body, dict) or not body.get("ids") or not isinstance(body.get("update"), dict):
+            return validation_failed("ids: Array must contain at least 1 element(s)")
+        updated = [i for i in body["ids"] if self.store.update(i, body["update"]) is not None]
+        if updated:
+            self.broadcast({"type": "feedback.bulk_update", "timestamp": now_iso(),
+                            "feedbackIds": updated, "action": "update"})
+        return json_response({"updated": len(updated), "updatedIds": updated})
+
+    async def bulk_delete(self, request: Request) -> Response:
+        body = request.json()
+        if not isinstance(body, dict) or not body.get("ids"):
+            return validation_failed("ids: Array must contain at least 1 element(s)")
+        deleted = [i for i in body["ids"] if self.store.delete(i)]
+        return json_response({"deleted": len(deleted)})
+
+    async def search_feedback(self, request: Request) -> Response:
+        search = request.json()
+        if not isinstance(search, dict):
+            return validation_failed("Expected object")
+        page = _int_param(search.get("page"), 1)
+        size = _int_param(search.get("pageSize"), 20, maximum=100)
+        fields = search.get("searchFields") or ["title", "description"]
+        text = (search.get("query") or "").strip().lower()
+
+        def as_set(value: Any) -> set | None:
+            if value is None:
+                return None
+            return set(value) if isinstance(value, list) else {value}
+
+        statuses, types, priorities = (as_set(search.get(k)) for k in ("status", "type", "priority"))
+        date_field = search.get("dateField", "createdAt")
+
+        def matches(item: dict) -> bool:
+            if search.get("projectId") and item["projectId"] != search["projectId"]:
+                return False
+            if search.get("sessionId") and item["sessionId"] != search["sessionId"]:
+                return False
+            if statuses and item["status"] not in statuses:
+                return False
+            if types and item["type"] not in types:
+                return False
+            if priorities and item["priority"] not in priorities:
+                return False
+            if search.get("startDate") and item[date_field] < search["startDate"]:
+                return False
+            if search.get("endDate") and item[date_field] > search["endDate"]:
+                return False
+            if search.get("tags") and not set(search["tags"]) <= set(item.get("tags") or []):
+                return False
+            if text:
+                haystack = " ".join(str(item.get(f) or "") for f in fields).lower()
+                if text not in haystack:
+                    return False
+            return True
+
+        items, total = self.store.query(
+            matches, search.get("sortBy", "createdAt"), search.get("sortOrder") != "asc", page, size
+        )
+        return json_response({
+            "items": items,
+            "pagination": {
+                "page": page, "pageSize": size, "total": total,
+                "totalPages": math.ceil(total / size), "hasMore": page * size < total,
+            },
+            "filters": {k: search.get(k) for k in ("query", "projectId", "status", "type", "priority")},
+        })
+
+    async def get_feedback(self, request: Request) -> Response:
+        item = self.store.feedback.get(request.params["id"])
+        if item is None:
+            return json_response({"error": "Feedback not found"}, 404)
+        return json_response({**item, **self.store.attachments.get(item["id"], {})})
+
+    async def create_feedback(self, request: Request) -> Response:
+        data = request.json()
+        error = _check_create(data)
+        if error:
+            return validation_failed(error)
+        item = self.store.create(data)
+        self.broadcast({"type": "feedback.created", "timestamp": now_iso(), "feedback": item})
+        return json_response(item, 201)
+
+    async def update_feedback(self, request: Request) -> Response:
+        data = request.json()
+        if not isinstance(data, dict):
+            return validation_failed("Expected object")
+        if data.get("status", "pending") not in FEEDBACK_STATUSES:
+            return validation_failed("status: Invalid enum value")
+        item = self.store.update(request.params["id"], data)
+        if item is None:
+            return json_response({"error": "Feedback not found"}, 404)
+        self.broadcast({"type": "feedback.updated", "timestamp": now_iso(),
+                        "feedback": item, "changedFields": list(data)})
+        return json_response(item)
+
+    async def delete_feedback(self, request: Request) -> Response:
+        if not self.store.delete(request.params["id"]):
+            return json_response({"error": "Feedback not found"}, 404)
+        self.broadcast({"type": "feedback.deleted", "timestamp": now_iso(),
+                        "feedbackId": request.params["id"]})
+        return Response(204)
+
+    # -------------------------------------------------------------------------
+    # Videos
+    # -------------------------------------------------------------------------
+
+    def _video_response(self, video: dict) -> dict:
+        response = {k: v for k, v in video.items() if k not in ("totalChunks", "uploadedChunks")}
+        if video["status"] == "ready":
+            response["url"] = f"/api/v1/videos/{video['id']}/stream"
+        if video["status"] == "uploading" and video["totalChunks"]:
+            response["uploadProgress"] = round(video["uploadedChunks"] / video["totalChunks"] * 100)
+        return response
+
+    async def init_video(self, request: Request) -> Response:
+        data = request.json()
+        if not isinstance(data, dict):
+            return validation_failed("Expected object")
+        for name in ("projectId", "sessionId", "filename"):
+            if not isinstance(data.get(name), str) or not data[name]:
+                return validation_failed(f"{name}: Required")
+        if not str(data.get("mimeType", "")).startswith("video/"):
+            return validation_failed("mimeType: Invalid")
+        size = data.get("size")
+        if not isinstance(size, int) or isinstance(size, bool) or not 0 < size <= MAX_VIDEO_SIZE:
+            return validation_failed("size: Invalid")
+
+        now = now_iso()
+        video_id = new_id()
+        total_chunks = math.ceil(size / CHUNK_SIZE)
+        self.store.videos[video_id] = {
+            "id": video_id, "projectId": data["projectId"], "sessionId": data["sessionId"],
+            "feedbackId": None, "filename": data["filename"], "mimeType": data["mimeType"],
+            "size": size, "duration": data.get("duration"), "status": "uploading",
+            "totalChunks": total_chunks, "uploadedChunks": 0, "createdAt": now, "updatedAt": now,
+        }
+        expires = (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat().replace("+00:00", "Z")
+        return json_response({
+            "videoId": video_id,
+            "uploadUrl": f"/api/v1/videos/{video_id}/chunks",
+            "chunkSize": CHUNK_SIZE,
+            "totalChunks": total_chunks,
+            "expiresAt": expires,
+        }, 201)
+
+    async def upload_chunk(self, request: Request) -> Response:
+        video_id = request.params["videoId"]
+        try:
+            chunk = int(request.params["chunkNumber"])
+        except ValueError:
+            chunk = -1
+        if chunk < 0:
+            return app_error(400, "Validation", "Invalid chunk number", "VALIDATION_ERROR")
+
+        video = self.store.videos.get(video_id)
+        if video is None:
+            return app_error(404, "NotFound", f"Video with ID '{video_id}' not found", "NOT_FOUND")
+        if video["status"] != "uploading":
+            return app_error(400, "Validation",
+                             f"Cannot upload chunks to video with status: {video['status']}",
+                             "VALIDATION_ERROR")
+        if chunk >= video["totalChunks"]:
+            return app_error(400, "Validation",
+                             f"Chunk number {chunk} exceeds total chunks {video['totalChunks']}",
+                             "VALIDATION_ERROR")
+        if not request.body:
+            return app_error(400, "Validation", "Empty chunk data", "VALIDATION_ERROR")
+
+        # Only chunk numbers are kept; the bytes are not needed by any contract
+        self.store.chunks[video_id].add(chunk)
+        video["uploadedChunks"] = len(self.store.chunks[video_id])
+        video["updatedAt"] = now_iso()
+        return json_response({
+            "videoId": video_id,
+            "chunkNumber": chunk,
+            "totalChunks": video["totalChunks"],
+            "progress": round(video["uploadedChunks"] / video["totalChunks"] * 100),
+            "complete": video["uploadedChunks"] == video["totalChunks"],
+        })
+
+    async def complete_video(self, request: Request) -> Response:
+        video_id = request.params["videoId"]
+        video = self.store.videos.get(video_id)
+        if video is None:
+            return app_error(404, "NotFound", f"Video with ID '{video_id}' not found", "NOT_FOUND")
+        if video["status"] != "uploading":
+            return app_error(400, "Validation", f"Cannot complete video with status: {video['status']}",
+                             "VALIDATION_ERROR")
+        if video["uploadedChunks"] < video["totalChunks"]:
+            return app_error(400, "Validation",
+                             f"Upload incomplete: {video['uploadedChunks']}/{video['totalChunks']} "
+                             "chunks uploaded", "VALIDATION_ERROR")
+        body = request.json() or {}
+        video.update(status="ready", feedbackId=body.get("feedbackId"), updatedAt=now_iso())
+        return json_response(self._video_response(video))
+
+    async def list_videos(self, request: Request) -> Response:
+        q = request.query
+        page = _int_param(q.get("page"), 1)
+        size = _int_param(q.get("pageSize"), 20, maximum=100)
+        videos = sorted(
+            (v for v in self.store.videos.values()
+             if all(not q.get(k) or v[k] == q[k] for k in ("projectId", "sessionId", "status"))),
+            key=lambda v: v["createdAt"], reverse=True,
+        )
+        offset = (page - 1) * size
+        data = videos[offset:offset + size]
+        return json_response({
+            "data": [self._video_response(v) for v in data],
+            "total": len(videos), "page": page, "pageSize": size,
+            "hasMore": offset + len(data) < len(videos),
+        })
+
+    async def get_video(self, request: Request) -> Response:
+        video = self.store.videos.get(request.params["videoId"])
+        if video is None:
+            return json_response({"error": "Not found", "message": "Video not found"}, 404)
+        return json_response(self._video_response(video))
+
+    async def delete_video(self, request: Request) -> Response:
+        video_id = request.params["videoId"]
+        if self.store.videos.pop(video_id, None) is None:
+            return app_error(404, "NotFound", f"Video with ID '{video_id}' not found", "NOT_FOUND")
+        self.store.chunks.pop(video_id, None)
+        return Response(204)
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    def _process_sync(self, sync_request: dict) -> dict:
+        results = []
+        errors = []
+        for op in sync_request.get("operations", []):
+            local_id = op.get("localId", "")
+            payload = {"projectId": sync_request.get("projectId"), **(op.get("payload") or {})}
+            entity_id = op.get("entityId")
+
+            if op.get("operation") == "create":
+                error = _check_create({"sessionId": sync_request.get("sessionId") or new_id(), **payload})
+                if error:
+                    result = {"localId": local_id, "success": False, "error": error}
+                else:
+                    item = self.store.create({"sessionId": sync_request.get("sessionId"), **payload})
+                    result = {"localId": local_id, "success": True,
+                              "serverId": item["id"], "serverVersion": 1}
+            elif entity_id not in self.store.feedback:
+                result = {"localId": local_id, "success": op.get("operation") == "delete",
+                          "serverId": entity_id}
+                if op.get("operation") != "delete":
+                    result["error"] = "Entity not found"
+            elif op.get("operation") == "update":
+                server_version = self.store.versions[entity_id]
+                if op.get("version") is not None and op["version"] < server_version:
+                    result = {"localId": local_id, "success": False, "serverId": entity_id,
+                              "serverVersion": server_version,
+                              "error": "Conflict detected - server version is newer"}
+                else:
+                    self.store.update(entity_id, op.get("payload") or {})
+                    result = {"localId": local_id, "success": True, "serverId": entity_id,
+                              "serverVersion": server_version + 1}
+            else:
+                self.store.delete(entity_id)
+                result = {"localId": local_id, "success": True, "serverId": entity_id}
+
+            results.append(result)
+            if not result["success"]:
+                errors.append({"localId": local_id, "code": "OPERATION_FAILED",
+                               "message": result.get("error", ""), "retryable": False})
+
+        since = sync_request.get("lastSyncTimestamp")
+        response = {
+            "success": not errors,
+            "syncTimestamp": now_iso(),
+            "results": results,
+            "serverChanges": self._changes(sync_request.get("projectId"), since) if since else [],
+        }
+        if errors:
+            response["errors"] = errors
+        return response
+
+    def _changes(self, project_id: str | None, since: str | None) -> list[dict]:
+        return [
+            {k: v for k, v in change.items() if k != "projectId"}
+            for change in self.store.changes
+            if change["projectId"] == project_id and (not since or change["timestamp"] > since)
+        ]
+
+    @staticmethod
+    def _check_sync_request(body: Any) -> str | None:
+        if not isinstance(body, dict):
+            return "Expected object"
+        for name in ("clientId", "projectId"):
+            if not isinstance(body.get(name), str):
+                return f"{name}: Required"
+        if not isinstance(body.get("operations"), list):
+            return "operations: Required"
+        return None
+
+    async def sync(self, request: Request) -> Response:
+        body = request.json()
+        error = self._check_sync_request(body)
+        if error:
+            return validation_failed(error)
+        response = self._process_sync(body)
+        return json_response(response, 200 if response["success"] else 207)
+
+    async def sync_changes(self, request: Request) -> Response:
+        project_id = request.query.get("projectId")
+        if not project_id:
+            return validation_failed("projectId: Required")
+        changes = self._changes(project_id, request.query.get("since"))
+        return json_response({
+            "success": True, "timestamp": now_iso(), "changes": changes, "count": len(changes),
+        })
+
+    def _pending(self) -> list[dict]:
+        return [item for item in self.store.sync_queue if item["processedAt"] is None]
+
+    async def sync_status(self, request: Request) -> Response:
+        pending = self._pending()[:1000]
+        by_operation: dict[str, int] = defaultdict(int)
+        for item in pending:
+            by_operation[item["operation"]] += 1
+        return json_response({
+            "success": True,
+            "status": {
+                "pendingCount": len(pending),
+                "pendingByOperation": dict(by_operation),
+                "failedCount": sum(1 for item in pending if item["retryCount"] > 0),
+                "oldestPending": pending[0]["createdAt"] if pending else None,
+            },
+        })
+
+    async def sync_process(self, request: Request) -> Response:
+        body = request.json() or {}
+        pending = self._pending()[:int(body.get("limit", 100))]
+        processed_at = now_iso()
+        for item in pending:
+            item["processedAt"] = processed_at
+        return json_response({"success": True, "processed": len(pending), "failed": 0, "remaining": 0})
+
+    async def sync_cleanup(self, request: Request) -> Response:
+        days = int(request.query.get("olderThanDays") or 7)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat().replace("+00:00", "Z")
+        before = len(self.store.sync_queue)
+        self.store.sync_queue = [
+            item for item in self.store.sync_queue
+            if item["processedAt"] is None or item["processedAt"] >= cutoff
+        ]
+        return json_response({
+            "success": True,
+            "deleted": before - len(self.store.sync_queue),
+            "message": f"Cleaned up sync items older than {days} days",
+        })
+
+    async def sync_batch(self, request: Request) -> Response:
+        body = request.json()
+        if not isinstance(body, dict) or not isinstance(body.get("requests"), list):
+            return validation_failed("requests: Required")
+        for sync_request in body["requests"]:
+            error = self._check_sync_request(sync_request)
+            if error:
+                return validation_failed(error)
+        results = [self._process_sync(r) for r in body["requests"]]
+        succeeded = sum(1 for r in results if r["success"])
+        return json_response({
+            "success": succeeded == len(results),
+            "syncTimestamp": now_iso(),
+            "batchResults": results,
+            "summary": {"total": len(results), "succeeded": succeeded,
+                        "failed": len(results) - succeeded},
+        })
+
+
+# =============================================================================
+# STATIC FRONTENDS
+# =============================================================================
+
+WEBUI_HTML = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <script type="module" src="/@vite/client"></script>
+    <meta charset="UTF-8" />
+    <title>Feedback WebUI (stand-in)</title>
+  </head>
+  <body>
+    <div id="root"></div>
+    <script type="module" src="/src/main.tsx"></script>
+  </body>
+</html>
+"""
+
+EXAMPLE_HTML = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <title>Feedback Example (stand-in)</title>
+  </head>
+  <body>
+    <div id="root"></div>
+  </body>
+</html>
+"""
+
+
+class StaticApp:
+    """Serve a single-page app: one HTML document plus a few module stubs."""
+
+    def __init__(self, html: str, assets: dict[str, str] | None = None):
+        self.html = html.encode()
+        self.assets = {path: body.encode() for path, body in (assets or {}).items()}
+
+    async def __call__(self, request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return not_found(request)
+        if request.path in self.assets:
+            return Response(200, self.assets[request.path], "text/javascript")
+        return Response(200, self.html, "text/html")
+
+
+# =============================================================================
+# WEBSOCKET
+# =============================================================================
+
+class WebSocketConnection:
+    """Minimal RFC 6455 server side: text frames, ping/pong and close."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.id = new_id()
+
+    @staticmethod
+    def accept_key(key: str) -> str:
+        digest = hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()
+        return base64.b64encode(digest).decode()
+
+    def send_frame(self, opcode: int, payload: bytes) -> None:
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        self.writer.write(header + payload)
+
+    def send_text(self, message: str) -> None:
+        self.send_frame(0x1, message.encode())
+
+    async def receive(self) -> tuple[int, bytes]:
+        first, second = await self.reader.readexactly(2)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        mask = await self.reader.readexactly(4) if second & 0x80 else b""
+        payload = await self.reader.readexactly(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return opcode, payload
+
+
+async def serve_websocket(app: FeedbackServerApp, request: Request,
+                          reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Upgrade the connection and speak the feedback-server's event protocol."""
+    connection = WebSocketConnection(reader, writer)
+    writer.write((
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {connection.accept_key(request.headers['sec-websocket-key'])}\r\n\r\n"
+    ).encode())
+    connection.send_text(json.dumps({
+        "type": "connection.ack", "timestamp": now_iso(),
+        "connectionId": connection.id, "serverVersion": SERVER_VERSION,
+    }))
+    app.websockets.add(connection)
+
+    try:
+        while True:
+            await writer.drain()
+            opcode, payload = await connection.receive()
+            if opcode == 0x8:
+                connection.send_frame(0x8, payload[:2])
+                break
+            if opcode == 0x9:
+                connection.send_frame(0xA, payload)
+                continue
+            if opcode != 0x1:
+                continue
+
+            try:
+                command = json.loads(payload)
+                kind = command["type"]
+            except (ValueError, KeyError, TypeError):
+                connection.send_text(json.dumps({
+                    "type": "error", "timestamp": now_iso(),
+                    "code": "INVALID_MESSAGE", "message": "Invalid message",
+                }))
+                continue
+            if kind == "subscribe":
+                connection.send_text(json.dumps({
+                    "type": "subscription.confirmed", "timestamp": now_iso(),
+                    "channel": command.get("channel"),
+                }))
+            elif kind == "ping":
+                connection.send_text(json.dumps({"type": "pong", "timestamp": now_iso()}))
+    finally:
+        app.websockets.discard(connection)
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[Request, str] | None:
+    """Read one HTTP/1.x request; returns None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    method, target, version = request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                break
+            body += await reader.readexactly(size)
+            await reader.readline()
+        body = bytes(body)
+    else:
+        length = int(headers.get("content-length") or 0)
+        body = await reader.readexactly(length) if length else b""
+
+    url = urlsplit(target)
+    return Request(method.upper(), url.path or "/", dict(parse_qsl(url.query)), headers, body), version
+
+
+class StandinServer:
+    """
+    Run the stand-in apps on their compose ports in a background event loop.
+
+    Usage:
+        server = StandinServer({"feedback-server": 15567, "webui": 19568,
+                                "feedback-example": 18196}).start()
+        ...
+        server.stop()
+    """
+
+    def __init__(
+        self,
+        ports: dict[str, int],
+        host: str = "127.0.0.1",
+        faults: FaultConfig | None = None,
+        repo_root: Path | None = None,
+    ):
+        self.ports = ports
+        self.host = host
+        self.api = FeedbackServerApp(faults, repo_root)
+        self.apps: dict[str, Callable[[Request], Awaitable[Response]]] = {
+            "feedback-server": self.api,
+            "webui": StaticApp(WEBUI_HTML, {
+                "/src/main.tsx": "export {}\n",
+                "/@vite/client": "export {}\n",
+            }),
+            "feedback-example": StaticApp(EXAMPLE_HTML),
+        }
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._servers: list[asyncio.base_events.Server] = []
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    def start(self, timeout: float = 10.0) -> "StandinServer":
+        """Bind every port; raises OSError if one of them is taken."""
+        self._thread = threading.Thread(target=self._run, name="standin-server", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("Stand-in server did not start")
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=10)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            for name, port in self.ports.items():
+                if name not in self.apps:
+                    continue
+                handler = self._connection_handler(self.apps[name])
+                self._servers.append(self._loop.run_until_complete(
+                    asyncio.start_server(handler, self.host, port)
+                ))
+        except OSError as e:
+            self._error = e
+            for server in self._servers:
+                server.close()
+            self._ready.set()
+            return
+
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _shutdown(self) -> None:
+        """Close the listeners and open connections, and let the handlers finish."""
+        for server in self._servers:
+            server.close()
+        for writer in list(self._connections):
+            writer.close()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        if tasks:
+            await asyncio.wait(tasks, timeout=2)
+
+    def _connection_handler(self, app: Callable[[Request], Awaitable[Response]]):
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            self._connections.add(writer)
+            try:
+                while True:
+                    parsed = await _read_request(reader)
+                    if parsed is None:
+                        break
+                    request, version = parsed
+
+                    if (
+                        app is self.api and request.path == "/ws"
+                        and request.headers.get("upgrade", "").lower() == "websocket"
+                    ):
+                        await serve_websocket(self.api, request, reader, writer)
+                        break
+
+                    response = await app(request)
+                    keep_alive = version == "HTTP/1.1" \
+                        and request.headers.get("connection", "").lower() != "close"
+                    writer.write(response.encode(keep_alive, head=request.method == "HEAD"))
+                    await writer.drain()
+                    if not keep_alive:
+                        break
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                pass
+            finally:
+                self._connections.discard(writer)
+                writer.close()
+        return handle
+
+
+# =============================================================================
+# BUILT-IN OPENAPI DOCUMENT
+# =============================================================================
+
+def _ref(name: str) -> dict:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _json(schema: dict, description: str = "OK") -> dict:
+    return {"description": description, "content": {"application/json": {"schema": schema}}}
+
+
+def _operation(operation_id: str, responses: dict, body: dict | None = None,
+               parameters: list | None = None) -> dict:
+    operation: dict[str, Any] = {"operationId": operation_id, "responses": responses}
+    if body is not None:
+        operation["requestBody"] = {"required": True, "content": {"application/json": {"schema": body}}}
+    if parameters:
+        operation["parameters"] = parameters
+    return operation
+
+
+def _path_param(name: str) -> dict:
+    return {"name": name, "in": "path", "required": True, "schema": {"type": "string"}}
+
+
+def builtin_openapi() -> dict:
+    """OpenAPI 3.0 document of the routes the stand-in implements."""
+    string = {"type": "string"}
+    nullable_string = {"type": "string", "nullable": True}
+    integer = {"type": "integer"}
+    error = _json(_ref("Error"), "Error")
+    feedback_id = [_path_param("id")]
+    video_id = [_path_param("videoId")]
+
+    schemas = {
+        "Error": {"type": "object", "required": ["error"], "properties": {"error": {}}},
+        "Feedback": {
+            "type": "object",
+            "required": ["id", "projectId", "sessionId", "title", "type", "status",
+                         "priority", "createdAt", "updatedAt"],
+            "properties": {
+                "id": string, "projectId": string, "sessionId": string, "title": string,
+                "description": nullable_string,
+                "type": {"type": "string", "enum": list(FEEDBACK_TYPES)},
+                "status": {"type": "string", "enum": list(FEEDBACK_STATUSES)},
+                "priority": {"type": "string", "enum": list(FEEDBACK_PRIORITIES)},
+                "userEmail": nullable_string, "userName": nullable_string,
+                "tags": {"type": "array", "items": string, "nullable": True},
+                "createdAt": {"type": "string", "format": "date-time"},
+                "updatedAt": {"type": "string", "format": "date-time"},
+            },
+        },
+        "CreateFeedback": {
+            "type": "object",
+            "required": ["projectId", "sessionId", "title"],
+            "properties": {
+                "projectId": {"type": "string", "example": "bdd-standin"},
+                "sessionId": {"type": "string", "example": "bdd-session"},
+                "title": {"type": "string", "example": "Stand-in feedback"},
+                "description": string,
+                "type": {"type": "string", "enum": list(FEEDBACK_TYPES)},
+                "priority": {"type": "string", "enum": list(FEEDBACK_PRIORITIES)},
+            },
+        },
+        "FeedbackList": {
+            "type": "object",
+            "required": ["items", "pagination"],
+            "properties": {
+                "items": {"type": "array", "items": _ref("Feedback")},
+                "pagination": {
+                    "type": "object",
+                    "required": ["page", "limit", "total", "totalPages"],
+                    "properties": {"page": integer, "limit": integer,
+                                   "total": integer, "totalPages": integer},
+                },
+            },
+        },
+        "SearchResult": {
+            "type": "object",
+            "required": ["items", "pagination"],
+            "properties": {
+                "items": {"type": "array", "items": _ref("Feedback")},
+                "pagination": {
+                    "type": "object",
+                    "required": ["page", "pageSize", "total", "totalPages", "hasMore"],
+                    "properties": {"page": integer, "pageSize": integer, "total": integer,
+                                   "totalPages": integer, "hasMore": {"type": "boolean"}},
+                },
+            },
+        },
+        "Health": {
+            "type": "object",
+            "required": ["status", "version", "uptime", "timestamp"],
+            "properties": {"status": string, "version": string, "uptime": integer, "timestamp": string},
+        },
+        "SyncRequest": {
+            "type": "object",
+            "required": ["clientId", "projectId", "operations"],
+            "properties": {
+                "clientId": {"type": "string", "example": "bdd-client"},
+                "projectId": {"type": "string", "example": "bdd-standin"},
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["localId", "operation", "entityType", "timestamp", "payload"],
+                        "properties": {
+                            "localId": {"type": "string", "example": "local-1"},
+                            "operation": {"type": "string", "enum": ["create", "update", "delete"]},
+                            "entityType": {"type": "string", "enum": ["feedback"]},
+                            "timestamp": {"type": "string", "format": "date-time"},
+                            "payload": {"type": "object", "example": {
+                                "title": "Synced feedback", "sessionId": "bdd-session",
+                            }},
+                        },
+                    },
+                },
+            },
+        },
+        "SyncResponse": {
+            "type": "object",
+            "required": ["success", "syncTimestamp", "results", "serverChanges"],
+            "properties": {"success": {"type": "boolean"}, "syncTimestamp": string,
+                           "results": {"type": "array"}, "serverChanges": {"type": "array"}},
+        },
+        "VideoInit": {
+            "type": "object",
+            "required": ["projectId", "sessionId", "filename", "mimeType", "size"],
+            "properties": {
+                "projectId": {"type": "string", "example": "bdd-standin"},
+                "sessionId": {"type": "string", "example": "bdd-session"},
+                "filename": {"type": "string", "example": "bdd.webm"},
+                "mimeType": {"type": "string", "example": "video/webm"},
+                "size": {"type": "integer", "example": 1024},
+            },
+        },
+    }
+
+    paths = {
+        "/api/v1/health": {"get": _operation("getHealth", {"200": _json(_ref("Health"))})},
+        "/api/v1/health/ready": {"get": _operation("getReady", {"200": _json({"type": "object"})})},
+        "/api/v1/health/live": {"get": _operation("getLive", {"200": _json({"type": "object"})})},
+        "/api/v1/feedback": {
+            "get": _operation("listFeedback", {"200": _json(_ref("FeedbackList"))}),
+            "post": _operation("createFeedback", {"201": _json(_ref("Feedback"), "Created"),
+                                                  "400": error}, body=_ref("CreateFeedback")),
+        },
+        "/api/v1/feedback/stats": {"get": _operation("getFeedbackStats", {"200": _json({
+            "type": "object", "required": ["total", "byStatus", "byType", "byPriority"],
+            "properties": {"total": integer},
+        })})},
+        "/api/v1/feedback/search": {"post": _operation(
+            "searchFeedback", {"200": _json(_ref("SearchResult"))},
+            body={"type": "object", "properties": {"query": {"type": "string", "example": "feedback"}}},
+        )},
+        "/api/v1/feedback/{id}": {
+            "get": _operation("getFeedback", {"200": _json(_ref("Feedback")), "404": error},
+                              parameters=feedback_id),
+            "patch": _operation("updateFeedback", {"200": _json(_ref("Feedback")), "404": error},
+                                body={"type": "object", "properties": {
+                                    "status": {"type": "string", "enum": list(FEEDBACK_STATUSES)},
+                                }}, parameters=feedback_id),
+        },
+        "/api/v1/videos/init": {"post": _operation(
+            "initVideoUpload", {"201": _json({
+                "type": "object", "required": ["videoId", "uploadUrl", "chunkSize", "totalChunks"],
+            }, "Created")}, body=_ref("VideoInit"),
+        )},
+        "/api/v1/videos/{videoId}": {"get": _operation(
+            "getVideo", {"200": _json({"type": "object", "required": ["id", "status"]}), "404": error},
+            parameters=video_id,
+        )},
+        "/api/v1/sync": {"post": _operation(
+            "sync", {"200": _json(_ref("SyncResponse")), "207": _json(_ref("SyncResponse"))},
+            body=_ref("SyncRequest"),
+        )},
+        "/api/v1/sync/status": {"get": _operation("getSyncStatus", {"200": _json({"type": "object"})})},
+    }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Feedback Server API (stand-in)", "version": SERVER_VERSION},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
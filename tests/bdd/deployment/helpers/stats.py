@@ -0,0 +1,39 @@
+"""Latency statistics helpers."""
+
+import math
+from typing import Iterable
+
+# Percentiles reported for every latency distribution
+REPORT_PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_samples: list[float], q: float) -> float:
+    """
+    Return the q-th percentile (nearest-rank) of pre-sorted samples.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty sample
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+def summarize(samples: Iterable[float]) -> dict[str, float]:
+    """
+    Summarize latency samples (in seconds) as milliseconds.
+
+    Returns:
+        Dictionary with count, p50, p90, p99 and max (milliseconds)
+    """
+    ordered = sorted(samples)
+    summary: dict[str, float] = {"count": len(ordered)}
+    for q in REPORT_PERCENTILES:
+        summary[f"p{q}"] = percentile(ordered, q) * 1000
+    summary["max"] = (ordered[-1] if ordered else 0.0) * 1000
+    return summary
@@ -0,0 +1,166 @@
+"""pytest-bdd plugin recording the wall time of every Given/When/Then step.
+
+Timings are keyed by feature, scenario and step text. Each run is merged into
+a JSON history so the slowest-steps table shows the mean over past runs next
+to the latest time. A scenario (or feature) tagged ``@step-budget-<seconds>``
+fails as soon as one of its steps takes longer than the budget.
+
+Registered from the root ``conftest.py`` via ``pytest_plugins``.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+
+# Tag prefix of a per-step time budget, e.g. @step-budget-120
+BUDGET_TAG_PREFIX = "step-budget-"
+
+# Rows in the slowest-steps table
+SLOWEST_STEPS = 15
+
+
+@dataclass
+class StepStats:
+    """Aggregated timings of one step across runs."""
+
+    feature: str
+    scenario: str
+    step: str
+    runs: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+    last_status: str = "passed"
+
+    @property
+    def key(self) -> str:
+        return f"{self.feature}::{self.scenario}::{self.step}"
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.runs if self.runs else 0.0
+
+    def add(self, duration: float, status: str) -> None:
+        self.runs += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.last = duration
+        self.last_status = status
+
+
+class StepTimings:
+    """Step durations of the current run, mergeable into a JSON history."""
+
+    def __init__(self):
+        self.steps: dict[str, StepStats] = {}
+        self._started: dict[tuple[str, int], float] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+
+    def start(self, nodeid: str, step) -> None:
+        self._started[(nodeid, id(step))] = time.perf_counter()
+
+    def finish(self, nodeid: str, feature, scenario, step, status: str) -> StepStats | None:
+        """Record a finished step and return its stats (None if it never started)."""
+        started = self._started.pop((nodeid, id(step)), None)
+        if started is None:
+            return None
+        duration = time.perf_counter() - started
+
+        stats = StepStats(feature.name, scenario.name, f"{step.type.capitalize()} {step.name}")
+        stats = self.steps.setdefault(stats.key, stats)
+        stats.add(duration, status)
+        return stats
+
+    def report_rows(self, history: dict[str, StepStats] | None = None) -> list[list]:
+        """Rows of the slowest steps of this run with their historical mean."""
+        history = history or {}
+        rows = []
+        for key, stats in sorted(self.steps.items(), key=lambda item: -item[1].last)[:SLOWEST_STEPS]:
+            past = history.get(key, stats)
+            rows.append([
+                stats.feature, stats.scenario, stats.step, stats.last,
+                past.mean, past.max, past.runs, stats.last_status,
+            ])
+        return rows
+
+    def merge_into(self, path: Path) -> dict[str, StepStats]:
+        """
+        Merge this run into the JSON history at ``path`` and write it back.
+
+        Returns:
+            The merged history keyed by feature::scenario::step
+        """
+        history: dict[str, StepStats] = {}
+        if path.exists():
+            try:
+                for entry in json.loads(path.read_text()).get("steps", []):
+                    stats = StepStats(**entry)
+                    history[stats.key] = stats
+            except (ValueError, TypeError):
+                history = {}
+
+        for key, stats in self.steps.items():
+            merged = history.setdefault(key, StepStats(stats.feature, stats.scenario, stats.step))
+            merged.runs += stats.runs
+            merged.total += stats.total
+            merged.max = max(merged.max, stats.max)
+            merged.last = stats.last
+            merged.last_status = stats.last_status
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(
+            {"steps": [asdict(stats) for stats in history.values()]}, indent=2
+        ))
+        return history
+
+
+# Step timings of the current run
+STEP_TIMINGS = StepTimings()
+
+
+def step_budget(feature, scenario) -> float | None:
+    """Return the tightest ``@step-budget-<seconds>`` of a scenario or its feature."""
+    budgets = []
+    for tag in set(scenario.tags) | set(feature.tags):
+        if tag.startswith(BUDGET_TAG_PREFIX):
+            try:
+                budgets.append(float(tag[len(BUDGET_TAG_PREFIX):]))
+            except ValueError:
+                continue
+    return min(budgets, default=None)
+
+
+# =============================================================================
+# HOOKS
+# =============================================================================
+
+def pytest_bdd_apply_tag(tag: str, function):
+    """Keep budget tags out of pytest markers (they would trip --strict-markers)."""
+    if tag.startswith(BUDGET_TAG_PREFIX):
+        return function
+    return None
+
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    STEP_TIMINGS.start(request.node.nodeid, step)
+
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    STEP_TIMINGS.finish(request.node.nodeid, feature, scenario, step, "failed")
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    stats = STEP_TIMINGS.finish(request.node.nodeid, feature, scenario, step, "passed")
+
+    budget = step_budget(feature, scenario)
+    if stats is not None and budget is not None and stats.last > budget:
+        stats.last_status = "over budget"
+        pytest.fail(
+            f"Step '{step.keyword} {step.name}' took {stats.last:.1f}s, "
+            f"over its {budget:g}s budget (@{BUDGET_TAG_PREFIX}{budget:g})"
+        )
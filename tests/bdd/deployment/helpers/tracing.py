@@ -0,0 +1,161 @@
+"""Request ids for tail-latency attribution.
+
+Every request from the harness HTTP client and the load workers carries a
+fresh ``X-Request-ID`` and a W3C ``traceparent`` with the same trace id.
+``SlowestRequests`` keeps the N slowest requests of a scenario in a bounded
+heap. Afterwards each is joined against the service logs: by request id
+when a line contains it, otherwise by the access line of the same method
+and path that completed around the request's end. The feedback-server
+does not log request ids today, so the time-window join is the usual path.
+Under load several such lines often share the window; the request is then
+marked "ambiguous" and gets no server duration rather than a guessed one.
+"""
+
+import heapq
+import itertools
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from helpers.access_log import ACCESS_LOG_SERVICE, parse_access_line
+from helpers.log_follower import LogFollower
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Clock skew and log latency tolerated when joining by time window, in seconds
+JOIN_SLACK = 0.25
+
+# Log lines attached to each slow request
+MAX_LOG_LINES = 5
+
+
+def trace_headers() -> dict[str, str]:
+    """Fresh ``X-Request-ID`` and ``traceparent`` headers sharing one trace id."""
+    trace_id = secrets.token_hex(16)
+    return {
+        REQUEST_ID_HEADER: trace_id,
+        "traceparent": f"00-{trace_id}-{secrets.token_hex(8)}-01",
+    }
+
+
+@dataclass
+class SlowRequest:
+    """A request kept for attribution, with the log lines joined to it."""
+
+    latency: float
+    method: str
+    path: str
+    status: int
+    request_id: str
+    started: float
+    server_duration: float | None = None
+    joined_by: str = ""
+    log_lines: list[str] = field(default_factory=list)
+
+    @property
+    def ended(self) -> float:
+        return self.started + self.latency
+
+
+class SlowestRequests:
+    """
+    Bounded min-heap of the slowest requests, usable as an ``on_response`` hook.
+
+    Usage:
+        slowest = SlowestRequests(10)
+        LoadGenerator(url, ops, on_response=slowest).run(30)
+        slowest.join(log_follower)
+        slowest.report_rows()
+    """
+
+    def __init__(self, size: int = 10):
+        self.size = size
+        self._heap: list[tuple[float, int, SlowRequest]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def offer(self, request: SlowRequest) -> None:
+        entry = (request.latency, next(self._sequence), request)
+        with self._lock:
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, entry)
+            elif request.latency > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def __call__(self, op, response, latency: float) -> None:
+        # Cheap rejection first: most responses are not among the slowest
+        if len(self._heap) >= self.size and latency <= self._heap[0][0]:
+            return
+        self.offer(SlowRequest(
+            latency=latency,
+            method=op.method,
+            path=urlsplit(response.url).path,
+            status=response.status_code,
+            request_id=response.request.headers.get(REQUEST_ID_HEADER, ""),
+            started=time.time() - latency,
+        ))
+
+    def slowest(self) -> list[SlowRequest]:
+        """Kept requests, slowest first."""
+        with self._lock:
+            return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+    def join(self, follower: LogFollower, slack: float = JOIN_SLACK) -> None:
+        """Attach service log lines to every kept request."""
+        for request in self.slowest():
+            _join_one(request, follower, slack)
+
+    def report_rows(self) -> list[list]:
+        """Rows of rank, request, status, client and server ms, id, join and log lines."""
+        return [
+            [
+                rank, f"{r.method} {r.path}", r.status, r.latency * 1000,
+                r.server_duration * 1000 if r.server_duration is not None else None,
+                r.request_id[:16], r.joined_by or "-", " | ".join(r.log_lines),
+            ]
+            for rank, r in enumerate(self.slowest(), start=1)
+        ]
+
+
+def _join_one(request: SlowRequest, follower: LogFollower, slack: float) -> None:
+    since, until = request.started - slack, request.ended + slack
+
+    if request.request_id:
+        by_id = follower.lines(since - 60, until + 60, contains=request.request_id)
+        if by_id:
+            request.joined_by = "id"
+            request.log_lines = [f"[{line.service}] {line.text}" for line in by_id[:MAX_LOG_LINES]]
+            return
+
+    # Access lines of this method and path that completed within the window
+    candidates = []
+    for line in follower.lines(since, until, service=ACCESS_LOG_SERVICE):
+        record = parse_access_line(line.text)
+        if record is not None and (record.method, record.path) == (request.method, request.path):
+            candidates.append((line, record))
+    joined = None
+    if len(candidates) == 1:
+        joined, record = candidates[0]
+        request.joined_by = "window"
+        request.server_duration = record.duration
+        request.log_lines.append(joined.text)
+    elif candidates:
+        # Concurrent requests to the same route: any pick would be a guess
+        request.joined_by = "ambiguous"
+    else:
+        evicted = follower.evicted_before(ACCESS_LOG_SERVICE)
+        if evicted is not None and evicted > since:
+            # Rotated out of the ring buffer (see BDD_LOG_BUFFER_LINES)
+            request.joined_by = "evicted"
+
+    # Errors and warnings any service logged while the request was in flight
+    for log, entry in follower.entries(since, until):
+        if len(request.log_lines) >= MAX_LOG_LINES:
+            break
+        if entry.line is not joined:
+            request.log_lines.append(f"[{log.service}] {entry.line.text}")
@@ -0,0 +1,170 @@
+"""Tarball snapshots of the compose data volumes.
+
+After the first healthy startup the harness archives every named volume of
+docker-compose.yml (postgres data, server data, uploads) into the cache
+directory. Isolation scenarios then restore that baseline in seconds instead
+of re-initializing the stack and running migrations again. Volumes are read
+and written through a throwaway container, so this works with any Docker
+storage driver and on Docker Desktop.
+
+Snapshots are keyed by a hash of the migration sources and the compose
+files; a schema or compose change invalidates them.
+"""
+
+import hashlib
+import json
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import yaml
+
+# Files whose change makes an existing snapshot stale
+SNAPSHOT_INPUTS = [
+    "docker-compose.yml",
+    "docker-compose.override.yml",
+    "packages/feedback-server/entrypoint.sh",
+    "packages/feedback-server/src/db/*.ts",
+]
+
+
+def _compose_file(repo_root: Path) -> dict:
+    compose_path = repo_root / "docker-compose.yml"
+    if not compose_path.exists():
+        return {}
+    with open(compose_path) as f:
+        return yaml.safe_load(f) or {}
+
+
+def compose_project(repo_root: Path) -> str:
+    """Compose project name: top-level ``name:`` or the directory name."""
+    return _compose_file(repo_root).get("name", repo_root.name)
+
+
+def compose_volumes(repo_root: Path) -> dict[str, str]:
+    """Map compose volume keys to Docker volume names (``name:`` or project-prefixed)."""
+    compose = _compose_file(repo_root)
+    project = compose.get("name", repo_root.name)
+    return {
+        key: (config or {}).get("name", f"{project}_{key}")
+        for key, config in (compose.get("volumes") or {}).items()
+    }
+
+
+def snapshot_key(repo_root: Path) -> str:
+    """Hash of the migrations and compose files, in a stable file order."""
+    digest = hashlib.sha256()
+    for pattern in SNAPSHOT_INPUTS:
+        for path in sorted(repo_root.glob(pattern)):
+            if path.is_file():
+                digest.update(str(path.relative_to(repo_root)).encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()[:16]
+
+
+class VolumeSnapshot:
+    """
+    Save and restore the compose data volumes as tarballs.
+
+    Usage:
+        snapshot = VolumeSnapshot(repo_root, cache_dir)
+        if not snapshot.exists():
+            snapshot.save()            # stack running and healthy
+        ...
+        snapshot.restore()             # stack down
+    """
+
+    def __init__(self, repo_root: Path, cache_dir: Path, image: str = "alpine:3"):
+        self.repo_root = repo_root
+        self.root = cache_dir / "volume-snapshots"
+        self.key = snapshot_key(repo_root)
+        self.path = self.root / self.key
+        self.image = image
+        self.volumes = compose_volumes(repo_root)
+        self.project = compose_project(repo_root)
+
+    def exists(self) -> bool:
+        return (self.path / "manifest.json").exists()
+
+    def save(self, timeout: int = 600) -> float:
+        """
+        Archive every volume while the stack is paused.
+
+        Pausing freezes the database processes, so the archive is consistent
+        at the level of a power loss, which postgres and SQLite recover from.
+
+        Returns:
+            Seconds taken
+        """
+        started = time.perf_counter()
+        staging = self.root / f".{self.key}.partial"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+
+        self._compose("pause")
+        try:
+            for name in self.volumes.values():
+                self._docker(
+                    "run", "--rm",
+                    "-v", f"{name}:/volume:ro",
+                    "-v", f"{staging.resolve()}:/snapshot",
+                    self.image, "tar", "-czf", f"/snapshot/{name}.tar.gz", "-C", "/volume", ".",
+                    timeout=timeout,
+                )
+        finally:
+            self._compose("unpause")
+
+        (staging / "manifest.json").write_text(json.dumps({
+            "key": self.key,
+            "created": time.time(),
+            "volumes": self.volumes,
+        }, indent=2))
+
+        # Only one snapshot is kept: older keys can never match again
+        for old in self.root.iterdir():
+            if old.is_dir() and old != staging:
+                shutil.rmtree(old, ignore_errors=True)
+        staging.rename(self.path)
+        return time.perf_counter() - started
+
+    def restore(self, timeout: int = 600) -> float:
+        """
+        Recreate every volume from the snapshot; the stack must be down.
+
+        Returns:
+            Seconds taken
+        """
+        started = time.perf_counter()
+        for key, name in self.volumes.items():
+            # Labelled like compose would, so compose adopts it without a warning
+            self._docker(
+                "volume", "create",
+                "--label", f"com.docker.compose.project={self.project}",
+                "--label", f"com.docker.compose.volume={key}",
+                name,
+            )
+            self._docker(
+                "run", "--rm",
+                "-v", f"{name}:/volume",
+                "-v", f"{self.path.resolve()}:/snapshot:ro",
+                self.image, "sh", "-c",
+                "find /volume -mindepth 1 -delete && "
+                f"tar -xzf /snapshot/{name}.tar.gz -C /volume",
+                timeout=timeout,
+            )
+        return time.perf_counter() - started
+
+    def _compose(self, *args: str) -> None:
+        subprocess.run(
+            ["docker", "compose", *args], cwd=self.repo_root,
+            capture_output=True, text=True, timeout=120
+        )
+
+    def _docker(self, *args: str, timeout: int = 120) -> None:
+        result = subprocess.run(
+            ["docker", *args], cwd=self.repo_root,
+            capture_output=True, text=True, timeout=timeout
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"docker {args[0]} failed: {result.stderr.strip()}")
@@ -15,9 +15,11 @@ from conftest import (
     REPO_ROOT,
     SERVICE_URLS,
     HEALTH_ENDPOINTS,
+    COMPOSE_SERVICES,
     wait_for_services,
     get_container_status,
 )
+from helpers.docker_events import all_healthy
 
 # Environment variable to control whether to fail or skip when services aren't available
 REQUIRE_SERVICES = os.environ.get("BDD_REQUIRE_SERVICES", "false").lower() == "true"
@@ -89,12 +91,20 @@ def services_were_stopped(repo_root: Path):
 # =============================================================================
 
 @then("all containers should reach running state")
-def containers_reach_running_state(repo_root: Path):
+def containers_reach_running_state(repo_root: Path, container_watcher):
     """Verify all containers are running."""
-    # Wait for services
-    success = wait_for_services(timeout=120)
+    if container_watcher is not None:
+        # Resolves as soon as the daemon reports the last healthcheck passing
+        success = container_watcher.wait_for(
+            all_healthy(COMPOSE_SERVICES), timeout=120
+        )
+    else:
+        success = wait_for_services(timeout=120)
     if not success:
-        status = get_container_status(repo_root)
+        if container_watcher is not None:
+            status = container_watcher.snapshot()
+        else:
+            status = get_container_status(repo_root)
         if REQUIRE_SERVICES:
             pytest.fail(f"Not all containers reached running state: {status}")
         else:
@@ -0,0 +1,107 @@
+"""Step definitions for Attachment Ingestion feature."""
+
+import pytest
+import requests
+from pytest_bdd import scenarios, when, then, parsers
+
+from conftest import SERVICE_URLS, ATTACHMENT_SIZES, ATTACHMENT_REPEAT
+from helpers.attachments import AttachmentSweep, IngestResult, limits
+from helpers.container_stats import ContainerStats
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/14_attachment_ingestion.feature")
+
+SCENARIO = "Feedback with growing {attachment} attachments is ingested"
+
+
+def _size_label(attachment: str, size: int) -> str:
+    if attachment == "console-log":
+        return f"{size} entries"
+    return f"{size / 1024 / 1024:g} MB" if size >= 1024 * 1024 else f"{size / 1024:g} KB"
+
+
+def _mb(size: float | None) -> float | None:
+    return size / 1024 / 1024 if size is not None else None
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when(parsers.parse("I submit feedback with {attachment} attachments of increasing size"))
+def sweep_attachments(
+    attachment: str,
+    context: dict,
+    perf_report: PerformanceReport,
+    server_stats: ContainerStats | None
+):
+    """Submit each size a few times, stopping after the first size that always fails."""
+    sweep = AttachmentSweep(SERVICE_URLS["feedback-server"], stats=server_stats, repeat=ATTACHMENT_REPEAT)
+    results = sweep.run(attachment, ATTACHMENT_SIZES[attachment])
+    context["ingest_results"] = results
+
+    perf_report.add_table(
+        f"Attachment ingestion: {attachment} ({ATTACHMENT_REPEAT} requests per size)",
+        ["size", "request (MB)", "p50 (ms)", "max (ms)", "ingest (MB/s)",
+         "memory spike (MB)", "disk writes (MB/s)", "responses"],
+        [
+            [
+                _size_label(attachment, r.size), _mb(r.request_bytes),
+                r.latency["p50"], r.latency["max"], _mb(r.ingest_throughput),
+                _mb(r.memory_spike), _mb(r.write_throughput),
+                ", ".join(f"{status} x{n}" for status, n in sorted(r.statuses.items())) or "skipped",
+            ]
+            for r in results
+        ],
+        scenario=SCENARIO.format(attachment=attachment),
+    )
+    for r in results:
+        if r.ok:
+            size = _size_label(attachment, r.size)
+            perf_report.add_value(SCENARIO.format(attachment=attachment), f"{size} p50", r.latency["p50"], "ms")
+            perf_report.add_value(
+                SCENARIO.format(attachment=attachment), f"{size} ingest",
+                _mb(r.ingest_throughput), "MB/s", higher_is_better=True,
+            )
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then(parsers.parse("the smallest {attachment} submission is accepted"))
+def smallest_accepted(attachment: str, context: dict):
+    """Verify the sweep starts from a size the server handles."""
+    first: IngestResult = context["ingest_results"][0]
+    assert first.ok, \
+        f"{_size_label(attachment, first.size)} {attachment} submission failed: {dict(first.statuses)}"
+
+
+@then("the feedback-server stays healthy after the sweep")
+def healthy_after_sweep(http_client: requests.Session):
+    """Verify an oversized submission did not take the server down."""
+    try:
+        response = http_client.get(f"{SERVICE_URLS['feedback-server']}/api/v1/health", timeout=10)
+    except requests.exceptions.RequestException as e:
+        pytest.fail(f"feedback-server unreachable after the sweep: {e}")
+    assert response.status_code == 200, \
+        f"feedback-server unhealthy after the sweep: {response.status_code}"
+
+
+@then(parsers.parse("the report shows the largest {attachment} size the server accepts"))
+def report_size_limit(attachment: str, context: dict, perf_report: PerformanceReport):
+    """Add the accepted/failing boundary as the evidence for a client-side cap."""
+    largest, first_failure = limits(context["ingest_results"])
+    perf_report.add_table(
+        f"Attachment size limit: {attachment}",
+        ["largest accepted", "p50 at largest (ms)", "first failing", "failing responses"],
+        [[
+            _size_label(attachment, largest.size) if largest else "-",
+            largest.latency["p50"] if largest else None,
+            _size_label(attachment, first_failure.size) if first_failure else "none in sweep",
+            ", ".join(f"{status} x{n}" for status, n in sorted(first_failure.statuses.items()))
+            if first_failure else "-",
+        ]],
+        scenario=SCENARIO.format(attachment=attachment),
+    )
@@ -0,0 +1,95 @@
+"""Step definitions for Image Build Performance feature."""
+
+from pathlib import Path
+
+import pytest
+from pytest_bdd import scenarios, when, then, parsers
+
+from helpers.build_bench import benchmark_service, compose_build_config
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/07_build_performance.feature")
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when("I benchmark cold and warm builds for each service")
+def benchmark_builds(repo_root: Path, context: dict):
+    """Run a cold and a warm build for every service that has a build section."""
+    services = compose_build_config(repo_root)
+    if not services:
+        pytest.fail("No buildable services found in docker compose config")
+
+    context["build_benchmarks"] = {
+        name: benchmark_service(repo_root, name, config)
+        for name, config in services.items()
+    }
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("every cold and warm build completes successfully")
+def all_builds_succeed(context: dict):
+    """Verify no build in the benchmark failed."""
+    for service, bench in context["build_benchmarks"].items():
+        for mode in ("cold", "warm"):
+            result = bench[mode]
+            assert result.returncode == 0, \
+                f"{mode} build of {service} failed:\n{result.output[-2000:]}"
+
+
+@then("a build report is produced for every service")
+def build_report_produced(context: dict, perf_report: PerformanceReport):
+    """Add build time, cache hit ratio and image size per service to the report."""
+    rows = []
+    for service, bench in context["build_benchmarks"].items():
+        cold, warm = bench["cold"], bench["warm"]
+        size = bench["image_size"]
+        rows.append([
+            service,
+            cold.elapsed,
+            warm.elapsed,
+            f"{warm.cache_hit_ratio:.0%}",
+            f"{size / 1024 / 1024:.1f}" if size else None,
+        ])
+
+    assert rows, "No build results to report"
+    perf_report.add_table(
+        "Image builds",
+        ["service", "cold (s)", "warm (s)", "warm cache hits", "image (MiB)"],
+        rows,
+        scenario="Cold and warm builds are benchmarked per service",
+    )
+    scenario = "Cold and warm builds are benchmarked per service"
+    for service, bench in context["build_benchmarks"].items():
+        perf_report.add_value(scenario, f"{service} cold build", bench["cold"].elapsed, "s")
+        perf_report.add_value(scenario, f"{service} warm build", bench["warm"].elapsed, "s")
+        if bench["image_size"]:
+            perf_report.add_value(scenario, f"{service} image", bench["image_size"] / 1024 / 1024, "MiB")
+
+
+@then("warm builds reuse the dependency-install layer")
+def dependency_layer_cached(context: dict):
+    """Verify a source edit does not bust the dependency-install layer."""
+    regressions = {}
+    for service, bench in context["build_benchmarks"].items():
+        busted = bench["warm"].busted_dependency_steps
+        if busted:
+            regressions[service] = [f"[{s.stage}] {s.command}" for s in busted]
+
+    assert not regressions, \
+        f"Dependency-install layer rebuilt after a source-only change: {regressions}"
+
+
+@then(parsers.parse("the warm build layer cache hit ratio is at least {percent:d} percent"))
+def warm_cache_hit_ratio(percent: int, context: dict):
+    """Verify warm builds hit the layer cache for most steps."""
+    for service, bench in context["build_benchmarks"].items():
+        ratio = bench["warm"].cache_hit_ratio
+        assert ratio * 100 >= percent, \
+            f"Warm build of {service} hit the cache for only {ratio:.0%} of layers"
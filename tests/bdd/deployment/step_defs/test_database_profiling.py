@@ -0,0 +1,161 @@
+"""Step definitions for Database Query Profiling feature."""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest_bdd import scenarios, given, when, then
+
+from conftest import REPORT_DIR, PG_PROFILE_ROWS, PG_PROFILE_ITERATIONS, PG_EXPLAIN_TOP
+from helpers.pg_profile import PostgresProfiler, feedback_workload
+from helpers.postgres import COMPOSE_OVERRIDE_DIR, Psql, PsqlError, compose_file_args
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/09_database_profiling.feature")
+
+# Compose override loading pg_stat_statements
+PROFILING_OVERRIDE = COMPOSE_OVERRIDE_DIR / "postgres-profiling.yml"
+
+# Scratch database; the application database is never touched
+PROFILE_DATABASE = "bdd_profile"
+
+SCENARIO = "List, search and stats queries are profiled on PostgreSQL"
+
+
+# =============================================================================
+# GIVEN STEPS
+# =============================================================================
+
+@given("the postgres service is running with statement statistics enabled")
+def postgres_with_statement_statistics(
+    repo_root: Path,
+    run_docker_compose: Callable,
+    context: dict,
+    request: pytest.FixtureRequest
+):
+    """Recreate postgres with pg_stat_statements preloaded; restored afterwards."""
+    plain_args = compose_file_args(repo_root)
+    profiling_args = compose_file_args(repo_root, PROFILING_OVERRIDE)
+
+    was_running = bool(run_docker_compose(
+        *plain_args, "ps", "-q", "--status", "running", "postgres"
+    ).stdout.strip())
+
+    result = run_docker_compose(*profiling_args, "up", "-d", "--wait", "postgres", timeout=300)
+
+    def restore():
+        if was_running:
+            run_docker_compose(*plain_args, "up", "-d", "--wait", "postgres", timeout=300)
+        else:
+            run_docker_compose(*plain_args, "stop", "postgres", timeout=120)
+    request.addfinalizer(restore)
+
+    if result.returncode != 0:
+        pytest.fail(f"Could not start postgres with statement statistics:\n{result.stderr}")
+
+    context["psql"] = Psql(repo_root, profiling_args)
+
+
+@given("a scratch database is migrated and seeded with feedback")
+def scratch_database_seeded(context: dict, request: pytest.FixtureRequest):
+    """Create the scratch database from the server's PostgreSQL migration and seed it."""
+    profiler = PostgresProfiler(context["psql"], PROFILE_DATABASE)
+    try:
+        profiler.create(PG_PROFILE_ROWS)
+    except PsqlError as e:
+        pytest.fail(f"Could not create the profiling database: {e}")
+    request.addfinalizer(profiler.drop)
+    context["profiler"] = profiler
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when("I run the list, search and stats query workload")
+def run_query_workload(context: dict, perf_report: PerformanceReport):
+    """Replay the route SQL, rank it and explain the top offenders."""
+    profiler: PostgresProfiler = context["profiler"]
+    workload = {query.name: query for query in feedback_workload()}
+
+    try:
+        profiler.run(list(workload.values()), PG_PROFILE_ITERATIONS)
+        stats = profiler.statement_stats()
+        tables = profiler.table_stats()
+        plans = [profiler.explain(workload[s.name]) for s in stats[:PG_EXPLAIN_TOP]]
+    except PsqlError as e:
+        pytest.fail(f"Query workload failed: {e}")
+
+    context["workload"] = workload
+    context["statement_stats"] = stats
+    context["plans"] = plans
+
+    # Full plans for offline reading (e.g. explain.dalibo.com)
+    plan_dir = REPORT_DIR / "pg-plans"
+    plan_dir.mkdir(parents=True, exist_ok=True)
+    for plan in plans:
+        (plan_dir / f"{plan.name}.json").write_text(json.dumps([plan.plan], indent=2))
+
+    table_rows = {name: table["n_live_tup"] for name, table in tables.items()}
+    perf_report.add_table(
+        f"PostgreSQL statements ({PG_PROFILE_ROWS} feedback rows, {PG_PROFILE_ITERATIONS} passes)",
+        ["#", "query", "route", "calls", "total (ms)", "mean (ms)", "rows/call", "cache hit"],
+        [
+            [
+                rank, s.name, workload[s.name].route, s.calls, s.total_ms, s.mean_ms,
+                s.rows / s.calls if s.calls else 0,
+                f"{s.shared_hit / (s.shared_hit + s.shared_read):.0%}"
+                if s.shared_hit + s.shared_read else None,
+            ]
+            for rank, s in enumerate(stats, start=1)
+        ],
+        scenario=SCENARIO,
+    )
+    for s in stats:
+        perf_report.add_value(SCENARIO, f"{s.name} mean", s.mean_ms, "ms")
+    perf_report.add_table(
+        f"Top {len(plans)} queries explained (ANALYZE, BUFFERS)",
+        ["query", "execution (ms)", "shared hit", "shared read", "seq scans", "seq scan on large table"],
+        [
+            [
+                plan.name, plan.execution_ms, plan.shared_hit, plan.shared_read,
+                ", ".join(f"{relation} ({rows} rows)" for relation, rows in plan.seq_scans) or "-",
+                ", ".join(plan.large_seq_scans(table_rows)) or "-",
+            ]
+            for plan in plans
+        ],
+        scenario=SCENARIO,
+    )
+    perf_report.add_table(
+        "Table scans during the workload",
+        ["table", "live rows", "seq scans", "seq tuples read", "index scans"],
+        [
+            [name, t["n_live_tup"], t["seq_scan"], t["seq_tup_read"], t["idx_scan"]]
+            for name, t in sorted(tables.items(), key=lambda item: -item[1]["seq_tup_read"])
+        ],
+        scenario=SCENARIO,
+    )
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("every workload query appears in the statement statistics")
+def every_query_tracked(context: dict):
+    """Verify pg_stat_statements recorded each workload query."""
+    tracked = {s.name for s in context["statement_stats"]}
+    missing = set(context["workload"]) - tracked
+    assert not missing, f"Workload queries missing from pg_stat_statements: {sorted(missing)}"
+
+
+@then("the slowest queries are explained with buffer usage")
+def slowest_queries_explained(context: dict):
+    """Verify each top offender has an analyzed plan with buffer counters."""
+    plans = context["plans"]
+    assert plans, "No query plans were captured"
+    for plan in plans:
+        assert "Shared Hit Blocks" in plan.plan["Plan"], \
+            f"Plan of {plan.name} has no buffer counters (EXPLAIN without BUFFERS?)"
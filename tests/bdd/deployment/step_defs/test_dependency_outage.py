@@ -0,0 +1,220 @@
+"""Step definitions for Dependency Outage Recovery feature."""
+
+import time
+from typing import Callable
+
+import pytest
+from pytest_bdd import scenarios, given, when, then, parsers
+
+from conftest import (
+    SERVICE_URLS,
+    HTTP_TIMEOUT,
+    PROBE_TIMEOUT,
+    OUTAGE_CONCURRENCY,
+    OUTAGE_BASELINE,
+    OUTAGE_DURATION,
+    OUTAGE_RECOVERY_WINDOW,
+    RECOVERY_SLO,
+)
+from helpers.container_stats import ContainerStats
+from helpers.dashboard import Dashboard
+from helpers.load import LoadGenerator, mixed_workload
+from helpers.outage import ReadinessWatcher, Timeline
+from helpers.postgres import SERVER_POSTGRES_UNWIRED
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/11_dependency_outage.feature")
+
+READY_URL = f"{SERVICE_URLS['feedback-server']}/api/v1/health/ready"
+
+# Compose commands that inject and clear each fault
+FAULTS = {
+    "paused": (["pause", "postgres"], ["unpause", "postgres"]),
+    "killed": (["kill", "postgres"], ["up", "-d", "--wait", "postgres"]),
+}
+
+# Time a request may take beyond the client timeout before it counts as hung
+HANG_SLACK = 1.0
+
+SCENARIO = "The feedback-server recovers after postgres is {fault}"
+
+
+def _ms_after(moment: float | None, reference: float) -> float | None:
+    return (moment - reference) * 1000 if moment is not None else None
+
+
+# =============================================================================
+# GIVEN STEPS
+# =============================================================================
+
+@given("a steady workload is running against the feedback-server")
+def steady_workload(
+    context: dict,
+    request: pytest.FixtureRequest,
+    run_docker_compose: Callable,
+    dashboard: Dashboard,
+    server_stats: ContainerStats | None
+):
+    """Start load and readiness polling, and measure the baseline throughput."""
+    # A postgres outage only measures something if the server uses postgres;
+    # check before spending a minute of load on it
+    if SERVER_POSTGRES_UNWIRED:
+        pytest.skip(f"The feedback-server never talks to postgres: {SERVER_POSTGRES_UNWIRED}")
+    result = run_docker_compose("exec", "-T", "feedback-server", "printenv", "DATABASE_URL", timeout=30)
+    database_url = result.stdout.strip()
+    if not database_url.startswith(("postgres://", "postgresql://")):
+        pytest.skip(f"The feedback-server is not on postgres (DATABASE_URL={database_url or 'unset'})")
+
+    timeline = Timeline()
+    generator = LoadGenerator(
+        SERVICE_URLS["feedback-server"],
+        mixed_workload(),
+        concurrency=OUTAGE_CONCURRENCY,
+        timeout=HTTP_TIMEOUT,
+        on_response=timeline,
+        on_error=timeline.on_error,
+    )
+    watcher = ReadinessWatcher(READY_URL, timeout=PROBE_TIMEOUT)
+
+    view = dashboard.load("Workload through the postgres outage", generator, server_stats)
+
+    started = time.time()
+    generator.start()
+    watcher.start()
+    view.start()
+    request.addfinalizer(generator.stop)
+    request.addfinalizer(watcher.stop)
+    request.addfinalizer(view.stop)
+    time.sleep(OUTAGE_BASELINE)
+
+    baseline = timeline.rate(started, time.time())
+    if baseline == 0:
+        pytest.fail("The workload did not complete a request before the outage")
+
+    context["timeline"] = timeline
+    context["load_generator"] = generator
+    context["load_view"] = view
+    context["readiness"] = watcher
+    context["baseline"] = (started, baseline)
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when(parsers.parse("postgres is {fault} for the outage duration"))
+def postgres_outage(
+    fault: str,
+    run_docker_compose: Callable,
+    context: dict,
+    request: pytest.FixtureRequest
+):
+    """Inject the fault, hold it, then clear it; postgres is restored on failure too."""
+    inject, clear = FAULTS[fault]
+
+    result = run_docker_compose(*inject, timeout=60)
+    fault_at = time.time()
+    if result.returncode != 0:
+        pytest.fail(f"Could not {inject[0]} postgres: {result.stderr}")
+    # Put postgres back even if a later step fails
+    request.addfinalizer(lambda: run_docker_compose(*clear, timeout=300))
+
+    time.sleep(OUTAGE_DURATION)
+
+    restored_at = time.time()
+    result = run_docker_compose(*clear, timeout=300)
+    if result.returncode != 0:
+        pytest.fail(f"Could not restore postgres: {result.stderr}")
+
+    context["fault"] = fault
+    context["outage"] = (fault_at, restored_at)
+
+
+@when("the workload runs through the recovery window")
+def recovery_window(context: dict, perf_report: PerformanceReport):
+    """Keep the load on, then derive the outage and recovery figures."""
+    fault_at, restored_at = context["outage"]
+    time.sleep(max(0.0, restored_at + OUTAGE_RECOVERY_WINDOW - time.time()))
+    ended = time.time()
+    context["readiness"].stop()
+    context["load_generator"].stop()
+    context["load_view"].stop()
+
+    timeline: Timeline = context["timeline"]
+    watcher: ReadinessWatcher = context["readiness"]
+    started, baseline = context["baseline"]
+
+    unready = watcher.first(False, since=fault_at)
+    ready = watcher.first(True, since=unready.at) if unready else None
+    recovered_at = timeline.recovered_at(restored_at, ended, baseline)
+    context["recovered_at"] = recovered_at
+    context["ended"] = ended
+
+    perf_report.add_table(
+        f"Postgres {context['fault']} for {OUTAGE_DURATION:.0f}s "
+        f"({OUTAGE_CONCURRENCY} workers, {HTTP_TIMEOUT:.0f}s client timeout)",
+        ["phase", "seconds", "req/s", "errors"],
+        [
+            ["baseline", fault_at - started, baseline, f"{timeline.error_rate(started, fault_at):.1%}"],
+            ["outage", restored_at - fault_at, timeline.rate(fault_at, restored_at),
+             f"{timeline.error_rate(fault_at, restored_at):.1%}"],
+            ["recovery", ended - restored_at, timeline.rate(restored_at, ended),
+             f"{timeline.error_rate(restored_at, ended):.1%}"],
+        ],
+        scenario=SCENARIO.format(fault=context["fault"]),
+    )
+    perf_report.add_table(
+        "Readiness and recovery (ms after the fault / after restore)",
+        ["event", "ms", "detail"],
+        [
+            ["ready -> unready", _ms_after(unready.at if unready else None, fault_at),
+             unready.detail if unready else "stayed ready"],
+            ["unready -> ready", _ms_after(ready.at if ready else None, restored_at),
+             ready.detail if ready else "-"],
+            ["throughput at baseline", _ms_after(recovered_at, restored_at),
+             f"{baseline:.0f} req/s baseline"],
+            ["longest request", timeline.longest * 1000, timeline.longest_op],
+        ],
+        scenario=SCENARIO.format(fault=context["fault"]),
+    )
+    # An outage the server never noticed measured nothing: do not pass the SLO on it
+    if unready is None and timeline.error_rate(fault_at, restored_at) == 0:
+        pytest.fail("The feedback-server did not notice the postgres outage (stayed ready, no errors)")
+
+    scenario = SCENARIO.format(fault=context["fault"])
+    perf_report.add_value(scenario, "unready -> ready", _ms_after(ready.at if ready else None, restored_at), "ms")
+    perf_report.add_value(scenario, "throughput at baseline", _ms_after(recovered_at, restored_at), "ms")
+    perf_report.add_value(scenario, "longest request", timeline.longest * 1000, "ms")
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("no request outlived the client timeout")
+def no_hung_requests(context: dict):
+    """Verify every request returned or failed within the client timeout."""
+    timeline: Timeline = context["timeline"]
+    assert timeline.longest <= HTTP_TIMEOUT + HANG_SLACK, \
+        f"A {timeline.longest_op} request took {timeline.longest:.1f}s " \
+        f"with a {HTTP_TIMEOUT:.0f}s client timeout"
+
+
+@then("the feedback-server reports ready again")
+def ready_again(context: dict):
+    """Verify readiness ended in the ready state."""
+    assert context["readiness"].ready, \
+        f"/api/v1/health/ready still unready {OUTAGE_RECOVERY_WINDOW:.0f}s after postgres was restored"
+
+
+@then("throughput returns to baseline within the recovery SLO")
+def throughput_recovered(context: dict):
+    """Verify throughput was back at baseline within BDD_RECOVERY_SLO seconds."""
+    recovered_at = context["recovered_at"]
+    _, restored_at = context["outage"]
+    assert recovered_at is not None, \
+        f"Throughput did not return to baseline within {OUTAGE_RECOVERY_WINDOW:.0f}s"
+    recovery = recovered_at - restored_at
+    assert recovery <= RECOVERY_SLO, \
+        f"Throughput took {recovery:.1f}s to recover (SLO {RECOVERY_SLO:.0f}s)"
@@ -12,9 +12,15 @@ from pytest_bdd import scenarios, given, when, then, parsers
 from conftest import (
     REPO_ROOT,
     SERVICE_URLS,
+    COMPOSE_SERVICES,
+    CACHE_DIR,
+    REPORT_DIR,
+    BUILD_PARALLELISM,
     wait_for_services,
     get_container_status,
 )
+from helpers.build_orchestrator import BuildOrchestrator
+from helpers.docker_events import all_healthy, all_running, all_stopped
 
 # Environment variable to control whether to skip service-dependent tests
 REQUIRE_SERVICES = os.environ.get("BDD_REQUIRE_SERVICES", "false").lower() == "true"
@@ -103,16 +109,21 @@ def run_task_down(repo_root: Path, context: dict):
 
 
 @when("I run docker compose build")
-def run_docker_compose_build(repo_root: Path, context: dict):
-    """Execute docker compose build."""
-    result = subprocess.run(
-        ["docker", "compose", "build"],
-        cwd=repo_root,
-        capture_output=True,
-        text=True,
-        timeout=900  # 15 minutes for build
+def run_docker_compose_build(repo_root: Path, context: dict, perf_report):
+    """Build all service images concurrently, skipping unchanged build contexts."""
+    orchestrator = BuildOrchestrator(
+        repo_root,
+        cache_dir=CACHE_DIR,
+        log_dir=REPORT_DIR / "build-logs",
+        max_parallel=BUILD_PARALLELISM,
+        timeout=900  # 15 minutes per service build
     )
-    context["build_result"] = result
+    run = orchestrator.build()
+    context["build_result"] = run
+
+    rows = [[b.service, b.status, b.elapsed] for b in run.builds.values()]
+    rows.append(["(wall time)", "", run.elapsed])
+    perf_report.add_table("Image build orchestration", ["service", "status", "seconds"], rows)
 
 
 # =============================================================================
@@ -120,13 +131,18 @@ def run_docker_compose_build(repo_root: Path, context: dict):
 # =============================================================================
 
 @then("all development containers start")
-def all_dev_containers_start(repo_root: Path, context: dict):
+def all_dev_containers_start(repo_root: Path, context: dict, container_watcher):
     """Verify development containers are running."""
     # Check if task up succeeded
     result = context.get("task_up_result")
     if result and result.returncode != 0:
         pytest.fail(f"task up failed: {result.stderr}")
 
+    if container_watcher is not None:
+        if not container_watcher.wait_for(all_healthy(COMPOSE_SERVICES), timeout=120):
+            pytest.fail(f"Containers did not start properly: {container_watcher.snapshot()}")
+        return
+
     # Wait for services
     success = wait_for_services(timeout=120)
     if not success:
@@ -172,13 +188,18 @@ def logs_include_content(context: dict):
 
 
 @then("all containers stop")
-def all_containers_stop(repo_root: Path, context: dict):
+def all_containers_stop(repo_root: Path, context: dict, container_watcher):
     """Verify all containers are stopped."""
     result = context.get("down_result")
     if result and result.returncode != 0:
         # Some warnings are OK during shutdown
         pass
 
+    if container_watcher is not None:
+        assert container_watcher.wait_for(all_stopped(), timeout=30), \
+            f"Containers still running: {container_watcher.snapshot()}"
+        return
+
     # Check no containers are running
     ps_result = subprocess.run(
         ["docker", "compose", "ps", "-q"],
@@ -211,11 +232,15 @@ def volumes_are_preserved(context: dict):
 
 @then("the build completes successfully")
 def build_completes_successfully(context: dict):
-    """Verify docker compose build succeeded."""
+    """Verify every service image was built (or was already up to date)."""
     result = context.get("build_result")
     assert result is not None, "docker compose build was not run"
-    assert result.returncode == 0, \
-        f"Build failed with code {result.returncode}: {result.stderr}"
+    assert result.builds, "No buildable services found in docker compose config"
+    failures = "\n\n".join(
+        f"{b.service} (exit {b.returncode}, log {b.log_path}):\n{b.log_tail()}"
+        for b in result.failures
+    )
+    assert result.returncode == 0, f"Build failed:\n{failures}"
 
 
 @then("images are created for services")
@@ -263,9 +288,13 @@ def images_are_created(repo_root: Path, context: dict):
 
 
 @then("all containers should reach running state")
-def all_containers_running_state(repo_root: Path, context: dict):
+def all_containers_running_state(repo_root: Path, context: dict, container_watcher):
     """Verify all containers are in running state after restart."""
-    status = get_container_status(repo_root)
+    if container_watcher is not None:
+        container_watcher.wait_for(all_running(COMPOSE_SERVICES), timeout=120)
+        status = container_watcher.snapshot()
+    else:
+        status = get_container_status(repo_root)
 
     # Check that we have some containers
     if not status:
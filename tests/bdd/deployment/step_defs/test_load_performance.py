@@ -0,0 +1,275 @@
+"""Step definitions for Service Performance Under Load feature."""
+
+import time
+
+import pytest
+import requests
+from pytest_bdd import scenarios, given, when, then
+
+from conftest import (
+    SERVICE_URLS,
+    LOAD_CONCURRENCY,
+    LOAD_DURATION,
+    LOAD_PROCESSES,
+    PROBE_TIMEOUT,
+    OPENAPI_CONCURRENCY,
+    OPENAPI_DURATION,
+)
+from helpers.access_log import LatencyComparison
+from helpers.container_stats import ContainerStats
+from helpers.contract import ContractSampler
+from helpers.dashboard import Dashboard
+from helpers.load import LoadGenerator, combine_hooks, mixed_workload
+from helpers.load_pool import LoadPool
+from helpers.openapi import benchmark_operations, seed_path_values, synthesize_operations
+from helpers.probe import Prober
+from helpers.report import PerformanceReport
+from helpers.stats import summarize
+from helpers.tracing import SlowestRequests
+
+# Load scenarios from feature file
+scenarios("../features/08_load_performance.feature")
+
+# Probe endpoints used by the orchestrator
+PROBE_ENDPOINTS = {
+    "ready": f"{SERVICE_URLS['feedback-server']}/api/v1/health/ready",
+    "live": f"{SERVICE_URLS['feedback-server']}/api/v1/health/live",
+    "detailed": f"{SERVICE_URLS['feedback-server']}/api/v1/health/detailed",
+}
+
+# Probes per second per endpoint
+PROBE_INTERVAL = 0.1
+
+
+# =============================================================================
+# GIVEN STEPS
+# =============================================================================
+
+@given("a saturating mixed workload is running against the feedback-server")
+def saturating_workload(
+    context: dict,
+    request: pytest.FixtureRequest,
+    contract_sampler: ContractSampler | None,
+    server_latency: LatencyComparison | None,
+    slowest_requests: SlowestRequests | None,
+    dashboard: Dashboard,
+    server_stats: ContainerStats | None
+):
+    """Start the mixed workload in the background; stopped by the When step."""
+    generator = LoadGenerator(
+        SERVICE_URLS["feedback-server"],
+        mixed_workload(),
+        concurrency=LOAD_CONCURRENCY,
+        on_response=combine_hooks(contract_sampler, server_latency, slowest_requests),
+    )
+    context["load_generator"] = generator.start()
+    context["load_view"] = dashboard.load("Mixed workload", generator, server_stats).start()
+    # Make sure workers never outlive the scenario
+    request.addfinalizer(generator.stop)
+    request.addfinalizer(context["load_view"].stop)
+
+
+@given("the OpenAPI specification is loaded from the feedback-server")
+def openapi_spec_loaded(http_client: requests.Session, context: dict):
+    """Fetch and parse the live OpenAPI document."""
+    url = f"{SERVICE_URLS['feedback-server']}/api/docs/openapi.json"
+    try:
+        response = http_client.get(url, timeout=15)
+    except requests.exceptions.RequestException as e:
+        pytest.fail(f"Failed to request OpenAPI spec: {e}")
+
+    assert response.status_code == 200, f"OpenAPI spec returned {response.status_code}"
+    spec = response.json()
+    assert spec.get("paths"), "OpenAPI spec documents no paths"
+    context["openapi_spec"] = spec
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when("I probe the ready, live and detailed health endpoints during the load")
+def probe_during_load(context: dict, perf_report: PerformanceReport):
+    """Probe the health endpoints for the load duration, then stop the load."""
+    prober = Prober(PROBE_ENDPOINTS, interval=PROBE_INTERVAL, timeout=PROBE_TIMEOUT)
+    probes = prober.run(LOAD_DURATION)
+    load = context["load_generator"].stop()
+    context["load_view"].stop()
+
+    context["probe_result"] = probes
+    context["load_result"] = load
+
+    if load.total_requests == 0:
+        pytest.fail("The workload did not complete a single request")
+
+    scenario = "Health probes stay fast while the server is under load"
+    rows = []
+    for name in PROBE_ENDPOINTS:
+        summary = probes.summary(name)
+        rows.append([
+            name, summary["count"], summary["p50"], summary["p90"], summary["p99"],
+            summary["max"], probes.timeouts[name], probes.failures[name],
+        ])
+    perf_report.add_table(
+        f"Probe latency under load ({load.throughput:.0f} req/s, "
+        f"{load.error_rate:.1%} workload errors)",
+        ["probe", "count", "p50 (ms)", "p90 (ms)", "p99 (ms)", "max (ms)", "timeouts", "failures"],
+        rows,
+        scenario=scenario,
+    )
+    for name in PROBE_ENDPOINTS:
+        perf_report.add_latency(scenario, f"{name} probe", probes.samples[name])
+    perf_report.add_latency(scenario, "workload", load.all_samples())
+    perf_report.add_value(scenario, "workload throughput", load.throughput, "req/s", higher_is_better=True)
+
+
+@when("I benchmark every documented operation at a fixed concurrency")
+def benchmark_documented_operations(
+    context: dict,
+    perf_report: PerformanceReport,
+    contract_sampler: ContractSampler | None,
+    server_latency: LatencyComparison | None,
+    slowest_requests: SlowestRequests | None
+):
+    """Synthesize a request per operation and benchmark each one on its own."""
+    base_url = SERVICE_URLS["feedback-server"]
+    operations = synthesize_operations(
+        context["openapi_spec"], path_values=seed_path_values(base_url)
+    )
+    rows = benchmark_operations(
+        base_url, operations, concurrency=OPENAPI_CONCURRENCY, duration=OPENAPI_DURATION,
+        on_response=combine_hooks(contract_sampler, server_latency, slowest_requests),
+    )
+    context["openapi_operations"] = operations
+    context["latency_matrix"] = rows
+
+    perf_report.add_table(
+        f"Endpoint latency matrix ({OPENAPI_CONCURRENCY} concurrent, {OPENAPI_DURATION:.0f}s each)",
+        ["operation", "request", "count", "p50 (ms)", "p90 (ms)", "p99 (ms)",
+         "max (ms)", "unexpected", "5xx"],
+        rows,
+        scenario="Every documented endpoint has a latency profile",
+    )
+    for operation, _, count, p50, *_ in rows:
+        if count:
+            perf_report.add_value(
+                "Every documented endpoint has a latency profile", f"{operation} p50", p50, "ms"
+            )
+
+
+@when("I run the mixed workload from one process and from a process pool")
+def compare_load_engines(
+    context: dict,
+    perf_report: PerformanceReport,
+    dashboard: Dashboard,
+    server_stats: ContainerStats | None
+):
+    """Run the same mix and concurrency from the test process, then from the pool."""
+    base_url = SERVICE_URLS["feedback-server"]
+    generator = LoadGenerator(base_url, mixed_workload(), concurrency=LOAD_CONCURRENCY)
+    cpu_before = time.process_time()
+    with dashboard.load("Single-process load engine", generator, server_stats):
+        single = generator.run(LOAD_DURATION)
+    # Includes the rest of the test process (and the stand-in, when used)
+    single_cpu = time.process_time() - cpu_before
+
+    pool = LoadPool(base_url, mixed_workload(), processes=LOAD_PROCESSES, concurrency=LOAD_CONCURRENCY)
+    with dashboard.load(f"Process pool load engine ({pool.processes} processes)", stats=server_stats) as view:
+        pooled = pool.run(LOAD_DURATION, on_tick=view.tick)
+    context["pool_result"] = pooled
+
+    if single.total_requests == 0 or pooled.total_requests == 0:
+        pytest.fail("A load engine did not complete a single request")
+
+    single_latency = summarize(single.all_samples())
+    pooled_latency = pooled.overall().summary()
+    rows = [
+        [
+            "single process", 1, single.throughput, single_latency["p50"], single_latency["p90"],
+            single_latency["p99"], f"{single.error_rate:.1%}", single_cpu / single.elapsed,
+        ],
+        [
+            "process pool", pool.processes, pooled.throughput, pooled_latency["p50"],
+            pooled_latency["p90"], pooled_latency["p99"], f"{pooled.error_rate:.1%}",
+            pooled.cpu_seconds / pooled.elapsed,
+        ],
+    ]
+    scenario = "Server capacity is measured without a client-side bottleneck"
+    perf_report.add_table(
+        f"Load engines ({LOAD_CONCURRENCY} concurrent, {LOAD_DURATION:.0f}s each)",
+        ["engine", "processes", "req/s", "p50 (ms)", "p90 (ms)", "p99 (ms)",
+         "errors", "client CPU (cores)"],
+        rows,
+        scenario=scenario,
+    )
+    perf_report.add_latency(scenario, "single process", single.all_samples())
+    perf_report.add_value(scenario, "single process throughput", single.throughput, "req/s", higher_is_better=True)
+    perf_report.add_latency(scenario, "process pool", pooled.overall())
+    perf_report.add_value(scenario, "process pool throughput", pooled.throughput, "req/s", higher_is_better=True)
+    perf_report.add_table(
+        "Process pool timeline (merged every second)",
+        ["t (s)", "requests", "errors", "req/s", "p50 (ms)", "p99 (ms)"],
+        [
+            [tick.elapsed, tick.requests, tick.errors, tick.throughput,
+             tick.latency["p50"], tick.latency["p99"]]
+            for tick in pooled.timeline
+        ],
+        scenario=scenario,
+    )
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("no health probe timed out")
+def no_probe_timeouts(context: dict):
+    """Verify every probe answered within the orchestrator timeout."""
+    timeouts = context["probe_result"].timeouts
+    assert not any(timeouts.values()), \
+        f"Probes timed out after {PROBE_TIMEOUT}s: {dict(timeouts)}"
+
+
+@then("the probe p99 latency stays under the orchestrator probe timeout")
+def probe_p99_under_timeout(context: dict):
+    """Verify probe tail latency leaves headroom below the orchestrator timeout."""
+    probes = context["probe_result"]
+    for name in PROBE_ENDPOINTS:
+        p99 = probes.summary(name)["p99"]
+        assert p99 < PROBE_TIMEOUT * 1000, \
+            f"{name} probe p99 {p99:.0f}ms exceeds the {PROBE_TIMEOUT}s probe timeout"
+
+
+@then("the latency matrix covers every documented operation")
+def matrix_covers_operations(context: dict):
+    """Verify every operation was either benchmarked or skipped with a reason."""
+    operations = context["openapi_operations"]
+    rows = context["latency_matrix"]
+    assert operations, "No operations could be synthesized from the OpenAPI spec"
+    assert len(rows) == len(operations), "Latency matrix is missing operations"
+
+    benchmarked = [row for row in rows if row[2] > 0]
+    assert benchmarked, "No operation completed a single request"
+
+
+@then("no benchmarked operation returned a server error")
+def no_server_errors(context: dict):
+    """Verify synthesized requests never produced a 5xx response."""
+    failing = {row[0]: row[8] for row in context["latency_matrix"] if row[8]}
+    assert not failing, f"Operations returned 5xx responses: {failing}"
+
+
+@then("the per-second merges account for every pooled request")
+def merges_account_for_requests(context: dict):
+    """Verify the interval deltas add up to the final merged counts."""
+    pooled = context["pool_result"]
+    ticked = sum(tick.requests for tick in pooled.timeline)
+    assert ticked == pooled.total_requests, \
+        f"Timeline counts {ticked} requests, merged histograms {pooled.total_requests}"
+
+
+@then("the report compares the single-process and process-pool load engines")
+def load_engines_compared(context: dict):
+    """Verify the pool reported at least one full interval."""
+    timeline = context["pool_result"].timeline
+    assert len(timeline) >= 2, "The process pool never merged its counters during the run"
@@ -0,0 +1,93 @@
+"""Step definitions for Page Weight feature."""
+
+from pytest_bdd import scenarios, when, then, parsers
+
+from conftest import SERVICE_URLS, PAGE_BUDGETS, PAGE_CRAWL_CONCURRENCY
+from helpers.page_weight import PageCrawler, PageWeight
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/12_page_weight.feature")
+
+# Heaviest assets listed per page
+HEAVIEST_ASSETS = 10
+
+SCENARIO = "The {page} page stays within its weight budget"
+
+
+def _kb(size: int | None) -> float | None:
+    return size / 1024 if size is not None else None
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when(parsers.parse("I crawl the {page} page and its assets"))
+def crawl_page(page: str, context: dict, perf_report: PerformanceReport):
+    """Fetch the page and every same-origin asset it references, transitively."""
+    weight = PageCrawler(concurrency=PAGE_CRAWL_CONCURRENCY).crawl(f"{SERVICE_URLS[page]}/")
+    budget_kb, budget_requests = PAGE_BUDGETS[page]
+    context["page"] = page
+    context["page_weight"] = weight
+
+    perf_report.add_table(
+        f"Page weight: {page} (budget {budget_kb:.0f} KB, {budget_requests} requests)",
+        ["kind", "requests", "transfer (KB)", "decoded (KB)", "uncompressed", "uncacheable"],
+        [
+            [
+                kind, len(assets),
+                _kb(sum(a.transfer_bytes for a in assets)),
+                _kb(sum(a.decoded_bytes or a.transfer_bytes for a in assets)),
+                sum(1 for a in assets if a in weight.uncompressed()),
+                sum(1 for a in assets if a in weight.uncacheable()),
+            ]
+            for kind, assets in sorted(weight.by_kind().items())
+        ] + [[
+            "total", weight.requests, _kb(weight.transfer_bytes), _kb(weight.decoded_bytes),
+            len(weight.uncompressed()), len(weight.uncacheable()),
+        ]],
+        scenario=SCENARIO.format(page=page),
+    )
+    perf_report.add_value(SCENARIO.format(page=page), "transfer size", _kb(weight.transfer_bytes), "KB")
+    perf_report.add_value(SCENARIO.format(page=page), "requests", weight.requests, "requests")
+    perf_report.add_table(
+        f"Heaviest assets: {page}",
+        ["asset", "kind", "status", "encoding", "transfer (KB)", "decoded (KB)", "cache-control"],
+        [
+            [
+                asset.path, asset.kind, asset.status or asset.error, asset.encoding or "-",
+                _kb(asset.transfer_bytes), _kb(asset.decoded_bytes), asset.cache_control or "-",
+            ]
+            for asset in sorted(weight.assets, key=lambda a: -a.transfer_bytes)[:HEAVIEST_ASSETS]
+        ],
+        scenario=SCENARIO.format(page=page),
+    )
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("every referenced asset loads")
+def every_asset_loads(context: dict):
+    """Verify no referenced script, stylesheet or preload is broken."""
+    failed = context["page_weight"].failed()
+    assert not failed, "Broken assets: " + ", ".join(
+        f"{asset.path} ({asset.status or asset.error})" for asset in failed
+    )
+
+
+@then("the page stays within its transfer-size and request-count budget")
+def within_budget(context: dict):
+    """Verify the page's total transfer size and request count against its budget."""
+    weight: PageWeight = context["page_weight"]
+    budget_kb, budget_requests = PAGE_BUDGETS[context["page"]]
+    transfer_kb = weight.transfer_bytes / 1024
+
+    over = []
+    if transfer_kb > budget_kb:
+        over.append(f"transfer {transfer_kb:.0f} KB > {budget_kb:.0f} KB")
+    if weight.requests > budget_requests:
+        over.append(f"{weight.requests} requests > {budget_requests}")
+    assert not over, f"{context['page']} page is over budget: {', '.join(over)}"
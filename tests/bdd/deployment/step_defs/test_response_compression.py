@@ -0,0 +1,113 @@
+"""Step definitions for Response Compression feature."""
+
+import pytest
+import requests
+from pytest_bdd import scenarios, given, when, then
+
+from conftest import (
+    SERVICE_URLS,
+    COMPRESSION_SEED_ROWS,
+    COMPRESSION_REPEAT,
+    COMPRESSION_PAGE_SIZES,
+)
+from helpers.compression import CompressionBenchmark, EncodingResult, api_requests, recommend
+from helpers.container_stats import ContainerStats
+from helpers.load import seed_feedback
+from helpers.report import PerformanceReport
+
+# Load scenarios from feature file
+scenarios("../features/13_response_compression.feature")
+
+# Project the benchmark seeds and reads
+PROJECT_ID = "bdd-compression"
+
+# Decoded sizes of one request may differ this much between variants
+SIZE_TOLERANCE = 0.02
+
+SCENARIO = "JSON API responses are benchmarked with and without compression"
+
+
+# =============================================================================
+# GIVEN STEPS
+# =============================================================================
+
+@given("the feedback-server is seeded for the compression benchmark")
+def seeded_for_compression(http_client: requests.Session):
+    """Import enough feedback to fill the largest page."""
+    try:
+        seed_feedback(http_client, SERVICE_URLS["feedback-server"], COMPRESSION_SEED_ROWS, PROJECT_ID)
+    except requests.exceptions.RequestException as e:
+        pytest.fail(f"Seeding the compression benchmark failed: {e}")
+
+
+# =============================================================================
+# WHEN STEPS
+# =============================================================================
+
+@when("I request list, search and sync responses under every Accept-Encoding variant")
+def run_compression_benchmark(
+    context: dict,
+    perf_report: PerformanceReport,
+    server_stats: ContainerStats | None
+):
+    """Repeat every request per variant, with server CPU when the container is reachable."""
+    benchmark = CompressionBenchmark(SERVICE_URLS["feedback-server"], stats=server_stats)
+    results = benchmark.run(api_requests(PROJECT_ID, COMPRESSION_PAGE_SIZES), COMPRESSION_REPEAT)
+    context["compression_results"] = results
+
+    perf_report.add_table(
+        f"Response compression ({COMPRESSION_REPEAT} requests per variant)",
+        ["endpoint", "page size", "Accept-Encoding", "negotiated", "wire (KB)", "decoded (KB)",
+         "ratio", "p50 (ms)", "p90 (ms)", "server CPU (ms/req)", "failures"],
+        [
+            [
+                r.request.endpoint, r.request.page_size or "-", r.variant, r.negotiated,
+                r.wire_bytes / 1024, r.decoded_bytes / 1024 if r.decoded_bytes else None,
+                f"{r.ratio:.2f}" if r.decoded_bytes else "-",
+                r.latency["p50"], r.latency["p90"], r.cpu_ms, r.failures,
+            ]
+            for r in results
+        ],
+        scenario=SCENARIO,
+    )
+    for r in results:
+        if r.variant == "browser":
+            request = f"{r.request.endpoint}" + (f" {r.request.page_size}" if r.request.page_size else "")
+            perf_report.add_value(SCENARIO, f"{request} wire size", r.wire_bytes / 1024, "KB")
+            perf_report.add_value(SCENARIO, f"{request} p50", r.latency["p50"], "ms")
+
+
+# =============================================================================
+# THEN STEPS
+# =============================================================================
+
+@then("every variant decodes to the same payload size")
+def same_payload_size(context: dict):
+    """Verify compression never changes the payload itself."""
+    results: list[EncodingResult] = context["compression_results"]
+    failed = [f"{r.request.endpoint}/{r.variant}" for r in results if r.failures]
+    assert not failed, f"Requests failed: {failed}"
+
+    by_request: dict[tuple, list[EncodingResult]] = {}
+    for r in results:
+        if r.decoded_bytes:
+            by_request.setdefault((r.request.endpoint, r.request.page_size), []).append(r)
+    for (endpoint, page_size), variants in by_request.items():
+        sizes = [r.decoded_bytes for r in variants]
+        assert max(sizes) - min(sizes) <= max(sizes) * SIZE_TOLERANCE, \
+            f"{endpoint} (page size {page_size}) decodes to different sizes per variant: " \
+            f"{ {r.variant: round(r.decoded_bytes) for r in variants} }"
+
+
+@then("the report recommends an encoding per endpoint and page size")
+def compression_recommendation(context: dict, perf_report: PerformanceReport):
+    """Add the recommendation table: saving, CPU and latency cost per endpoint."""
+    rows = recommend(context["compression_results"])
+    assert rows, "No endpoint returned a body to compare"
+    perf_report.add_table(
+        "Compression recommendation",
+        ["endpoint", "page size", "body (KB)", "best", "saving",
+         "extra CPU (ms/req)", "extra p50 (ms)", "recommendation"],
+        rows,
+        scenario=SCENARIO,
+    )
@@ -8,7 +8,9 @@ import pytest
 import yaml
 from pytest_bdd import scenarios, given, when, then, parsers
 
-from conftest import REPO_ROOT
+from conftest import REPO_ROOT, restore_volume_snapshot
+from helpers.docker_events import all_stopped
+from helpers.volume_snapshot import VolumeSnapshot
 
 # Environment variable to control whether to skip service-dependent tests
 REQUIRE_SERVICES = os.environ.get("BDD_REQUIRE_SERVICES", "false").lower() == "true"
@@ -78,7 +80,12 @@ def run_task_down(repo_root: Path, context: dict):
 
 
 @when("I run docker compose down with volumes flag")
-def run_compose_down_volumes(repo_root: Path, context: dict):
+def run_compose_down_volumes(
+    repo_root: Path,
+    context: dict,
+    request: pytest.FixtureRequest,
+    volume_snapshot: VolumeSnapshot | None
+):
     """Run docker compose down with -v flag."""
     # First, list volumes before
     vol_before = subprocess.run(
@@ -96,6 +103,8 @@ def run_compose_down_volumes(repo_root: Path, context: dict):
         timeout=120
     )
     context["down_v_result"] = result
+    # Give later scenarios the baseline volumes back instead of a re-initialization
+    request.addfinalizer(lambda: restore_volume_snapshot(volume_snapshot))
 
 
 # =============================================================================
@@ -198,8 +207,13 @@ def volume_configs_appropriate(context: dict):
 
 
 @then("containers are stopped")
-def containers_stopped(repo_root: Path):
+def containers_stopped(repo_root: Path, container_watcher):
     """Verify containers are stopped."""
+    if container_watcher is not None:
+        assert container_watcher.wait_for(all_stopped(), timeout=30), \
+            f"Containers still running: {container_watcher.snapshot()}"
+        return
+
     result = subprocess.run(
         ["docker", "compose", "ps", "-q"],
         cwd=repo_root,
@@ -0,0 +1,131 @@
+"""Unit tests for the baseline regression check (no services required)."""
+
+import math
+import random
+
+import pytest
+
+from helpers.baseline import ALPHA, compare_metric, mann_whitney, min_p_value
+from helpers.histogram import LogLinearHistogram
+from helpers.report import Metric
+
+
+def _scalars(values: list[float], higher_is_better: bool = False) -> list[Metric]:
+    return [Metric("S", "m", "req/s", higher_is_better, value=v) for v in values]
+
+
+def _latency(samples: list[float]) -> Metric:
+    histogram = LogLinearHistogram()
+    for sample in samples:
+        histogram.record(sample)
+    return Metric("S", "latency", "ms", histogram=histogram)
+
+
+def _brute_force_a12(baseline: list[float], candidate: list[float]) -> float:
+    wins = sum((c > b) + 0.5 * (c == b) for b in baseline for c in candidate)
+    return wins / (len(baseline) * len(candidate))
+
+
+# =============================================================================
+# mann_whitney
+# =============================================================================
+
+def test_identical_samples_show_no_effect():
+    a12, p = mann_whitney({1: 5, 2: 5}, {1: 5, 2: 5})
+    assert a12 == 0.5
+    assert p == 1.0
+
+
+def test_empty_side_is_not_significant():
+    assert mann_whitney({}, {1: 3}) == (0.5, 1.0)
+
+
+def test_separated_samples_match_the_normal_approximation():
+    # U = 9, mean 4.5, variance 3 * 3 * 7 / 12; continuity-corrected z
+    a12, p = mann_whitney({1: 1, 2: 1, 3: 1}, {4: 1, 5: 1, 6: 1})
+    z = (4.5 - 0.5) / math.sqrt(3 * 3 * 7 / 12)
+    assert a12 == 1.0
+    assert p == pytest.approx(math.erfc(z / math.sqrt(2)))
+
+
+def test_a12_matches_pairwise_count_with_ties():
+    rng = random.Random(7)
+    baseline = [rng.randint(0, 10) for _ in range(40)]
+    candidate = [rng.randint(2, 12) for _ in range(30)]
+    a12, _ = mann_whitney(
+        {v: baseline.count(v) for v in baseline},
+        {v: candidate.count(v) for v in candidate},
+    )
+    assert a12 == pytest.approx(_brute_force_a12(baseline, candidate))
+
+
+def test_min_p_value_bounds_small_run_counts():
+    assert min_p_value(3, 3) > ALPHA
+    assert min_p_value(5, 5) > ALPHA
+    assert min_p_value(6, 6) < ALPHA
+
+
+# =============================================================================
+# compare_metric
+# =============================================================================
+
+def test_scalar_drop_with_too_few_runs_is_untested():
+    result = compare_metric(
+        _scalars([500, 505, 495], higher_is_better=True),
+        _scalars([400, 404, 396], higher_is_better=True),
+    )
+    assert result.verdict == "untested"
+    assert result.p_value is None
+
+
+def test_small_scalar_change_with_too_few_runs_is_untested():
+    result = compare_metric(_scalars([500, 505, 495]), _scalars([501, 504, 497]))
+    assert result.verdict == "untested"
+
+
+def test_scalar_drop_with_enough_runs_is_a_regression():
+    result = compare_metric(
+        _scalars([500, 505, 495, 502, 498, 501], higher_is_better=True),
+        _scalars([400, 404, 396, 402, 398, 401], higher_is_better=True),
+    )
+    assert result.verdict == "regression"
+    assert result.change == pytest.approx(-0.2, abs=0.01)
+    assert result.p_value < ALPHA
+
+
+def test_scalar_noise_with_enough_runs_is_no_change():
+    result = compare_metric(
+        _scalars([500, 505, 495, 502, 498, 501]),
+        _scalars([503, 497, 499, 504, 496, 500]),
+    )
+    assert result.verdict == "no change"
+
+
+def test_higher_is_better_gain_is_an_improvement():
+    result = compare_metric(
+        _scalars([400, 404, 396, 402, 398, 401], higher_is_better=True),
+        _scalars([500, 505, 495, 502, 498, 501], higher_is_better=True),
+    )
+    assert result.verdict == "improvement"
+
+
+def test_constant_scalar_change_is_flagged_without_a_test():
+    result = compare_metric(_scalars([100, 100]), _scalars([120]))
+    assert result.verdict == "regression"
+    assert result.p_value is None
+
+
+def test_latency_shift_is_a_regression():
+    rng = random.Random(1)
+    baseline = [_latency([rng.gauss(0.020, 0.002) for _ in range(2000)])]
+    candidate = [_latency([rng.gauss(0.024, 0.002) for _ in range(2000)])]
+    result = compare_metric(baseline, candidate)
+    assert result.verdict == "regression"
+    assert result.a12 > 0.56
+
+
+def test_latency_from_the_same_distribution_is_no_change():
+    rng = random.Random(2)
+    baseline = [_latency([rng.gauss(0.020, 0.002) for _ in range(2000)])]
+    candidate = [_latency([rng.gauss(0.020, 0.002) for _ in range(2000)])]
+    assert compare_metric(baseline, candidate).verdict == "no change"
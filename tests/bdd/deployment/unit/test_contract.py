@@ -0,0 +1,46 @@
+"""Unit tests for the compiled OpenAPI contract (no services required)."""
+
+import pytest
+
+from helpers.contract import CompiledContract, check_pagination
+
+
+def _contract(*paths: str) -> CompiledContract:
+    operation = {"get": {"responses": {"200": {}}}}
+    return CompiledContract({"paths": {path: operation for path in paths}})
+
+
+# =============================================================================
+# match
+# =============================================================================
+
+@pytest.mark.parametrize("path, expected", [
+    ("/feedback/stats", "GET /feedback/stats"),
+    ("/feedback/42", "GET /feedback/{id}"),
+    ("/a/b/c", "GET /a/b/{y}"),
+    ("/a/z/c", "GET /a/{x}/{y}"),
+])
+def test_literal_segments_win_over_templates(path, expected):
+    contract = _contract("/feedback/{id}", "/feedback/stats", "/a/{x}/{y}", "/a/b/{y}")
+    assert contract.match("GET", path)[0] == expected
+
+
+def test_unknown_path_and_method_do_not_match():
+    contract = _contract("/feedback/{id}")
+    assert contract.match("GET", "/feedback/1/2") is None
+    assert contract.match("POST", "/feedback/1") is None
+
+
+# =============================================================================
+# check_pagination
+# =============================================================================
+
+def test_consistent_page_passes():
+    body = {"items": [1, 2], "pagination": {"total": 5, "page": 1, "limit": 2,
+                                            "totalPages": 3, "hasMore": True}}
+    assert check_pagination(body) is None
+
+
+def test_non_positive_page_size_is_a_violation():
+    body = {"items": [], "pagination": {"total": 5, "page": 1, "limit": 0}}
+    assert check_pagination(body) is not None
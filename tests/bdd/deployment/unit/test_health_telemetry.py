@@ -0,0 +1,24 @@
+"""Unit tests for the health telemetry series (no services required)."""
+
+import math
+
+from helpers.health_telemetry import ComponentSeries
+
+
+def _series(points: list[tuple[float, float, bool]]) -> ComponentSeries:
+    series = ComponentSeries()
+    for timestamp, response_time, degraded in points:
+        series.append(timestamp, response_time, degraded)
+    return series
+
+
+def test_missing_samples_stay_out_of_percentiles():
+    series = _series([(0.0, 4.0, False), (1.0, math.nan, True), (2.0, math.nan, True), (3.0, 6.0, False)])
+    assert series.missing() == 2
+    assert series.measured() == [4.0, 6.0]
+    assert series.percentile(99) == 6.0
+
+
+def test_missing_samples_still_mark_a_degraded_period():
+    series = _series([(0.0, 4.0, False), (1.0, math.nan, True), (2.0, 5.0, False)])
+    assert series.degraded_periods() == [(1.0, 2.0)]
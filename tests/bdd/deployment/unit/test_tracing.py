@@ -0,0 +1,39 @@
+"""Unit tests for joining slow requests to access log lines (no services required)."""
+
+from helpers.access_log import ACCESS_LOG_SERVICE
+from helpers.log_follower import LogFollower
+from helpers.tracing import SlowestRequests, SlowRequest
+
+STARTED = 1_700_000_000.0
+
+
+def _join(*access_lines: tuple[float, str]) -> SlowRequest:
+    follower = LogFollower()
+    for offset, text in access_lines:
+        follower.feed(ACCESS_LOG_SERVICE, text, STARTED + offset)
+    slowest = SlowestRequests(1)
+    slowest.offer(SlowRequest(latency=0.5, method="GET", path="/api/v1/feedback",
+                              status=200, request_id="", started=STARTED))
+    slowest.join(follower)
+    return slowest.slowest()[0]
+
+
+def test_single_line_in_window_is_attributed():
+    request = _join((0.5, "--> GET /api/v1/feedback 200 480ms"),
+                    (0.4, "--> POST /api/v1/feedback 201 12ms"))
+    assert request.joined_by == "window"
+    assert request.server_duration == 0.48
+
+
+def test_several_lines_in_window_are_ambiguous():
+    request = _join((0.45, "--> GET /api/v1/feedback 200 3ms"),
+                    (0.5, "--> GET /api/v1/feedback 200 480ms"))
+    assert request.joined_by == "ambiguous"
+    assert request.server_duration is None
+    assert request.log_lines == []
+
+
+def test_line_outside_window_is_not_joined():
+    request = _join((5.0, "--> GET /api/v1/feedback 200 480ms"))
+    assert request.joined_by == ""
+    assert request.server_duration is None